@@ -5,3 +5,6 @@ class AnalysisConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.analysis'
     verbose_name = 'Lotto Analysis'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,81 @@
+"""
+회차 데이터 버전 기반 캐시
+- 캐시 키에 현재 데이터 버전(최신 회차 번호)을 포함해 새 회차가 들어오면 자동으로 무효화
+- DrawResult 저장/삭제 시그널이 커밋 후 버전을 갱신 (signals.py)
+- 버전 키는 정리(cull)되지 않는 'state' 캐시에 보관 - 일반 캐시가 가득 차도 버전이 되돌아가지 않음
+"""
+import functools
+import hashlib
+import inspect
+import time
+from datetime import date
+
+from django.core.cache import cache, caches
+
+DRAW_VERSION_KEY = 'draws:version'
+DEFAULT_TIMEOUT = 60 * 60 * 24 * 7
+
+_MISSING = object()
+
+
+def get_draw_version():
+    """현재 회차 데이터 버전 (캐시에 없으면 최신 회차 번호로 초기화)"""
+    state = caches['state']
+    version = state.get(DRAW_VERSION_KEY)
+    if version is None:
+        state.add(DRAW_VERSION_KEY, str(_latest_draw_no()), timeout=None)
+        version = state.get(DRAW_VERSION_KEY) or str(_latest_draw_no())
+    return version
+
+
+def bump_draw_version():
+    """회차 데이터 변경 시 버전 갱신 - 최신 회차 번호 + 변경 시각"""
+    version = f'{_latest_draw_no()}.{time.time_ns()}'
+    caches['state'].set(DRAW_VERSION_KEY, version, timeout=None)
+    return version
+
+
+def draw_cache_key(prefix, *parts, daily=False):
+    """버전(+날짜)이 포함된 캐시 키"""
+    key_parts = [prefix, get_draw_version()]
+    if daily:
+        key_parts.append(date.today().isoformat())
+    if parts:
+        digest = hashlib.md5(repr(parts).encode()).hexdigest()[:16]
+        key_parts.append(digest)
+    return ':'.join(key_parts)
+
+
+def draw_cached(prefix=None, timeout=DEFAULT_TIMEOUT, daily=False):
+    """
+    회차 데이터 버전 기반 캐시 데코레이터
+    daily=True면 날짜 시드를 쓰는 함수용으로 키에 오늘 날짜 포함
+    snapshot 인자를 직접 넘긴 호출은 캐시하지 않음
+    """
+    def decorator(func):
+        key_prefix = prefix or f'{func.__module__}.{func.__qualname__}'
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            if arguments.pop('snapshot', None) is not None:
+                return func(*args, **kwargs)
+
+            key = draw_cache_key(key_prefix, sorted(arguments.items()), daily=daily)
+            value = cache.get(key, _MISSING)
+            if value is _MISSING:
+                value = func(*args, **kwargs)
+                cache.set(key, value, timeout=timeout)
+            return value
+
+        wrapper.uncached = func
+        return wrapper
+    return decorator
+
+
+def _latest_draw_no():
+    from apps.analysis.models import DrawResult
+    return DrawResult.objects.order_by('-draw_no').values_list('draw_no', flat=True).first() or 0
@@ -0,0 +1,45 @@
+"""
+추천 전략 백테스트 커맨드 - 전략별 적중 분포를 StrategyBacktest에 저장
+Usage: python manage.py backtest_strategies [--seeds 20] [--workers 4] [--start 1]
+"""
+import os
+
+from django.core.management.base import BaseCommand
+
+from apps.analysis.cache import bump_draw_version
+from apps.analysis.models import StrategyBacktest
+from apps.landing.services.backtest import load_history, run_backtest
+
+
+class Command(BaseCommand):
+    help = '역대 회차로 AI 추천 전략을 백테스트해 전략별 적중률을 저장합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seeds', type=int, default=20, help='전략별 반복 시드 수')
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='프로세스 수')
+        parser.add_argument('--start', type=int, default=1, help='백테스트 시작 회차')
+
+    def handle(self, *args, **options):
+        history = load_history()
+        start_index = next((i for i, (draw_no, _) in enumerate(history) if draw_no >= options['start']), len(history))
+
+        report = run_backtest(history, range(options['seeds']), options['workers'], start_index)
+        if not report:
+            self.stdout.write(self.style.WARNING('백테스트할 회차가 부족합니다.'))
+            return
+
+        for strategy, result in report.items():
+            StrategyBacktest.objects.update_or_create(strategy=strategy, defaults=result)
+        # 캐시된 추천 결과의 신뢰도 갱신
+        bump_draw_version()
+
+        for strategy, result in sorted(report.items(), key=lambda item: -item[1]['mean_hits']):
+            self.stdout.write(
+                f"{strategy:<16} 평균 {result['mean_hits']:.3f}개  3개 이상 {result['rate_3plus'] * 100:5.2f}%  "
+                f"시드 편차 {result['seed_stats']['stdev']:.3f}"
+            )
+        first = next(iter(report.values()))
+        self.stdout.write(self.style.SUCCESS(
+            f"완료! {first['first_draw_no']}~{first['last_draw_no']}회 × 시드 {options['seeds']}개, "
+            f'전략 {len(report)}개 백테스트'
+        ))
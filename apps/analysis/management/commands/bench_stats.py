@@ -0,0 +1,62 @@
+"""
+통계 백엔드 벤치마크 커맨드 (순수 Python vs numpy)
+Usage: python manage.py bench_stats [--sizes 1000 10000 100000] [--repeat 3]
+합성 회차 데이터로 번호 통계 + 45개 번호 상세 통계 계산 시간을 비교
+"""
+import random
+import time
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand
+
+from apps.landing.services.lotto_matrix import np
+from apps.landing.services.lotto_stats import get_number_detail_stats, get_number_stats
+from apps.landing.services.stats_snapshot import DrawRow, StatsSnapshot
+
+
+class Command(BaseCommand):
+    help = '합성 회차 데이터로 순수 Python / numpy 통계 백엔드 성능을 비교합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes', type=int, nargs='+', default=[1000, 10000, 100000],
+            help='합성 회차 수 목록',
+        )
+        parser.add_argument('--repeat', type=int, default=3, help='반복 측정 횟수 (최솟값 사용)')
+        parser.add_argument('--seed', type=int, default=0, help='합성 데이터 시드')
+
+    def handle(self, *args, **options):
+        if np is None:
+            self.stderr.write(self.style.ERROR('numpy가 설치되지 않았습니다: pip install numpy'))
+            return
+
+        self.stdout.write(f'{"회차 수":>10} {"python(ms)":>12} {"numpy(ms)":>12} {"배속":>8}')
+        for size in options['sizes']:
+            rows = self._synthetic_rows(size, options['seed'])
+            t_py = self._measure('python', rows, options['repeat'])
+            t_np = self._measure('numpy', rows, options['repeat'])
+            self.stdout.write(
+                f'{size:>10,} {t_py * 1000:>12.1f} {t_np * 1000:>12.1f} {t_py / t_np:>7.1f}x'
+            )
+
+    def _measure(self, backend, rows, repeat):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            snapshot = StatsSnapshot(rows, use_numpy=backend == 'numpy')
+            get_number_stats(snapshot=snapshot)
+            for number in range(1, 46):
+                get_number_detail_stats(number, snapshot)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best
+
+    def _synthetic_rows(self, size, seed):
+        """최신순 합성 회차 목록"""
+        rng = random.Random(seed)
+        first_draw = date(2002, 12, 7)
+        return [
+            DrawRow(draw_no, first_draw + timedelta(weeks=draw_no - 1),
+                    tuple(sorted(rng.sample(range(1, 46), 6))), rng.randint(1, 45), 0, 0, 0)
+            for draw_no in range(size, 0, -1)
+        ]
@@ -1,17 +1,16 @@
 """
 동행복권 공식 JSON API로 최신 로또 당첨 데이터를 가져오는 커맨드
-Usage: python manage.py fetch_latest [--from N] [--to N]
-API: https://www.dhlottery.co.kr/common.do?method=getLottoNumber&drwNo=N
+Usage: python manage.py fetch_latest [--from N] [--to N] [--concurrency 8]
+API: https://www.dhlottery.co.kr/common.do?method=getLottoNumber&drwNo=N (LOTTO_API_URL 설정으로 변경 가능)
 """
-import json
-from datetime import datetime
-
-import requests
 from django.core.management.base import BaseCommand
 
 from apps.analysis.models import DrawResult
-
-API_URL = 'https://www.dhlottery.co.kr/common.do'
+from apps.analysis.services.draw_calendar import estimate_draw_no
+from apps.analysis.services.ingest import DrawWriter
+from apps.analysis.services.lotto_api import (
+    DrawProbe, LottoAPIError, build_session, default_concurrency, find_latest_draw_no, iter_draws,
+)
 
 
 class Command(BaseCommand):
@@ -24,128 +23,64 @@ class Command(BaseCommand):
         )
         parser.add_argument(
             '--to', type=int, dest='to_no',
-            help='종료 회차 (미지정 시 최신까지 자동)',
+            help='종료 회차 (미지정 시 최신 회차 자동 탐색)',
+        )
+        parser.add_argument(
+            '--concurrency', type=int, default=default_concurrency(),
+            help='동시 요청 수',
         )
 
     def handle(self, *args, **options):
         from_no = options.get('from_no')
         to_no = options.get('to_no')
+        concurrency = max(1, options['concurrency'])
+        session = build_session(concurrency)
+
+        probe = DrawProbe(session)
+        latest_db = DrawResult.objects.order_by('-draw_no').values_list('draw_no', flat=True).first() or 0
 
         if from_no is None:
-            latest = DrawResult.objects.order_by('-draw_no').first()
-            from_no = (latest.draw_no + 1) if latest else 1
+            from_no = latest_db + 1
 
         if to_no is None:
-            to_no = self._find_latest_draw_no()
+            try:
+                to_no = find_latest_draw_no(probe, known=latest_db, estimate=estimate_draw_no())
+            except LottoAPIError as e:
+                self.stderr.write(f'API 오류 {e}')
+                to_no = None
             if to_no is None:
                 self.stderr.write(self.style.ERROR('최신 회차를 확인할 수 없습니다.'))
                 return
+            self.stdout.write(f'최신 회차: 제{to_no}회 (요청 {probe.requests}건)')
 
         if from_no > to_no:
             self.stdout.write(self.style.SUCCESS('이미 최신 데이터입니다.'))
             return
 
-        self.stdout.write(f'{from_no}회 ~ {to_no}회 데이터 가져오기...')
+        self.stdout.write(f'{from_no}회 ~ {to_no}회 데이터 가져오기... (동시 {concurrency}건)')
 
-        created = 0
         failed = 0
 
-        for draw_no in range(from_no, to_no + 1):
-            data = self._fetch_draw(draw_no)
-            if data:
-                self._save_draw(data)
-                created += 1
-                self.stdout.write(f'  제{draw_no}회 저장 완료')
-            else:
-                failed += 1
-                self.stdout.write(self.style.WARNING(f'  제{draw_no}회 가져오기 실패'))
-
-        self.stdout.write(self.style.SUCCESS(f'완료! 저장: {created}건, 실패: {failed}건'))
-
-    def _get_session(self):
-        session = requests.Session()
-        session.headers.update({
-            'User-Agent': (
-                'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
-                'AppleWebKit/537.36 (KHTML, like Gecko) '
-                'Chrome/120.0.0.0 Safari/537.36'
-            ),
-            'Accept': 'application/json, text/javascript, */*; q=0.01',
-            'Accept-Language': 'ko-KR,ko;q=0.9',
-            'Referer': 'https://www.dhlottery.co.kr/gameResult.do?method=byWin',
-            'X-Requested-With': 'XMLHttpRequest',
-        })
-        return session
-
-    def _find_latest_draw_no(self):
-        """최신 회차 번호 탐색 (이진 탐색으로 빠르게)"""
-        session = self._get_session()
-        # DB 최신 회차부터 최대 10회 앞까지 시도
-        latest_db = DrawResult.objects.order_by('-draw_no').first()
-        start = (latest_db.draw_no + 1) if latest_db else 1
-
-        for draw_no in range(start, start + 10):
-            data = self._fetch_draw_raw(session, draw_no)
-            if data is None:
-                return draw_no - 1 if draw_no > start else None
-        return start + 9
-
-    def _fetch_draw(self, draw_no):
-        session = self._get_session()
-        return self._fetch_draw_raw(session, draw_no)
-
-    def _fetch_draw_raw(self, session, draw_no):
-        """공식 JSON API 호출"""
-        try:
-            resp = session.get(
-                API_URL,
-                params={'method': 'getLottoNumber', 'drwNo': draw_no},
-                timeout=15,
-            )
-            # JSON 응답 파싱
-            try:
-                data = resp.json()
-            except Exception:
-                # JSON이 아닌 경우 (HTML 반환 등) → 실패
-                return None
-
-            if data.get('returnValue') != 'success':
-                return None
-
-            draw_date = datetime.strptime(data['drwNoDate'], '%Y-%m-%d').date()
-
-            return {
-                'draw_no': data['drwNo'],
-                'draw_date': draw_date,
-                'numbers': [
-                    data['drwtNo1'], data['drwtNo2'], data['drwtNo3'],
-                    data['drwtNo4'], data['drwtNo5'], data['drwtNo6'],
-                ],
-                'bonus': data['bnusNo'],
-                'first_prize': data.get('firstWinamnt', 0),
-                'first_winners': data.get('firstPrzwnerCo', 0),
-                'total_sales': data.get('totSellamnt', 0),
-            }
-
-        except Exception as e:
-            self.stderr.write(f'API 오류 (제{draw_no}회): {e}')
-            return None
-
-    def _save_draw(self, data):
-        nums = sorted(data['numbers'])
-        DrawResult.objects.update_or_create(
-            draw_no=data['draw_no'],
-            defaults={
-                'draw_date': data['draw_date'],
-                'number_1': nums[0],
-                'number_2': nums[1],
-                'number_3': nums[2],
-                'number_4': nums[3],
-                'number_5': nums[4],
-                'number_6': nums[5],
-                'bonus_number': data['bonus'],
-                'first_prize_amount': data['first_prize'],
-                'first_prize_winners': data['first_winners'],
-                'total_sales': data['total_sales'],
-            },
-        )
+        draw_nos = range(from_no, to_no + 1)
+        # 최신 회차 탐색 중 이미 받은 회차는 다시 요청하지 않음
+        probed = [data for draw_no, data in probe.results.items() if data and draw_no in draw_nos]
+        remaining = [draw_no for draw_no in draw_nos if draw_no not in probe.results]
+
+        # 조회는 스레드 풀, 저장은 현재 스레드에서 도착 순서대로 받아 batch_size마다 upsert
+        # (받은 회차를 모두 모아두지 않아 메모리 사용량이 누락 회차 수와 무관)
+        with DrawWriter() as writer:
+            for data in probed:
+                writer.add(data)
+            for draw_no, data, error in iter_draws(remaining, concurrency, session):
+                if data:
+                    writer.add(data)
+                    self.stdout.write(f'  제{draw_no}회 가져오기 완료')
+                else:
+                    failed += 1
+                    if error:
+                        self.stderr.write(f'API 오류 {error}')
+                    self.stdout.write(self.style.WARNING(f'  제{draw_no}회 가져오기 실패'))
+
+        self.stdout.write(self.style.SUCCESS(
+            f'완료! 생성: {writer.created}건, 업데이트: {writer.updated}건, 실패: {failed}건'
+        ))
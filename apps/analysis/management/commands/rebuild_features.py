@@ -0,0 +1,20 @@
+"""
+회차별 파생 지표(DrawFeatures) 전체 재계산 커맨드
+Usage: python manage.py rebuild_features [--batch-size 500]
+
+지표 정의를 바꿨거나 적재 경로 밖에서 회차를 수정했을 때 실행
+"""
+from django.core.management.base import BaseCommand
+
+from apps.analysis.services.draw_features import BATCH_SIZE, rebuild_features
+
+
+class Command(BaseCommand):
+    help = '전체 회차의 파생 지표(합계·홀짝·고저·구간·연번·소수·AC값)를 다시 계산합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE, help='한 번에 저장할 회차 수')
+
+    def handle(self, *args, **options):
+        draw_count = rebuild_features(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'완료! {draw_count}개 회차 파생 지표 재계산'))
@@ -0,0 +1,15 @@
+"""
+번호별 출현 통계 집계 테이블 전체 재계산 커맨드
+Usage: python manage.py rebuild_stats
+"""
+from django.core.management.base import BaseCommand
+
+from apps.analysis.services.number_stats import rebuild_number_stats
+
+
+class Command(BaseCommand):
+    help = '전체 회차 데이터로 번호별 출현 통계(NumberStat)를 다시 계산합니다.'
+
+    def handle(self, *args, **options):
+        draw_count = rebuild_number_stats()
+        self.stdout.write(self.style.SUCCESS(f'완료! {draw_count}개 회차 기준 번호 통계 재계산'))
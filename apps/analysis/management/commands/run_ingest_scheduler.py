@@ -0,0 +1,85 @@
+"""
+토요일 추첨 결과 자동 적재 스케줄러 (상주 프로세스)
+Usage: python manage.py run_ingest_scheduler [--once] [--backtest-seeds 20]
+
+매주 토요일 20:45 KST부터 새 회차가 API에 반영될 때까지 백오프하며 fetch_latest 실행
+적재 시 DrawWriter → 번호 통계 재계산 + draws_ingested(캐시·페이지 예열)
+"""
+import time
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.analysis.models import DrawResult
+from apps.analysis.services.draw_calendar import KST, expected_draw_no, last_result_at, next_result_at
+
+
+class Command(BaseCommand):
+    help = '매주 토요일 추첨 결과를 자동으로 가져와 통계·캐시를 미리 갱신합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='한 번만 확인하고 종료 (cron 용)')
+        parser.add_argument('--initial-delay', type=int, default=60, help='첫 재시도 대기 (초)')
+        parser.add_argument('--max-delay', type=int, default=15 * 60, help='최대 재시도 대기 (초)')
+        parser.add_argument('--window-hours', type=int, default=24, help='발표 후 재시도를 계속할 시간')
+        parser.add_argument('--backtest-seeds', type=int, default=0, help='새 회차 적재 후 전략 백테스트 시드 수 (0이면 생략)')
+
+    def handle(self, *args, **options):
+        while True:
+            now = timezone.now()
+            deadline = last_result_at(now) + timedelta(hours=options['window_hours'])
+            if self._latest_draw_no() < expected_draw_no(now):
+                # 발표 후 재시도 기간이 지났어도 시작 시 한 번은 따라잡기 시도
+                self._poll(expected_draw_no(now), max(deadline, now), options)
+
+            if options['once']:
+                return
+
+            wake_at = next_result_at(timezone.now())
+            self.stdout.write(f'다음 확인: {wake_at.astimezone(KST):%Y-%m-%d %H:%M} KST')
+            time.sleep(max(0, (wake_at - timezone.now()).total_seconds()))
+
+    def _poll(self, expected, deadline, options):
+        """expected 회차가 들어올 때까지 지수 백오프로 fetch_latest 반복"""
+        delay = options['initial_delay']
+        while True:
+            before = self._latest_draw_no()
+            self._fetch()
+            latest = self._latest_draw_no()
+            if latest > before:
+                self.stdout.write(self.style.SUCCESS(f'제{before + 1}회 ~ 제{latest}회 적재 완료'))
+                if options['backtest_seeds']:
+                    self._backtest(options['backtest_seeds'])
+            if latest >= expected:
+                return
+
+            if timezone.now() + timedelta(seconds=delay) > deadline:
+                self.stdout.write(self.style.WARNING(f'제{expected}회 결과를 아직 가져오지 못했습니다 (최신 제{latest}회)'))
+                return
+            self.stdout.write(f'제{expected}회 대기 중... {delay}초 후 재시도')
+            time.sleep(delay)
+            delay = min(delay * 2, options['max_delay'])
+
+    def _fetch(self):
+        out = StringIO()
+        try:
+            call_command('fetch_latest', stdout=out, stderr=out)
+        except Exception as e:
+            self.stderr.write(f'fetch_latest 실패: {e}')
+        summary = out.getvalue().strip().splitlines()
+        if summary:
+            self.stdout.write(f'  {summary[-1]}')
+
+    def _backtest(self, seeds):
+        # 백테스트 결과가 바뀌면 회차 버전이 갱신되므로 캐시를 다시 예열
+        from apps.landing.services.cache_warmup import warm_caches
+
+        call_command('backtest_strategies', seeds=seeds, stdout=StringIO())
+        warm_caches()
+        self.stdout.write('  전략 백테스트 갱신 + 캐시 예열 완료')
+
+    def _latest_draw_no(self):
+        return DrawResult.objects.order_by('-draw_no').values_list('draw_no', flat=True).first() or 0
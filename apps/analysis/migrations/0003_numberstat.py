@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analysis', '0002_drawresult_second_prize_amount_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NumberStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('number', models.PositiveSmallIntegerField(unique=True, verbose_name='번호')),
+                ('total_count', models.PositiveIntegerField(default=0, verbose_name='전체 출현')),
+                ('freq_10', models.PositiveSmallIntegerField(default=0, verbose_name='최근 10회')),
+                ('freq_30', models.PositiveSmallIntegerField(default=0, verbose_name='최근 30회')),
+                ('freq_100', models.PositiveSmallIntegerField(default=0, verbose_name='최근 100회')),
+                ('last_draw_no', models.PositiveIntegerField(blank=True, null=True, verbose_name='마지막 출현 회차')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': '번호 통계',
+                'verbose_name_plural': '번호 통계',
+                'ordering': ['number'],
+            },
+        ),
+    ]
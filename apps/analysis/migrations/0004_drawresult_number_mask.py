@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:20
+
+from django.db import migrations, models
+
+
+def backfill_masks(apps, schema_editor):
+    DrawResult = apps.get_model('analysis', 'DrawResult')
+    draws = list(DrawResult.objects.all())
+    for d in draws:
+        d.number_mask = 0
+        for n in (d.number_1, d.number_2, d.number_3, d.number_4, d.number_5, d.number_6):
+            d.number_mask |= 1 << n
+        d.bonus_mask = 1 << d.bonus_number
+    DrawResult.objects.bulk_update(draws, ['number_mask', 'bonus_mask'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analysis', '0003_numberstat'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='drawresult',
+            name='bonus_mask',
+            field=models.BigIntegerField(default=0, verbose_name='보너스 비트마스크'),
+        ),
+        migrations.AddField(
+            model_name='drawresult',
+            name='number_mask',
+            field=models.BigIntegerField(db_index=True, default=0, verbose_name='당첨번호 비트마스크'),
+        ),
+        migrations.RunPython(backfill_masks, migrations.RunPython.noop),
+    ]
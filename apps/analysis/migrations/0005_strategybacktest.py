@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analysis', '0004_drawresult_number_mask'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StrategyBacktest',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('strategy', models.CharField(max_length=50, unique=True, verbose_name='전략')),
+                ('seeds', models.PositiveIntegerField(default=0, verbose_name='시드 수')),
+                ('first_draw_no', models.PositiveIntegerField(default=0, verbose_name='시작 회차')),
+                ('last_draw_no', models.PositiveIntegerField(default=0, verbose_name='종료 회차')),
+                ('samples', models.PositiveIntegerField(default=0, verbose_name='표본 수')),
+                ('mean_hits', models.FloatField(default=0, verbose_name='평균 일치 개수')),
+                ('rate_3plus', models.FloatField(default=0, verbose_name='3개 이상 일치 비율')),
+                ('hit_distribution', models.JSONField(default=dict, verbose_name='일치 개수 분포')),
+                ('seed_stats', models.JSONField(default=dict, verbose_name='시드별 평균 분포')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': '전략 백테스트',
+                'verbose_name_plural': '전략 백테스트',
+                'ordering': ['-mean_hits'],
+            },
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:53
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+ZONES = ((1, 10), (11, 20), (21, 30), (31, 40), (41, 45))
+
+
+def backfill_features(apps, schema_editor):
+    DrawResult = apps.get_model('analysis', 'DrawResult')
+    DrawFeatures = apps.get_model('analysis', 'DrawFeatures')
+    rows = []
+    for d in DrawResult.objects.all():
+        nums = (d.number_1, d.number_2, d.number_3, d.number_4, d.number_5, d.number_6)
+        zones = {f'zone_{i}': sum(1 for n in nums if lo <= n <= hi) for i, (lo, hi) in enumerate(ZONES, start=1)}
+        rows.append(DrawFeatures(
+            draw_id=d.draw_no,
+            total=sum(nums),
+            odd_count=sum(1 for n in nums if n % 2),
+            low_count=sum(1 for n in nums if n <= 22),
+            **zones,
+        ))
+    DrawFeatures.objects.bulk_create(rows, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analysis', '0005_strategybacktest'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DrawFeatures',
+            fields=[
+                ('draw', models.OneToOneField(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='features', serialize=False, to='analysis.drawresult', to_field='draw_no', verbose_name='회차')),
+                ('total', models.PositiveSmallIntegerField(verbose_name='번호 합')),
+                ('odd_count', models.PositiveSmallIntegerField(verbose_name='홀수 개수')),
+                ('low_count', models.PositiveSmallIntegerField(verbose_name='저번호(1~22) 개수')),
+                ('zone_1', models.PositiveSmallIntegerField(verbose_name='1번대')),
+                ('zone_2', models.PositiveSmallIntegerField(verbose_name='10번대')),
+                ('zone_3', models.PositiveSmallIntegerField(verbose_name='20번대')),
+                ('zone_4', models.PositiveSmallIntegerField(verbose_name='30번대')),
+                ('zone_5', models.PositiveSmallIntegerField(verbose_name='40번대')),
+            ],
+            options={
+                'verbose_name': '회차 파생 지표',
+                'verbose_name_plural': '회차 파생 지표',
+                'ordering': ['-draw'],
+            },
+        ),
+        migrations.RunPython(backfill_features, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 5.2.18 on 2026-10-18 15:54
+
+from django.db import migrations, models
+
+PRIMES = {2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43}
+
+
+def backfill_features(apps, schema_editor):
+    DrawResult = apps.get_model('analysis', 'DrawResult')
+    DrawFeatures = apps.get_model('analysis', 'DrawFeatures')
+    numbers = {
+        d.draw_no: sorted((d.number_1, d.number_2, d.number_3, d.number_4, d.number_5, d.number_6))
+        for d in DrawResult.objects.all()
+    }
+    rows = list(DrawFeatures.objects.filter(draw_id__in=numbers))
+    for f in rows:
+        nums = numbers[f.draw_id]
+        f.consecutive_runs = sum(
+            1 for i in range(1, 6)
+            if nums[i] - nums[i - 1] == 1 and (i == 1 or nums[i - 1] - nums[i - 2] != 1)
+        )
+        f.prime_count = sum(1 for n in nums if n in PRIMES)
+        f.ac_value = len({b - a for i, a in enumerate(nums) for b in nums[i + 1:]}) - 5
+    DrawFeatures.objects.bulk_update(rows, ['consecutive_runs', 'prime_count', 'ac_value'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analysis', '0006_drawfeatures'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='drawfeatures',
+            name='ac_value',
+            field=models.PositiveSmallIntegerField(default=0, verbose_name='AC값'),
+        ),
+        migrations.AddField(
+            model_name='drawfeatures',
+            name='consecutive_runs',
+            field=models.PositiveSmallIntegerField(default=0, verbose_name='연번 묶음 수'),
+        ),
+        migrations.AddField(
+            model_name='drawfeatures',
+            name='prime_count',
+            field=models.PositiveSmallIntegerField(default=0, verbose_name='소수 개수'),
+        ),
+        migrations.AddIndex(
+            model_name='drawfeatures',
+            index=models.Index(fields=['total'], name='drawfeatures_total_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='drawfeatures',
+            index=models.Index(fields=['odd_count', 'low_count'], name='drawfeatures_odd_low_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='drawfeatures',
+            index=models.Index(fields=['ac_value'], name='drawfeatures_ac_idx'),
+        ),
+        migrations.RunPython(backfill_features, migrations.RunPython.noop),
+    ]
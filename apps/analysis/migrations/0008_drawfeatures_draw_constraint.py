@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-18 16:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def delete_orphans(apps, schema_editor):
+    """제약 없이 쌓였을 수 있는 회차 없는 지표 행 정리 (FK 제약 추가 전)"""
+    DrawResult = apps.get_model('analysis', 'DrawResult')
+    DrawFeatures = apps.get_model('analysis', 'DrawFeatures')
+    DrawFeatures.objects.exclude(draw_id__in=DrawResult.objects.values('draw_no')).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analysis', '0007_drawfeatures_runs_primes_ac'),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_orphans, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='drawfeatures',
+            name='draw',
+            field=models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='features', serialize=False, to='analysis.drawresult', to_field='draw_no', verbose_name='회차'),
+        ),
+    ]
@@ -1,4 +1,87 @@
 from django.db import models
+from django.db.models import F, OuterRef, Q, Subquery
+
+
+def numbers_to_mask(numbers):
+    """번호 목록 → 비트마스크 (n번 = 1 << n)"""
+    mask = 0
+    for n in numbers:
+        mask |= 1 << n
+    return mask
+
+
+def mask_to_numbers(mask):
+    """비트마스크 → 정렬된 번호 목록"""
+    return [n for n in range(1, 46) if mask >> n & 1]
+
+
+class DrawResultQuerySet(models.QuerySet):
+    def containing(self, numbers):
+        """지정한 번호를 모두 포함한 회차 (SQL 비트 AND)"""
+        mask = numbers_to_mask(numbers)
+        return self.alias(_hit=F('number_mask').bitand(mask)).filter(_hit=mask)
+
+    def with_exact_numbers(self, numbers):
+        """당첨번호 6개가 정확히 일치하는 회차 (number_mask 인덱스 조회)"""
+        return self.filter(number_mask=numbers_to_mask(numbers))
+
+    def match_counts(self, ticket):
+        """회차별 티켓 일치 개수 {draw_no: k} (메모리 popcount)"""
+        ticket_mask = numbers_to_mask(ticket)
+        return {
+            draw_no: (mask & ticket_mask).bit_count()
+            for draw_no, mask in self.values_list('draw_no', 'number_mask').iterator()
+        }
+
+    def with_features(self, **lookups):
+        """파생 지표 조건으로 필터 (예: with_features(total__range=(100, 150), odd_count=3)) - SQL JOIN 1번"""
+        return self.filter(**{f'features__{lookup}': value for lookup, value in lookups.items()})
+
+    def sum_between(self, low, high):
+        """번호 합이 low~high인 회차"""
+        return self.with_features(total__range=(low, high))
+
+    def with_consecutive(self, min_runs=1):
+        """연번 묶음이 min_runs개 이상인 회차"""
+        return self.with_features(consecutive_runs__gte=min_runs)
+
+    def feature_distribution(self, field):
+        """지표 값별 회차 수 {값: 회차 수} (GROUP BY 1번)"""
+        rows = self.order_by().values_list(f'features__{field}').annotate(n=models.Count('pk'))
+        return {value: n for value, n in rows if value is not None}
+
+    def neighbourhood(self, draw_no):
+        """
+        (이전 회차, 해당 회차, 다음 회차)를 쿼리 1번으로 조회 - 없으면 None
+        이전/다음은 draw_no ±1이 아니라 가장 가까운 회차 (중간에 빠진 회차 허용)
+        """
+        prev_no = self.model.objects.filter(draw_no__lt=draw_no).order_by('-draw_no').values('draw_no')[:1]
+        next_no = self.model.objects.filter(draw_no__gt=draw_no).order_by('draw_no').values('draw_no')[:1]
+        rows = self.filter(
+            Q(draw_no=draw_no) | Q(draw_no=Subquery(prev_no)) | Q(draw_no=Subquery(next_no))
+        ).select_related('features')
+        prev = current = next_ = None
+        for row in rows:
+            if row.draw_no < draw_no:
+                prev = row
+            elif row.draw_no > draw_no:
+                next_ = row
+            else:
+                current = row
+        return prev, current, next_
+
+    def page_stamp(self, draw_no):
+        """결과 페이지 캐시 키용 (수정 시각, 이전 회차, 다음 회차)를 쿼리 1번으로 조회 - 없으면 None"""
+        prev_no = self.model.objects.filter(draw_no__lt=OuterRef('draw_no')).order_by('-draw_no').values('draw_no')[:1]
+        next_no = self.model.objects.filter(draw_no__gt=OuterRef('draw_no')).order_by('draw_no').values('draw_no')[:1]
+        return self.filter(draw_no=draw_no).annotate(
+            prev_no=Subquery(prev_no), next_no=Subquery(next_no),
+        ).values_list('updated_at', 'prev_no', 'next_no').first()
+
+    def matching(self, ticket, k):
+        """티켓 번호와 k개 이상 일치한 회차"""
+        draw_nos = [no for no, hits in self.match_counts(ticket).items() if hits >= k]
+        return self.filter(draw_no__in=draw_nos)
 
 
 class DrawResult(models.Model):
@@ -12,12 +95,19 @@ class DrawResult(models.Model):
     number_5 = models.PositiveSmallIntegerField()
     number_6 = models.PositiveSmallIntegerField()
     bonus_number = models.PositiveSmallIntegerField(verbose_name='보너스')
+    # number_1~6 / bonus_number의 비정규화 비트마스크 (save() 및 loaddata 시 동기화)
+    number_mask = models.BigIntegerField(default=0, db_index=True, verbose_name='당첨번호 비트마스크')
+    bonus_mask = models.BigIntegerField(default=0, verbose_name='보너스 비트마스크')
     first_prize_amount = models.BigIntegerField(default=0, verbose_name='1등 당첨금')
     first_prize_winners = models.PositiveIntegerField(default=0, verbose_name='1등 당첨자수')
     second_prize_amount = models.BigIntegerField(default=0, verbose_name='2등 당첨금')
     second_prize_winners = models.PositiveIntegerField(default=0, verbose_name='2등 당첨자수')
     total_sales = models.BigIntegerField(default=0, verbose_name='총 판매금액')
     created_at = models.DateTimeField(auto_now_add=True)
+    # 결과 페이지 캐시 키에 사용 (save·DrawWriter upsert 시 갱신)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = DrawResultQuerySet.as_manager()
 
     class Meta:
         ordering = ['-draw_no']
@@ -34,3 +124,111 @@ class DrawResult(models.Model):
             self.number_1, self.number_2, self.number_3,
             self.number_4, self.number_5, self.number_6,
         ])
+
+    def save(self, *args, **kwargs):
+        self.sync_masks()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, 'number_mask', 'bonus_mask'}
+        super().save(*args, **kwargs)
+
+    def sync_masks(self):
+        """번호 컬럼 → 비트마스크 컬럼 동기화"""
+        self.number_mask = numbers_to_mask([
+            self.number_1, self.number_2, self.number_3,
+            self.number_4, self.number_5, self.number_6,
+        ])
+        self.bonus_mask = numbers_to_mask([self.bonus_number])
+
+
+class NumberStat(models.Model):
+    """번호별(1~45) 출현 통계 집계 테이블"""
+    number = models.PositiveSmallIntegerField(unique=True, verbose_name='번호')
+    total_count = models.PositiveIntegerField(default=0, verbose_name='전체 출현')
+    freq_10 = models.PositiveSmallIntegerField(default=0, verbose_name='최근 10회')
+    freq_30 = models.PositiveSmallIntegerField(default=0, verbose_name='최근 30회')
+    freq_100 = models.PositiveSmallIntegerField(default=0, verbose_name='최근 100회')
+    last_draw_no = models.PositiveIntegerField(null=True, blank=True, verbose_name='마지막 출현 회차')
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['number']
+        verbose_name = '번호 통계'
+        verbose_name_plural = '번호 통계'
+
+    def __str__(self):
+        return f'{self.number}번 ({self.total_count}회)'
+
+
+class StrategyBacktest(models.Model):
+    """추천 전략별 백테스트 결과 (backtest_strategies 커맨드가 갱신)"""
+    strategy = models.CharField(max_length=50, unique=True, verbose_name='전략')
+    seeds = models.PositiveIntegerField(default=0, verbose_name='시드 수')
+    first_draw_no = models.PositiveIntegerField(default=0, verbose_name='시작 회차')
+    last_draw_no = models.PositiveIntegerField(default=0, verbose_name='종료 회차')
+    samples = models.PositiveIntegerField(default=0, verbose_name='표본 수')
+    mean_hits = models.FloatField(default=0, verbose_name='평균 일치 개수')
+    rate_3plus = models.FloatField(default=0, verbose_name='3개 이상 일치 비율')
+    hit_distribution = models.JSONField(default=dict, verbose_name='일치 개수 분포')
+    seed_stats = models.JSONField(default=dict, verbose_name='시드별 평균 분포')
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-mean_hits']
+        verbose_name = '전략 백테스트'
+        verbose_name_plural = '전략 백테스트'
+
+    def __str__(self):
+        return f'{self.strategy} (평균 {self.mean_hits:.3f}개)'
+
+
+class DrawFeatures(models.Model):
+    """회차별 파생 지표 (DrawWriter 일괄 적재·save() 시 계산, services/draw_features.py)"""
+    # draw_no로 연결 - 회차 삭제 시 함께 삭제 (CASCADE)
+    draw = models.OneToOneField(
+        DrawResult, on_delete=models.CASCADE, to_field='draw_no', primary_key=True,
+        related_name='features', verbose_name='회차',
+    )
+    total = models.PositiveSmallIntegerField(verbose_name='번호 합')
+    odd_count = models.PositiveSmallIntegerField(verbose_name='홀수 개수')
+    low_count = models.PositiveSmallIntegerField(verbose_name='저번호(1~22) 개수')
+    # 구간: 1~10, 11~20, 21~30, 31~40, 41~45
+    zone_1 = models.PositiveSmallIntegerField(verbose_name='1번대')
+    zone_2 = models.PositiveSmallIntegerField(verbose_name='10번대')
+    zone_3 = models.PositiveSmallIntegerField(verbose_name='20번대')
+    zone_4 = models.PositiveSmallIntegerField(verbose_name='30번대')
+    zone_5 = models.PositiveSmallIntegerField(verbose_name='40번대')
+    consecutive_runs = models.PositiveSmallIntegerField(default=0, verbose_name='연번 묶음 수')
+    prime_count = models.PositiveSmallIntegerField(default=0, verbose_name='소수 개수')
+    ac_value = models.PositiveSmallIntegerField(default=0, verbose_name='AC값')
+
+    class Meta:
+        ordering = ['-draw']
+        # 합계 범위·홀짝/고저 비율·AC값 조건 검색용
+        indexes = [
+            models.Index(fields=['total'], name='drawfeatures_total_idx'),
+            models.Index(fields=['odd_count', 'low_count'], name='drawfeatures_odd_low_idx'),
+            models.Index(fields=['ac_value'], name='drawfeatures_ac_idx'),
+        ]
+        verbose_name = '회차 파생 지표'
+        verbose_name_plural = '회차 파생 지표'
+
+    def __str__(self):
+        return f'제{self.draw_id}회 지표 (합 {self.total})'
+
+    @property
+    def zones(self):
+        return [self.zone_1, self.zone_2, self.zone_3, self.zone_4, self.zone_5]
+
+    @property
+    def zone_spread(self):
+        """번호가 나온 구간 수"""
+        return sum(1 for count in self.zones if count)
+
+    @property
+    def even_count(self):
+        return 6 - self.odd_count
+
+    @property
+    def high_count(self):
+        return 6 - self.low_count
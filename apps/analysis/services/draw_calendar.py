@@ -0,0 +1,44 @@
+"""
+추첨 일정 계산 (1회: 2002-12-07, 이후 매주 토요일)
+추첨 방송 20:35 KST, 동행복권 API 결과 반영은 보통 20:45 전후
+"""
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+FIRST_DRAW_DATE = date(2002, 12, 7)
+KST = ZoneInfo('Asia/Seoul')
+RESULT_TIME = time(20, 45)
+SATURDAY = 5
+
+
+def estimate_draw_date(draw_no):
+    """회차 → 추첨일 추정"""
+    return FIRST_DRAW_DATE + timedelta(weeks=draw_no - 1)
+
+
+def estimate_draw_no(on_date=None):
+    """날짜 기준 마지막 추첨 회차 추정 (1회 이전이면 0)"""
+    on_date = on_date or date.today()
+    if on_date < FIRST_DRAW_DATE:
+        return 0
+    return (on_date - FIRST_DRAW_DATE).days // 7 + 1
+
+
+def last_result_at(now):
+    """now 이전(포함) 가장 최근 토요일 결과 발표 시각 (KST)"""
+    now = now.astimezone(KST)
+    days = (now.weekday() - SATURDAY) % 7
+    result_at = datetime.combine(now.date() - timedelta(days=days), RESULT_TIME, tzinfo=KST)
+    if result_at > now:
+        result_at -= timedelta(weeks=1)
+    return result_at
+
+
+def next_result_at(now):
+    """now 이후 다음 토요일 결과 발표 시각 (KST)"""
+    return last_result_at(now) + timedelta(weeks=1)
+
+
+def expected_draw_no(now):
+    """now 시점에 결과가 나와 있어야 할 최신 회차"""
+    return estimate_draw_no(last_result_at(now).date())
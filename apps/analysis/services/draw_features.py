@@ -0,0 +1,82 @@
+"""
+회차별 파생 지표 계산·저장
+- 번호 합, 홀수 개수, 저번호(1~22) 개수, 구간(10단위) 분포, 연번 묶음 수, 소수 개수, AC값
+- AC값(Arithmetic Complexity): 6개 번호 두 개씩의 차이 중 서로 다른 값의 개수 - 5 (0~10, 클수록 흩어진 조합)
+- DrawWriter는 배치마다 upsert_features, 개별 save()는 post_save 시그널이 save_features 호출
+"""
+from apps.analysis.models import DrawFeatures, DrawResult
+
+LOW_MAX = 22
+ZONES = ((1, 10), (11, 20), (21, 30), (31, 40), (41, 45))
+PRIMES = frozenset((2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43))
+FEATURE_FIELDS = (
+    'total', 'odd_count', 'low_count', 'zone_1', 'zone_2', 'zone_3', 'zone_4', 'zone_5',
+    'consecutive_runs', 'prime_count', 'ac_value',
+)
+BATCH_SIZE = 500
+
+
+def compute_features(numbers):
+    """당첨번호 6개 → 지표 dict (FEATURE_FIELDS)"""
+    features = {
+        'total': sum(numbers),
+        'odd_count': sum(1 for n in numbers if n % 2),
+        'low_count': sum(1 for n in numbers if n <= LOW_MAX),
+    }
+    for i, (lo, hi) in enumerate(ZONES, start=1):
+        features[f'zone_{i}'] = sum(1 for n in numbers if lo <= n <= hi)
+    features['consecutive_runs'] = consecutive_runs(numbers)
+    features['prime_count'] = sum(1 for n in numbers if n in PRIMES)
+    features['ac_value'] = ac_value(numbers)
+    return features
+
+
+def consecutive_runs(numbers):
+    """연속 번호 묶음 수 (예: 1,2,3,10,11,30 → 2)"""
+    nums = sorted(numbers)
+    # 묶음의 시작 = 앞 번호와 연속이면서 그 앞과는 끊긴 위치
+    return sum(
+        1 for i in range(1, len(nums))
+        if nums[i] - nums[i - 1] == 1 and (i == 1 or nums[i - 1] - nums[i - 2] != 1)
+    )
+
+
+def ac_value(numbers):
+    nums = sorted(numbers)
+    diffs = {b - a for i, a in enumerate(nums) for b in nums[i + 1:]}
+    return len(diffs) - (len(nums) - 1)
+
+
+def build_features(draw):
+    return DrawFeatures(draw_id=draw.draw_no, **compute_features(draw.numbers))
+
+
+def upsert_features(draws):
+    """DrawResult 목록의 지표를 한 번에 저장 (있으면 갱신)"""
+    DrawFeatures.objects.bulk_create(
+        [build_features(draw) for draw in draws],
+        update_conflicts=True,
+        unique_fields=['draw'],
+        update_fields=FEATURE_FIELDS,
+    )
+
+
+def save_features(draw):
+    upsert_features([draw])
+
+
+def rebuild_features(batch_size=BATCH_SIZE):
+    """전체 회차 지표 재계산 (회차가 없는 지표 행은 삭제) → 회차 수"""
+    DrawFeatures.objects.exclude(draw_id__in=DrawResult.objects.values('draw_no')).delete()
+    batch = []
+    count = 0
+    for draw in DrawResult.objects.order_by('draw_no').iterator(chunk_size=batch_size):
+        batch.append(draw)
+        if len(batch) >= batch_size:
+            upsert_features(batch)
+            count += len(batch)
+            batch = []
+    if batch:
+        upsert_features(batch)
+        count += len(batch)
+    return count
@@ -0,0 +1,135 @@
+"""
+역대 당첨 데이터 스트리밍 내보내기 (CSV / NDJSON / 바이너리)
+회차 키셋(draw_no > 마지막 회차) 배치 단위로 읽어 바이트 조각을 yield → 전체 이력을 메모리에 올리지 않음
+- iter_export: WSGI용 동기 제너레이터
+- aiter_export: ASGI용 비동기 제너레이터 (배치 조회만 sync_to_async) - 동기 이터레이터를 넘기면
+  ASGI 핸들러가 sync_to_async(list)로 전체를 모은 뒤 보내므로 스트리밍이 되지 않음
+
+CSV·NDJSON은 history_import(seed_from_excel)가 그대로 다시 읽을 수 있는 형식
+바이너리: 회차마다 9바이트 고정 길이 struct '>H7B' (회차 uint16, 번호 6개, 보너스) - 회차 오름차순
+"""
+import csv
+import json
+import struct
+
+from asgiref.sync import sync_to_async
+
+from apps.analysis.models import DrawResult
+from .number_stats import NUMBER_FIELDS
+
+BINARY_RECORD = struct.Struct('>H7B')
+# 배치(조회 1회) 하나가 전송 조각 하나 (gzip 압축 효율·호출 횟수)
+BATCH_SIZE = 500
+
+CSV_HEADER = (
+    '회차', '번호1', '번호2', '번호3', '번호4', '번호5', '번호6', '보너스',
+    '1등 당첨금', '1등 당첨자수', '2등 당첨금', '2등 당첨자수', '추첨일', '총 판매금액',
+)
+EXPORT_FIELDS = (
+    'draw_no', *NUMBER_FIELDS, 'bonus_number',
+    'first_prize_amount', 'first_prize_winners', 'second_prize_amount', 'second_prize_winners',
+    'draw_date', 'total_sales',
+)
+
+
+class _Echo:
+    """csv.writer가 쓴 줄을 그대로 돌려주는 가짜 파일"""
+    def write(self, value):
+        return value
+
+
+def fetch_batch(after=0, size=BATCH_SIZE, queryset=None):
+    """회차 after 다음부터 size개 행 (draw_no 인덱스 범위 조회)"""
+    queryset = DrawResult.objects.all() if queryset is None else queryset
+    return list(
+        queryset.filter(draw_no__gt=after).order_by('draw_no').values_list(*EXPORT_FIELDS)[:size]
+    )
+
+
+def iter_batches(queryset=None, size=None):
+    size = size or BATCH_SIZE
+    after = 0
+    while True:
+        rows = fetch_batch(after, size, queryset)
+        if rows:
+            yield rows
+        if len(rows) < size:
+            return
+        after = rows[-1][0]
+
+
+async def aiter_batches(queryset=None, size=None):
+    size = size or BATCH_SIZE
+    fetch = sync_to_async(fetch_batch)
+    after = 0
+    while True:
+        rows = await fetch(after, size, queryset)
+        if rows:
+            yield rows
+        if len(rows) < size:
+            return
+        after = rows[-1][0]
+
+
+def iter_export(fmt, queryset=None):
+    header, encode = ENCODERS[fmt]
+    if header:
+        yield header
+    for rows in iter_batches(queryset):
+        yield encode(rows)
+
+
+async def aiter_export(fmt, queryset=None):
+    header, encode = ENCODERS[fmt]
+    if header:
+        yield header
+    async for rows in aiter_batches(queryset):
+        yield encode(rows)
+
+
+def unpack_binary(data):
+    """바이너리 내보내기 → [(회차, [번호 6개], 보너스)]"""
+    return [(r[0], list(r[1:7]), r[7]) for r in BINARY_RECORD.iter_unpack(data)]
+
+
+def _encode_csv(rows):
+    writer = csv.writer(_Echo())
+    return ''.join(writer.writerow(row) for row in rows).encode()
+
+
+def _encode_ndjson(rows):
+    return ''.join(_ndjson_line(row) for row in rows).encode()
+
+
+def _encode_binary(rows):
+    return b''.join(BINARY_RECORD.pack(*row[:8]) for row in rows)
+
+
+def _ndjson_line(row):
+    draw_no, *numbers, bonus, first_amount, first_winners, second_amount, second_winners, draw_date, sales = row
+    return json.dumps({
+        'draw_no': draw_no,
+        'draw_date': draw_date.isoformat(),
+        'numbers': numbers,
+        'bonus_number': bonus,
+        'first_prize_amount': first_amount,
+        'first_prize_winners': first_winners,
+        'second_prize_amount': second_amount,
+        'second_prize_winners': second_winners,
+        'total_sales': sales,
+    }, separators=(',', ':')) + '\n'
+
+
+# 형식 → (머리 바이트, 배치 인코더)
+ENCODERS = {
+    # 엑셀에서 한글 헤더가 깨지지 않도록 BOM
+    'csv': (('\ufeff' + csv.writer(_Echo()).writerow(CSV_HEADER)).encode(), _encode_csv),
+    'ndjson': (b'', _encode_ndjson),
+    'bin': (b'', _encode_binary),
+}
+# 형식 → (Content-Type, 확장자)
+FORMATS = {
+    'csv': ('text/csv; charset=utf-8', 'csv'),
+    'ndjson': ('application/x-ndjson', 'ndjson'),
+    'bin': ('application/octet-stream', 'bin'),
+}
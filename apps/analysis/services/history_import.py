@@ -0,0 +1,159 @@
+"""
+역대 당첨 데이터 파일 스트리밍 적재 (xlsx / CSV / NDJSON)
+파일 → 원시 행 → 검증된 행 dict 순서의 제너레이터 파이프라인으로 한 행씩 처리해 메모리 사용량 일정
+
+xlsx·CSV 열 순서 (첫 행 헤더, history_export CSV와 같은 순서):
+    회차, 번호1~6, 보너스, [1등 당첨금, 1등 당첨자수, 2등 당첨금, 2등 당첨자수, 추첨일, 총 판매금액]
+NDJSON: 줄마다 {"draw_no", "numbers": [...], "bonus_number", ...} 또는 동행복권 API 응답 객체
+"""
+import csv
+import json
+from datetime import date, datetime
+from pathlib import Path
+
+from .draw_calendar import estimate_draw_date
+from .ingest import OPTIONAL_FIELDS
+from .lotto_api import LottoAPIError, parse_draw
+
+FORMATS = ('xlsx', 'csv', 'ndjson')
+PRIZE_COLUMNS = ('first_prize_amount', 'first_prize_winners', 'second_prize_amount', 'second_prize_winners')
+
+
+class ImportRowError(ValueError):
+    pass
+
+
+def detect_format(path):
+    suffix = Path(path).suffix.lower().lstrip('.')
+    if suffix in ('xlsx', 'xlsm'):
+        return 'xlsx'
+    if suffix in ('csv', 'tsv'):
+        return 'csv'
+    if suffix in ('ndjson', 'jsonl', 'json'):
+        return 'ndjson'
+    raise ValueError(f'지원하지 않는 파일 형식입니다: {path} ({", ".join(FORMATS)})')
+
+
+def iter_import_rows(path, fmt=None):
+    """(행 번호, 행 dict 또는 None, 오류 또는 None) - 빈 행은 건너뜀"""
+    fmt = fmt or detect_format(path)
+    reader = {'xlsx': _xlsx_records, 'csv': _csv_records, 'ndjson': _ndjson_records}[fmt]
+    for line_no, record in reader(path):
+        try:
+            if isinstance(record, Exception):
+                raise record
+            yield line_no, validate_row(record), None
+        except (ImportRowError, KeyError, IndexError, TypeError, ValueError, OverflowError) as e:
+            yield line_no, None, ImportRowError(f'{line_no}행: {e}')
+
+
+def validate_row(record):
+    """원시 dict → DrawWriter 행 (번호 1~45 서로 다른 6개, 보너스 중복 불가)"""
+    draw_no = int(record['draw_no'])
+    if draw_no < 1:
+        raise ImportRowError(f'회차가 올바르지 않습니다: {draw_no}')
+    numbers = [int(n) for n in record['numbers']]
+    bonus = int(record['bonus_number'])
+    if len(numbers) != 6 or len(set(numbers)) != 6:
+        raise ImportRowError('서로 다른 번호 6개가 필요합니다.')
+    if not all(1 <= n <= 45 for n in (*numbers, bonus)):
+        raise ImportRowError('번호는 1~45 사이여야 합니다.')
+    if bonus in numbers:
+        raise ImportRowError('보너스 번호가 당첨번호와 중복됩니다.')
+
+    row = {
+        'draw_no': draw_no,
+        # 날짜가 없으면 1회(2002-12-07)부터 매주 토요일로 추정
+        'draw_date': _parse_date(record.get('draw_date')) or estimate_draw_date(draw_no),
+        'numbers': sorted(numbers),
+        'bonus_number': bonus,
+    }
+    for field in OPTIONAL_FIELDS:
+        if field in record:
+            row[field] = _parse_amount(record[field])
+    return row
+
+
+def _xlsx_records(path):
+    try:
+        import openpyxl
+    except ImportError:
+        raise ImportError('openpyxl이 설치되지 않았습니다: pip install openpyxl')
+    wb = openpyxl.load_workbook(path, read_only=True)
+    try:
+        for line_no, values in enumerate(wb.active.iter_rows(min_row=2, values_only=True), start=2):
+            if values and values[0] is not None:
+                yield line_no, _positional_record(values)
+    finally:
+        wb.close()
+
+
+def _csv_records(path):
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        dialect = csv.excel_tab if str(path).lower().endswith('.tsv') else csv.excel
+        reader = csv.reader(f, dialect)
+        next(reader, None)  # 헤더
+        for line_no, values in enumerate(reader, start=2):
+            if values and values[0].strip():
+                yield line_no, _positional_record(values)
+
+
+def _ndjson_records(path):
+    with open(path, encoding='utf-8') as f:
+        for line_no, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                obj = json.loads(line)
+            except ValueError as e:
+                # 깨진 줄은 오류 행으로 넘기고 계속 진행
+                yield line_no, e
+                continue
+            if not isinstance(obj, dict):
+                yield line_no, ImportRowError(f'JSON 객체가 아닙니다: {type(obj).__name__}')
+                continue
+            if 'drwNo' in obj:
+                try:
+                    obj = parse_draw(obj) or {}
+                except LottoAPIError as e:
+                    yield line_no, ImportRowError(str(e))
+                    continue
+            yield line_no, obj
+
+
+def _positional_record(values):
+    values = [v.strip() if isinstance(v, str) else v for v in values]
+    if len(values) < 8:
+        return ValueError(f'열이 부족합니다 ({len(values)}개)')
+    record = {
+        'draw_no': values[0],
+        'numbers': values[1:7],
+        'bonus_number': values[7],
+    }
+    for field, value in zip(PRIZE_COLUMNS, values[8:12]):
+        record[field] = value
+    if len(values) > 12:
+        record['draw_date'] = values[12]
+    if len(values) > 13:
+        record['total_sales'] = values[13]
+    return record
+
+
+def _parse_date(value):
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(str(value).strip()[:10].replace('.', '-'), '%Y-%m-%d').date()
+
+
+def _parse_amount(value):
+    if value is None or value == '':
+        return 0
+    if isinstance(value, (int, float)):
+        return int(value)
+    # 문자열 쉼표 제거
+    return int(str(value).replace(',', '').replace(' ', '') or '0')
@@ -0,0 +1,150 @@
+"""
+회차 데이터 일괄 저장(upsert) writer
+- 행 dict를 모아 batch_size마다 bulk_create(update_conflicts=True)로 저장
+- 전체 적재를 트랜잭션 하나로 묶고 끝나면 번호 통계·캐시 버전을 한 번만 갱신 후 draws_ingested 발송
+- bulk_create는 save()·시그널을 거치지 않으므로 비트마스크·파생 지표(DrawFeatures)는 여기서 계산
+
+행 형식: {'draw_no', 'draw_date', 'numbers': [6개], 'bonus_number', (선택) 당첨금·판매 필드}
+"""
+import logging
+from collections import namedtuple
+
+from django.db import transaction
+
+from apps.analysis.cache import bump_draw_version
+from apps.analysis.models import DrawResult
+from apps.analysis.signals import draws_ingested
+from .draw_features import upsert_features
+from .number_stats import NUMBER_FIELDS, apply_draw, rebuild_number_stats
+
+BASE_FIELDS = ('draw_date', *NUMBER_FIELDS, 'bonus_number', 'number_mask', 'bonus_mask')
+OPTIONAL_FIELDS = (
+    'first_prize_amount', 'first_prize_winners',
+    'second_prize_amount', 'second_prize_winners', 'total_sales',
+)
+BATCH_SIZE = 500
+
+logger = logging.getLogger(__name__)
+
+IngestResult = namedtuple('IngestResult', ['created', 'updated'])
+
+
+def build_draw(row):
+    """행 dict → 저장 전 DrawResult (번호 정렬·비트마스크 계산)"""
+    nums = sorted(row['numbers'])
+    draw = DrawResult(
+        draw_no=row['draw_no'],
+        draw_date=row['draw_date'],
+        bonus_number=row['bonus_number'],
+        **dict(zip(NUMBER_FIELDS, nums)),
+        **{f: row[f] for f in OPTIONAL_FIELDS if f in row},
+    )
+    draw.sync_masks()
+    return draw
+
+
+class DrawWriter:
+    """
+    with DrawWriter() as writer:
+        for row in rows:
+            writer.add(row)
+    writer.created / writer.updated
+    """
+
+    def __init__(self, batch_size=BATCH_SIZE):
+        self.batch_size = batch_size
+        self.created = 0
+        self.updated = 0
+        self._buffer = {}
+        self._last_draw = None
+        self._cleared = False
+        self._atomic = None
+
+    @property
+    def result(self):
+        return IngestResult(self.created, self.updated)
+
+    def __enter__(self):
+        self._atomic = transaction.atomic()
+        self._atomic.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            try:
+                self.flush()
+                self._refresh_stats()
+            except BaseException as e:
+                self._atomic.__exit__(type(e), e, e.__traceback__)
+                raise
+        self._atomic.__exit__(exc_type, exc, tb)
+        if exc_type is None and (self.created + self.updated or self._cleared):
+            bump_draw_version()
+            self._send_ingested()
+        return False
+
+    def clear_existing(self):
+        """
+        기존 회차 전체 삭제 (같은 트랜잭션) → 삭제한 회차 수
+        QuerySet.delete()로 지워 DrawFeatures CASCADE·삭제 시그널 적용 (캐시 버전은 __exit__에서 커밋 후 갱신)
+        """
+        _, deleted = DrawResult.objects.all().delete()
+        self._cleared = True
+        return deleted.get(DrawResult._meta.label, 0)
+
+    def add(self, row):
+        """행 추가 - 같은 회차가 다시 오면 마지막 값으로 덮어씀"""
+        draw = build_draw(row)
+        self._buffer[draw.draw_no] = (draw, tuple(f for f in OPTIONAL_FIELDS if f in row))
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """버퍼의 회차를 저장 (선택 필드 구성이 같은 행끼리 한 번의 upsert)"""
+        if not self._buffer:
+            return
+        buffer, self._buffer = self._buffer, {}
+
+        # 같은 트랜잭션이라 앞선 배치에서 저장한 회차도 조회됨
+        existing = set(DrawResult.objects.filter(draw_no__in=buffer).values_list('draw_no', flat=True))
+        self.updated += len(existing)
+        self.created += len(buffer) - len(existing)
+
+        groups = {}
+        for draw, optional in buffer.values():
+            groups.setdefault(optional, []).append(draw)
+            self._last_draw = (draw, draw.draw_no not in existing)
+        for optional, draws in groups.items():
+            # 행에 없는 선택 필드는 기존 값 유지, 수정 시각은 갱신 (결과 페이지 캐시 키)
+            DrawResult.objects.bulk_create(
+                draws,
+                update_conflicts=True,
+                unique_fields=['draw_no'],
+                update_fields=[*BASE_FIELDS, *optional, 'updated_at'],
+            )
+        upsert_features(draw for draw, _ in buffer.values())
+
+    def _send_ingested(self):
+        latest_draw_no = DrawResult.objects.order_by('-draw_no').values_list('draw_no', flat=True).first()
+        for receiver, response in draws_ingested.send_robust(
+            sender=DrawResult, created=self.created, updated=self.updated, latest_draw_no=latest_draw_no,
+        ):
+            # 적재는 이미 커밋됐으므로 후처리 실패는 기록만
+            if isinstance(response, Exception):
+                logger.error('draws_ingested 처리 실패: %s', receiver, exc_info=response)
+
+    def _refresh_stats(self):
+        written = self.created + self.updated
+        if written == 1 and not self._cleared:
+            # 새 최신 회차 1건이면 증분 반영
+            apply_draw(*self._last_draw)
+        elif written or self._cleared:
+            rebuild_number_stats()
+
+
+def upsert_draws(rows, batch_size=BATCH_SIZE):
+    """행 목록을 트랜잭션 하나로 일괄 저장 → IngestResult(created, updated)"""
+    with DrawWriter(batch_size) as writer:
+        for row in rows:
+            writer.add(row)
+    return writer.result
@@ -0,0 +1,188 @@
+"""
+동행복권 당첨번호 JSON API 클라이언트
+- 커넥션 풀을 공유하는 세션 하나로 여러 회차를 동시에 요청 (동시 요청 수 제한)
+- 네트워크 오류·5xx·비JSON 응답은 지수 백오프로 재시도, 미추첨 회차는 즉시 None
+- 결과는 완료 순서대로 제너레이터로 흘려보내 저장 단계가 바로 처리
+API: {LOTTO_API_URL}?method=getLottoNumber&drwNo=N
+"""
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+HEADERS = {
+    'User-Agent': (
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
+        'AppleWebKit/537.36 (KHTML, like Gecko) '
+        'Chrome/120.0.0.0 Safari/537.36'
+    ),
+    'Accept': 'application/json, text/javascript, */*; q=0.01',
+    'Accept-Language': 'ko-KR,ko;q=0.9',
+    'Referer': 'https://www.dhlottery.co.kr/gameResult.do?method=byWin',
+    'X-Requested-With': 'XMLHttpRequest',
+}
+TIMEOUT = 15
+RETRIES = 3
+BACKOFF = 0.5
+
+
+class LottoAPIError(Exception):
+    """재시도 후에도 응답을 받지 못했거나 응답 형식이 잘못된 경우"""
+
+
+def api_url():
+    return getattr(settings, 'LOTTO_API_URL', 'https://www.dhlottery.co.kr/common.do')
+
+
+def build_session(pool_size=None):
+    """동시 요청 수만큼 커넥션을 유지하는 세션"""
+    pool_size = pool_size or default_concurrency()
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def default_concurrency():
+    return getattr(settings, 'LOTTO_FETCH_CONCURRENCY', 8)
+
+
+def parse_draw(data):
+    """API 응답 → 회차 행 dict (ingest.DrawWriter 형식, 미추첨 회차면 None, 필드 누락·형식 오류면 LottoAPIError)"""
+    if not isinstance(data, dict):
+        raise LottoAPIError(f'응답 형식 오류: {type(data).__name__}')
+    if data.get('returnValue') != 'success':
+        return None
+    try:
+        return _draw_row(data)
+    except (KeyError, TypeError, ValueError) as e:
+        raise LottoAPIError(f'응답 형식 오류 (drwNo={data.get("drwNo")}): {e!r}') from e
+
+
+def _draw_row(data):
+    return {
+        'draw_no': data['drwNo'],
+        'draw_date': datetime.strptime(data['drwNoDate'], '%Y-%m-%d').date(),
+        'numbers': [
+            data['drwtNo1'], data['drwtNo2'], data['drwtNo3'],
+            data['drwtNo4'], data['drwtNo5'], data['drwtNo6'],
+        ],
+        'bonus_number': data['bnusNo'],
+        'first_prize_amount': data.get('firstWinamnt', 0),
+        'first_prize_winners': data.get('firstPrzwnerCo', 0),
+        'total_sales': data.get('totSellamnt', 0),
+    }
+
+
+def fetch_draw(session, draw_no, retries=RETRIES, backoff=BACKOFF):
+    """
+    회차 하나 조회 - 미추첨 회차면 None
+    일시적 오류는 backoff × 2^n초 간격으로 재시도, 모두 실패하면 LottoAPIError
+    """
+    for attempt in range(retries + 1):
+        try:
+            resp = session.get(
+                api_url(),
+                params={'method': 'getLottoNumber', 'drwNo': draw_no},
+                timeout=TIMEOUT,
+            )
+            resp.raise_for_status()
+            # 점검·차단 시 HTML이 오므로 JSON이 아니면 재시도 대상
+            data = resp.json()
+        except (requests.RequestException, ValueError) as e:
+            if attempt == retries:
+                raise LottoAPIError(f'제{draw_no}회 조회 실패: {e}') from e
+            logger.warning('제%s회 조회 재시도 (%s/%s): %s', draw_no, attempt + 1, retries, e)
+            time.sleep(backoff * 2 ** attempt)
+        else:
+            # JSON은 받았지만 필드가 빠진 응답은 재시도해도 같으므로 바로 LottoAPIError
+            return parse_draw(data)
+
+
+def iter_draws(draw_nos, concurrency=None, session=None):
+    """
+    여러 회차를 동시에 조회해 완료 순서대로 (회차, 데이터, 오류) 반환
+    데이터 None + 오류 None = 미추첨 회차, 진행 중인 요청은 동시 요청 수 이하로 유지
+    """
+    concurrency = concurrency or default_concurrency()
+    session = session or build_session(concurrency)
+    draw_nos = iter(draw_nos)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        pending = {}
+
+        def submit_next():
+            for draw_no in draw_nos:
+                pending[pool.submit(fetch_draw, session, draw_no)] = draw_no
+                return True
+            return False
+
+        for _ in range(concurrency):
+            if not submit_next():
+                break
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                draw_no = pending.pop(future)
+                submit_next()
+                try:
+                    yield draw_no, future.result(), None
+                except LottoAPIError as e:
+                    yield draw_no, None, e
+
+
+class DrawProbe:
+    """회차 존재 여부 조회 + 결과 캐시 (탐색 중 받은 데이터는 저장 단계에서 재사용)"""
+
+    def __init__(self, session):
+        self.session = session
+        self.results = {}
+
+    def __call__(self, draw_no):
+        if draw_no not in self.results:
+            self.results[draw_no] = fetch_draw(self.session, draw_no)
+        return self.results[draw_no] is not None
+
+    @property
+    def requests(self):
+        return len(self.results)
+
+
+def find_latest_draw_no(probe, known=0, estimate=None):
+    """
+    최신 회차 탐색 - 추정 회차에서 갤로핑(1, 2, 4, ...) 후 이진 탐색, O(log 오차) 요청
+    known: 존재가 확인된 회차 (DB 최신, 없으면 0), estimate: 날짜 기준 추정 회차
+    """
+    guess = max(estimate or 0, known + 1)
+    if probe(guess):
+        # 위로 갤로핑: lo는 존재, hi는 미추첨
+        lo, step = guess, 1
+        while probe(lo + step):
+            lo += step
+            step *= 2
+        hi = lo + step
+    else:
+        # 아래로 갤로핑 (known 아래로는 내려가지 않음)
+        hi, step = guess, 1
+        lo = hi - step
+        while lo > known and not probe(lo):
+            hi = lo
+            step *= 2
+            lo = max(known, hi - step)
+
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if probe(mid):
+            lo = mid
+        else:
+            hi = mid
+    return lo or None
@@ -0,0 +1,96 @@
+"""
+번호별 출현 통계 집계 테이블(NumberStat) 관리
+- rebuild_number_stats: 전체 회차 재계산
+- apply_draw: 회차 저장 시 증분 반영
+"""
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import F
+
+from apps.analysis.models import DrawResult, NumberStat
+
+NUMBER_FIELDS = ('number_1', 'number_2', 'number_3', 'number_4', 'number_5', 'number_6')
+WINDOWS = (10, 30, 100)
+
+
+def rebuild_number_stats():
+    """전체 회차를 한 번 훑어 45개 번호 통계를 다시 계산"""
+    rows = DrawResult.objects.order_by('-draw_no').values_list('draw_no', *NUMBER_FIELDS)
+
+    total_counter = Counter()
+    last_seen = {}
+    window_rows = []
+    draw_count = 0
+
+    for i, (draw_no, *nums) in enumerate(rows.iterator()):
+        draw_count += 1
+        if i < WINDOWS[-1]:
+            window_rows.append(nums)
+        for n in nums:
+            total_counter[n] += 1
+            last_seen.setdefault(n, draw_no)
+
+    windows = _window_counts(window_rows)
+
+    with transaction.atomic():
+        stats = _ensure_rows()
+        for num, stat in stats.items():
+            stat.total_count = total_counter.get(num, 0)
+            stat.last_draw_no = last_seen.get(num)
+            for label, counter in windows.items():
+                setattr(stat, label, counter.get(num, 0))
+        NumberStat.objects.bulk_update(
+            stats.values(),
+            ['total_count', 'last_draw_no', 'freq_10', 'freq_30', 'freq_100'],
+        )
+    return draw_count
+
+
+def apply_draw(draw, created=True):
+    """
+    회차 1건 저장 후 통계 반영
+    최신 회차가 새로 추가된 경우만 증분 갱신하고,
+    기존 회차 수정·과거 회차 삽입·집계 미구축 상태면 전체 재계산
+    """
+    latest_no = DrawResult.objects.order_by('-draw_no').values_list('draw_no', flat=True).first()
+    if (not created or draw.draw_no != latest_no
+            or NumberStat.objects.count() != 45):
+        rebuild_number_stats()
+        return
+
+    # 최근 N회 윈도우는 최신 100회만 다시 읽어 갱신 (O(100))
+    recent = DrawResult.objects.order_by('-draw_no').values_list(*NUMBER_FIELDS)[:WINDOWS[-1]]
+    windows = _window_counts(list(recent))
+
+    with transaction.atomic():
+        NumberStat.objects.filter(number__in=draw.numbers).update(
+            total_count=F('total_count') + 1,
+            last_draw_no=draw.draw_no,
+        )
+        stats = list(NumberStat.objects.all())
+        for stat in stats:
+            for label, counter in windows.items():
+                setattr(stat, label, counter.get(stat.number, 0))
+        NumberStat.objects.bulk_update(stats, ['freq_10', 'freq_30', 'freq_100'])
+
+
+def _window_counts(rows):
+    """최신순 번호 목록 → {'freq_10': Counter, 'freq_30': ..., 'freq_100': ...}"""
+    windows = {}
+    for size in WINDOWS:
+        counter = Counter()
+        for nums in rows[:size]:
+            counter.update(nums)
+        windows[f'freq_{size}'] = counter
+    return windows
+
+
+def _ensure_rows():
+    """1~45번 행이 모두 존재하도록 보장"""
+    existing = {s.number: s for s in NumberStat.objects.all()}
+    missing = [NumberStat(number=n) for n in range(1, 46) if n not in existing]
+    if missing:
+        NumberStat.objects.bulk_create(missing)
+        existing = {s.number: s for s in NumberStat.objects.all()}
+    return existing
@@ -0,0 +1,164 @@
+"""
+역대 전체 회차 기준 티켓 당첨 확인 엔진
+티켓 여러 장을 전체 DrawResult 이력과 한 번에 비교해 등수별 횟수·최고 성적·가상 당첨금 계산
+numpy가 있으면 (티켓 × 45) @ (45 × 회차) 행렬곱 한 번으로 일치 개수를 구함
+"""
+from apps.analysis.cache import draw_cached
+from apps.analysis.models import DrawResult, numbers_to_mask
+
+try:
+    import numpy as np
+except ImportError:  # numpy 미설치 시 비트마스크 popcount 경로 사용
+    np = None
+
+# 4·5등은 고정 당첨금, 3등 당첨금은 DB에 없어 합계에서 제외
+FIXED_PRIZES = {4: 50_000, 5: 5_000}
+MAX_TICKETS = 5000
+# 인증 없이 호출되는 공개 API 기본 한도 (요청 1건이 전체 이력 × 티켓 수만큼 계산)
+ANONYMOUS_MAX_TICKETS = 100
+
+if np is not None:
+    # 점수(2 × 일치 개수 + 보너스) → 등수, 등수 → 고정 당첨금
+    _SCORE_RANKS = np.array([0, 0, 0, 0, 0, 0, 5, 5, 4, 4, 3, 2, 1, 0], dtype=np.intp)
+    _FIXED_PRIZE_BY_RANK = np.array([0, 0, 0, 0, FIXED_PRIZES[4], FIXED_PRIZES[5]], dtype=np.float64)
+
+
+class TicketError(ValueError):
+    pass
+
+
+def parse_ticket(numbers):
+    """1~45 사이 서로 다른 6개 번호인지 검증 후 정렬해 반환 (번호 목록, 각 번호는 정수만 허용)"""
+    # 문자열 "123456"·실수 1.9·True 등이 조용히 번호로 바뀌지 않도록 변환 없이 타입만 확인
+    if not isinstance(numbers, (list, tuple)):
+        raise TicketError('번호 목록이 필요합니다.')
+    if not all(isinstance(n, int) and not isinstance(n, bool) for n in numbers):
+        raise TicketError('번호는 정수여야 합니다.')
+    ticket = sorted(numbers)
+    if len(ticket) != 6 or len(set(ticket)) != 6:
+        raise TicketError('서로 다른 번호 6개가 필요합니다.')
+    if not all(1 <= n <= 45 for n in ticket):
+        raise TicketError('번호는 1~45 사이여야 합니다.')
+    return ticket
+
+
+@draw_cached('ticket_checker_draws')
+def load_draw_history():
+    """(회차, 추첨일, 번호 마스크, 보너스, 1등 당첨금, 2등 당첨금) 목록 - 회차 버전별 캐시"""
+    return list(DrawResult.objects.order_by('draw_no').values_list(
+        'draw_no', 'draw_date', 'number_mask', 'bonus_number',
+        'first_prize_amount', 'second_prize_amount',
+    ))
+
+
+def check_tickets(tickets, history=None, max_tickets=MAX_TICKETS):
+    """티켓 목록(각 6개 번호)을 전체 회차와 비교한 결과 목록"""
+    # 장수 제한은 검증 전에 확인 (초과 요청을 끝까지 파싱하지 않음)
+    if not tickets:
+        raise TicketError('확인할 번호가 없습니다.')
+    if len(tickets) > max_tickets:
+        raise TicketError(f'한 번에 최대 {max_tickets}장까지 확인할 수 있습니다.')
+    tickets = [parse_ticket(t) for t in tickets]
+    if history is None:
+        history = load_draw_history()
+
+    if np is not None:
+        summaries = _summaries_numpy(tickets, history)
+    else:
+        summaries = _summaries_python(tickets, history)
+
+    return [
+        _result(ticket, rank_counts, winnings, best_rank, best_index, history)
+        for ticket, (rank_counts, winnings, best_rank, best_index) in zip(tickets, summaries)
+    ]
+
+
+def _rank(hits, bonus_hit):
+    if hits == 6:
+        return 1
+    if hits == 5:
+        return 2 if bonus_hit else 3
+    if hits == 4:
+        return 4
+    if hits == 3:
+        return 5
+    return 0
+
+
+def _summaries_python(tickets, history):
+    """티켓별 (등수별 횟수, 당첨금 합계, 최고 등수, 최고 등수 회차 인덱스)"""
+    summaries = []
+    for ticket in tickets:
+        ticket_mask = numbers_to_mask(ticket)
+        rank_counts = [0] * 6
+        winnings = 0
+        best_rank, best_index = 0, None
+        for i, (_, _, mask, bonus, first_prize, second_prize) in enumerate(history):
+            rank = _rank((mask & ticket_mask).bit_count(), ticket_mask >> bonus & 1)
+            if not rank:
+                continue
+            rank_counts[rank] += 1
+            winnings += {1: first_prize, 2: second_prize}.get(rank, FIXED_PRIZES.get(rank, 0))
+            # 등수가 같으면 최근 회차 우선
+            if not best_rank or rank <= best_rank:
+                best_rank, best_index = rank, i
+        summaries.append((rank_counts[1:], winnings, best_rank, best_index))
+    return summaries
+
+
+def _summaries_numpy(tickets, history):
+    """
+    티켓 × 회차 점수 행렬을 행렬곱 한 번으로 계산해 당첨 칸만 뽑아 집계
+    점수 = 2 × 일치 개수 + 보너스 일치 → 6 이상이면 당첨 (3개 일치 이상)
+    """
+    n_tickets, n_draws = len(tickets), len(history)
+    masks = np.fromiter((h[2] for h in history), dtype=np.int64, count=n_draws)
+    bonus_idx = np.fromiter((h[3] - 1 for h in history), dtype=np.intp, count=n_draws)
+    first_prizes = np.fromiter((h[4] for h in history), dtype=np.float64, count=n_draws)
+    second_prizes = np.fromiter((h[5] for h in history), dtype=np.float64, count=n_draws)
+
+    bits = np.arange(1, 46, dtype=np.int64)
+    D = ((masks[:, None] >> bits) & 1).astype(np.float32) * 2  # 회차 × 45
+    D[np.arange(n_draws), bonus_idx] = 1
+
+    T = np.zeros((n_tickets, 45), dtype=np.float32)
+    T[np.arange(n_tickets)[:, None], np.array(tickets, dtype=np.intp) - 1] = 1
+
+    scores = T @ D.T
+    rows, cols = np.nonzero(scores >= 6)
+    ranks = _SCORE_RANKS[scores[rows, cols].astype(np.intp)]
+
+    rank_counts = np.bincount(rows * 6 + ranks, minlength=n_tickets * 6).reshape(n_tickets, 6)[:, 1:]
+    prizes = np.where(ranks == 1, first_prizes[cols],
+                      np.where(ranks == 2, second_prizes[cols], _FIXED_PRIZE_BY_RANK[ranks]))
+    winnings = np.bincount(rows, weights=prizes, minlength=n_tickets)
+
+    # 티켓별 최고 등수, 같으면 최근 회차 (행 → 등수 오름차순 → 회차 내림차순 정렬 후 첫 칸)
+    best_rank = [0] * n_tickets
+    best_index = [None] * n_tickets
+    order = np.lexsort((-cols, ranks, rows))
+    best_rows, first = np.unique(rows[order], return_index=True)
+    for row, pos in zip(best_rows.tolist(), order[first].tolist()):
+        best_rank[row] = int(ranks[pos])
+        best_index[row] = int(cols[pos])
+
+    return [
+        (counts, int(total), rank, index)
+        for counts, total, rank, index in zip(
+            rank_counts.tolist(), winnings.round().tolist(), best_rank, best_index,
+        )
+    ]
+
+
+def _result(ticket, rank_counts, winnings, best_rank, best_index, history):
+    best = None
+    if best_index is not None:
+        draw_no, draw_date = history[best_index][:2]
+        best = {'rank': best_rank, 'draw_no': draw_no, 'draw_date': draw_date.strftime('%Y-%m-%d')}
+    return {
+        'numbers': ticket,
+        'rank_counts': {str(rank): count for rank, count in zip(range(1, 6), rank_counts)},
+        'best': best,
+        'total_winnings': winnings,
+        'total_draws': len(history),
+    }
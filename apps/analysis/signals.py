@@ -0,0 +1,34 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import Signal, receiver
+from django.utils import timezone
+
+from .cache import bump_draw_version
+from .models import DrawResult
+from .services.draw_features import save_features
+
+# DrawWriter 일괄 적재 커밋 후 발송 (kwargs: created, updated, latest_draw_no)
+# 캐시 예열·정적 페이지 생성 등 파생 데이터 갱신용 훅
+draws_ingested = Signal()
+
+
+@receiver(pre_save, sender=DrawResult)
+def sync_draw_masks(sender, instance, raw=False, **kwargs):
+    """loaddata(raw 저장)는 save()·auto_now를 거치지 않으므로 여기서 비트마스크·수정 시각 동기화"""
+    if raw:
+        instance.sync_masks()
+        if instance.updated_at is None:
+            instance.updated_at = timezone.now()
+
+
+@receiver(post_save, sender=DrawResult)
+def save_draw_features(sender, instance, **kwargs):
+    """개별 저장(관리자·loaddata 등) 시 파생 지표 계산 - 일괄 적재는 DrawWriter가 직접 저장"""
+    save_features(instance)
+
+
+@receiver(post_save, sender=DrawResult)
+@receiver(post_delete, sender=DrawResult)
+def invalidate_draw_cache(sender, **kwargs):
+    """회차 저장/삭제 시 커밋 후 캐시 버전 갱신 (커밋 전에 갱신하면 다른 프로세스가 이전 데이터를 새 버전 키로 캐시할 수 있음)"""
+    transaction.on_commit(bump_draw_version)
@@ -0,0 +1,491 @@
+import json
+import random
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+from io import StringIO
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from apps.analysis.models import DrawFeatures, DrawResult, NumberStat, numbers_to_mask
+from apps.analysis.services import history_export, lotto_api, number_stats, ticket_checker
+from apps.analysis.services.history_import import ImportRowError, iter_import_rows, validate_row
+from apps.analysis.services.ingest import DrawWriter, upsert_draws
+from apps.analysis.services.lotto_api import (
+    DrawProbe, LottoAPIError, build_session, fetch_draw, find_latest_draw_no, iter_draws,
+)
+from apps.analysis.services.number_stats import rebuild_number_stats
+from apps.analysis.services.ticket_checker import TicketError, check_tickets
+
+TEST_CACHES = {
+    alias: {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': f'analysis-test-{alias}'}
+    for alias in ('default', 'state', 'view_dedup', 'pages')
+}
+# collectstatic 없이 draws_ingested 후처리(페이지 예열) 렌더링
+TEST_STORAGES = {'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'}}
+
+
+def draw_payload(draw_no, **overrides):
+    data = {
+        'returnValue': 'success',
+        'drwNo': draw_no,
+        'drwNoDate': '2024-01-06',
+        'drwtNo1': 1, 'drwtNo2': 2, 'drwtNo3': 3, 'drwtNo4': 4, 'drwtNo5': 5, 'drwtNo6': 6,
+        'bnusNo': 7,
+        'firstWinamnt': 1_000_000_000,
+        'firstPrzwnerCo': 10,
+        'totSellamnt': 100_000_000_000,
+    }
+    data.update(overrides)
+    return data
+
+
+def draw_rows(draw_nos, seed=0):
+    """회차별 임의(고정 시드) 당첨번호 행 dict 목록"""
+    rng = random.Random(seed)
+    rows = []
+    for draw_no in draw_nos:
+        picked = rng.sample(range(1, 46), 7)
+        rows.append({
+            'draw_no': draw_no,
+            'draw_date': date(2002, 12, 7) + timedelta(weeks=draw_no - 1),
+            'numbers': sorted(picked[:6]),
+            'bonus_number': picked[6],
+        })
+    return rows
+
+
+def stat_values():
+    return list(NumberStat.objects.order_by('number').values_list(
+        'number', 'total_count', 'freq_10', 'freq_30', 'freq_100', 'last_draw_no',
+    ))
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """회차별로 등록한 응답을 차례로 돌려주는 동행복권 API 대역 (마지막 응답은 계속 반복)"""
+
+    def do_GET(self):
+        draw_no = int(parse_qs(urlparse(self.path).query)['drwNo'][0])
+        server = self.server
+        with server.lock:
+            server.hits[draw_no] = server.hits.get(draw_no, 0) + 1
+            queue = server.routes.get(draw_no) or [(200, {'returnValue': 'fail'}, 0)]
+            status, body, delay = queue.pop(0) if len(queue) > 1 else queue[0]
+        if delay:
+            time.sleep(delay)
+        payload = body if isinstance(body, bytes) else json.dumps(body).encode()
+        try:
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+        except (BrokenPipeError, ConnectionResetError):
+            # 클라이언트가 타임아웃으로 먼저 끊은 경우
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+class LottoAPIClientTests(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _StubHandler)
+        cls.server.daemon_threads = True
+        cls.server.lock = threading.Lock()
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.enterClassContext(override_settings(
+            LOTTO_API_URL=f'http://127.0.0.1:{cls.server.server_port}/common.do',
+        ))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        self.server.routes = {}
+        self.server.hits = {}
+        self.session = build_session(4)
+        # 환경 변수 프록시 설정이 로컬 대역 서버 요청을 가로채지 않도록
+        self.session.trust_env = False
+        self.addCleanup(self.session.close)
+
+    def route(self, draw_no, *responses):
+        self.server.routes[draw_no] = [r if len(r) == 3 else (*r, 0) for r in responses]
+
+    def test_success(self):
+        self.route(1100, (200, draw_payload(1100)))
+        row = fetch_draw(self.session, 1100, retries=0)
+        self.assertEqual(row['draw_no'], 1100)
+        self.assertEqual(row['draw_date'], date(2024, 1, 6))
+        self.assertEqual(row['numbers'], [1, 2, 3, 4, 5, 6])
+        self.assertEqual(row['bonus_number'], 7)
+        self.assertEqual(row['first_prize_winners'], 10)
+
+    def test_fail_return_value_is_undrawn(self):
+        self.route(9999, (200, {'returnValue': 'fail'}))
+        self.assertIsNone(fetch_draw(self.session, 9999, retries=0))
+        self.assertEqual(self.server.hits[9999], 1)
+
+    def test_retries_server_error_then_succeeds(self):
+        self.route(1101, (503, b'busy'), (503, b'busy'), (200, draw_payload(1101)))
+        row = fetch_draw(self.session, 1101, retries=3, backoff=0)
+        self.assertEqual(row['draw_no'], 1101)
+        self.assertEqual(self.server.hits[1101], 3)
+
+    def test_timeout_retries_then_raises(self):
+        self.route(1102, (200, draw_payload(1102), 0.5))
+        with mock.patch.object(lotto_api, 'TIMEOUT', 0.1):
+            with self.assertRaises(LottoAPIError):
+                fetch_draw(self.session, 1102, retries=2, backoff=0)
+        self.assertEqual(self.server.hits[1102], 3)
+
+    def test_timeout_then_success(self):
+        self.route(1103, (200, draw_payload(1103), 0.5), (200, draw_payload(1103)))
+        with mock.patch.object(lotto_api, 'TIMEOUT', 0.1):
+            row = fetch_draw(self.session, 1103, retries=2, backoff=0)
+        self.assertEqual(row['draw_no'], 1103)
+
+    def test_malformed_json_retries_then_raises(self):
+        self.route(1104, (200, b'<html>maintenance</html>'))
+        with self.assertRaises(LottoAPIError):
+            fetch_draw(self.session, 1104, retries=1, backoff=0)
+        self.assertEqual(self.server.hits[1104], 2)
+
+    def test_missing_fields_raise_without_retry(self):
+        payload = draw_payload(1105)
+        del payload['drwtNo6']
+        self.route(1105, (200, payload))
+        with self.assertRaises(LottoAPIError):
+            fetch_draw(self.session, 1105, retries=3, backoff=0)
+        self.assertEqual(self.server.hits[1105], 1)
+
+    def test_non_object_json_raises(self):
+        self.route(1106, (200, [1, 2, 3]))
+        with self.assertRaises(LottoAPIError):
+            fetch_draw(self.session, 1106, retries=0)
+
+    def test_iter_draws_reports_errors_per_draw(self):
+        bad = draw_payload(1112, drwNoDate='not-a-date')
+        self.route(1110, (200, draw_payload(1110)))
+        self.route(1111, (200, {'returnValue': 'fail'}))
+        self.route(1112, (200, bad))
+        results = {
+            draw_no: (data, error)
+            for draw_no, data, error in iter_draws([1110, 1111, 1112], concurrency=2, session=self.session)
+        }
+        self.assertEqual(results[1110][0]['draw_no'], 1110)
+        self.assertEqual(results[1111], (None, None))
+        self.assertIsNone(results[1112][0])
+        self.assertIsInstance(results[1112][1], LottoAPIError)
+
+    def test_probe_finds_latest_and_keeps_fetched_rows(self):
+        for draw_no in range(1120, 1124):
+            self.route(draw_no, (200, draw_payload(draw_no)))
+        probe = DrawProbe(self.session)
+        self.assertEqual(find_latest_draw_no(probe, known=1119, estimate=1122), 1123)
+        self.assertEqual(probe.results[1123]['draw_no'], 1123)
+        self.assertIsNone(probe.results[1124])
+        self.assertEqual(probe.requests, len(self.server.hits))
+
+
+@override_settings(CACHES=TEST_CACHES, STORAGES=TEST_STORAGES)
+class NumberStatTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        upsert_draws(draw_rows(range(1, 121)))
+
+    def rebuilt(self):
+        """현재 DB를 전체 재계산한 통계 (비교용)"""
+        rebuild_number_stats()
+        return stat_values()
+
+    def test_rebuild_matches_direct_count(self):
+        rows = draw_rows(range(1, 121))
+        newest = rows[::-1]
+        for number, total, freq_10, freq_30, freq_100, last_draw_no in stat_values():
+            with self.subTest(number=number):
+                self.assertEqual(total, sum(number in r['numbers'] for r in rows))
+                self.assertEqual(freq_10, sum(number in r['numbers'] for r in newest[:10]))
+                self.assertEqual(freq_30, sum(number in r['numbers'] for r in newest[:30]))
+                self.assertEqual(freq_100, sum(number in r['numbers'] for r in newest[:100]))
+                self.assertEqual(last_draw_no, next((r['draw_no'] for r in newest if number in r['numbers']), None))
+
+    def test_new_latest_draw_is_incremental(self):
+        with mock.patch.object(number_stats, 'rebuild_number_stats') as rebuild:
+            upsert_draws(draw_rows([121], seed=1))
+        rebuild.assert_not_called()
+        incremental = stat_values()
+        self.assertEqual(incremental, self.rebuilt())
+
+    def test_reingest_rebuilds(self):
+        upsert_draws(draw_rows([121], seed=1))
+        changed = draw_rows([121], seed=2)
+        with mock.patch.object(number_stats, 'rebuild_number_stats', wraps=rebuild_number_stats) as rebuild:
+            upsert_draws(changed)
+        rebuild.assert_called_once()
+        # 이전 번호 반영분이 남지 않음
+        stats = stat_values()
+        self.assertEqual(stats, self.rebuilt())
+        for number, *_, last_draw_no in stats:
+            if number in changed[0]['numbers']:
+                self.assertEqual(last_draw_no, 121)
+
+    def test_past_draw_insert_rebuilds(self):
+        NumberStat.objects.all().delete()
+        upsert_draws(draw_rows([200], seed=3))
+        upsert_draws(draw_rows([150], seed=4))
+        self.assertEqual(len(stat_values()), 45)
+        self.assertEqual(stat_values(), self.rebuilt())
+
+
+def ticket_history(draws):
+    """(번호, 보너스, 1등 당첨금, 2등 당첨금) 목록 → load_draw_history 형식 (회차 1부터)"""
+    return [
+        (draw_no, date(2024, 1, 6) + timedelta(weeks=draw_no - 1), numbers_to_mask(numbers), bonus, first, second)
+        for draw_no, (numbers, bonus, first, second) in enumerate(draws, start=1)
+    ]
+
+
+class TicketCheckerTests(SimpleTestCase):
+    TICKET = [1, 2, 3, 4, 5, 6]
+    HISTORY = ticket_history([
+        ([1, 2, 3, 4, 5, 6], 7, 2_000_000_000, 50_000_000),     # 1등
+        ([1, 2, 3, 4, 5, 8], 6, 1_000_000_000, 40_000_000),     # 5개 + 보너스 → 2등
+        ([1, 2, 3, 4, 5, 9], 10, 1_000_000_000, 40_000_000),    # 5개 → 3등 (당첨금 합계 제외)
+        ([1, 2, 3, 4, 10, 11], 12, 0, 0),                       # 4등
+        ([1, 2, 3, 10, 11, 12], 6, 0, 0),                       # 3개 + 보너스 → 5등 (보너스 무관)
+        ([1, 2, 10, 11, 12, 13], 3, 0, 0),                      # 2개 + 보너스 → 낙첨
+        ([1, 2, 3, 4, 5, 6], 40, 3_000_000_000, 60_000_000),    # 1등 (최근 회차)
+    ])
+
+    def check(self, tickets, history, numpy):
+        with mock.patch.object(ticket_checker, 'np', ticket_checker.np if numpy else None):
+            return check_tickets(tickets, history=history)
+
+    def test_known_ranks_on_both_backends(self):
+        for numpy in (True, False):
+            with self.subTest(numpy=numpy):
+                [result] = self.check([self.TICKET], self.HISTORY, numpy)
+                self.assertEqual(result['rank_counts'], {'1': 2, '2': 1, '3': 1, '4': 1, '5': 1})
+                self.assertEqual(result['best'], {'rank': 1, 'draw_no': 7, 'draw_date': '2024-02-17'})
+                self.assertEqual(result['total_winnings'], 5_000_000_000 + 40_000_000 + 50_000 + 5_000)
+                self.assertEqual(result['total_draws'], 7)
+
+    def test_no_win(self):
+        for numpy in (True, False):
+            with self.subTest(numpy=numpy):
+                [result] = self.check([[40, 41, 42, 43, 44, 45]], self.HISTORY, numpy)
+                self.assertIsNone(result['best'])
+                self.assertEqual(result['total_winnings'], 0)
+                self.assertEqual(set(result['rank_counts'].values()), {0})
+
+    def test_backends_agree_on_random_history(self):
+        rng = random.Random(7)
+        draws = []
+        for _ in range(300):
+            picked = rng.sample(range(1, 46), 7)
+            draws.append((picked[:6], picked[6], rng.randint(1, 5) * 10**9, rng.randint(1, 9) * 10**7))
+        history = ticket_history(draws)
+        # 당첨 번호 그대로·보너스 포함 5개 일치 티켓이 섞이도록
+        tickets = [sorted(rng.sample(range(1, 46), 6)) for _ in range(200)]
+        tickets += [sorted(numbers) for numbers, *_ in draws[:20]]
+        tickets += [sorted(numbers[:5] + [bonus]) for numbers, bonus, *_ in draws[20:40]]
+        self.assertEqual(self.check(tickets, history, True), self.check(tickets, history, False))
+
+    def test_ticket_limits(self):
+        with self.assertRaises(TicketError):
+            check_tickets([], history=self.HISTORY)
+        with self.assertRaises(TicketError):
+            check_tickets([self.TICKET] * 3, history=self.HISTORY, max_tickets=2)
+        for bad in ('123456', [1, 2, 3, 4, 5], [1, 2, 3, 4, 5, 5], [0, 1, 2, 3, 4, 5], [1.0, 2, 3, 4, 5, 6], [True, 2, 3, 4, 5, 6]):
+            with self.subTest(ticket=bad), self.assertRaises(TicketError):
+                check_tickets([bad], history=self.HISTORY)
+
+
+class FakeProbe:
+    """latest회까지 추첨된 API 대역 - 요청한 회차를 기록"""
+
+    def __init__(self, latest):
+        self.latest = latest
+        self.calls = []
+
+    def __call__(self, draw_no):
+        self.calls.append(draw_no)
+        return 1 <= draw_no <= self.latest
+
+
+class FindLatestDrawTests(SimpleTestCase):
+    def find(self, latest, **kwargs):
+        probe = FakeProbe(latest)
+        return find_latest_draw_no(probe, **kwargs), probe.calls
+
+    def test_estimate_too_high(self):
+        for estimate in (1151, 1160, 1400):
+            with self.subTest(estimate=estimate):
+                found, calls = self.find(1150, known=1100, estimate=estimate)
+                self.assertEqual(found, 1150)
+                # known 아래로는 조회하지 않음
+                self.assertTrue(all(draw_no > 1100 for draw_no in calls))
+
+    def test_estimate_too_low(self):
+        for estimate in (1001, 1140, 1149):
+            with self.subTest(estimate=estimate):
+                found, calls = self.find(1150, known=1000, estimate=estimate)
+                self.assertEqual(found, 1150)
+                self.assertLessEqual(len(calls), 2 * (1150 - estimate).bit_length() + 2)
+
+    def test_exact_estimate(self):
+        found, calls = self.find(1150, known=1100, estimate=1150)
+        self.assertEqual(found, 1150)
+        self.assertEqual(calls, [1150, 1151])
+
+    def test_empty_db(self):
+        for estimate in (None, 1, 1150, 2000):
+            with self.subTest(estimate=estimate):
+                found, calls = self.find(1150, known=0, estimate=estimate)
+                self.assertEqual(found, 1150)
+                self.assertNotIn(0, calls)
+
+    def test_db_already_current(self):
+        found, calls = self.find(1150, known=1150, estimate=1150)
+        self.assertEqual(found, 1150)
+        self.assertEqual(calls, [1151])
+
+    def test_empty_api(self):
+        self.assertEqual(self.find(0, known=0, estimate=1150)[0], None)
+        self.assertEqual(self.find(0, known=0)[0], None)
+
+
+class HistoryImportTests(SimpleTestCase):
+    def write(self, name, text):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = Path(directory.name) / name
+        path.write_text(text, encoding='utf-8')
+        return path
+
+    def rows(self, path):
+        return list(iter_import_rows(path))
+
+    def test_validate_row(self):
+        row = validate_row({
+            'draw_no': '3', 'numbers': ['6', 5, 4, 3, 2, 1], 'bonus_number': '7',
+            'first_prize_amount': '1,000,000', 'draw_date': '2002.12.21',
+        })
+        self.assertEqual(row, {
+            'draw_no': 3, 'draw_date': date(2002, 12, 21), 'numbers': [1, 2, 3, 4, 5, 6],
+            'bonus_number': 7, 'first_prize_amount': 1_000_000,
+        })
+        # 날짜가 없으면 1회부터 매주 토요일로 추정
+        self.assertEqual(validate_row({'draw_no': 2, 'numbers': [1, 2, 3, 4, 5, 6], 'bonus_number': 7})['draw_date'],
+                         date(2002, 12, 14))
+
+    def test_validate_row_rejects(self):
+        bad = [
+            {'draw_no': 0, 'numbers': [1, 2, 3, 4, 5, 6], 'bonus_number': 7},
+            {'draw_no': 1, 'numbers': [1, 2, 3, 4, 5], 'bonus_number': 7},
+            {'draw_no': 1, 'numbers': [1, 2, 3, 4, 5, 5], 'bonus_number': 7},
+            {'draw_no': 1, 'numbers': [1, 2, 3, 4, 5, 46], 'bonus_number': 7},
+            {'draw_no': 1, 'numbers': [1, 2, 3, 4, 5, 6], 'bonus_number': 6},
+        ]
+        for record in bad:
+            with self.subTest(record=record), self.assertRaises(ImportRowError):
+                validate_row(record)
+
+    def test_csv_bad_columns_become_error_rows(self):
+        path = self.write('draws.csv', '\n'.join([
+            '회차,번호1,번호2,번호3,번호4,번호5,번호6,보너스',
+            '1,10,23,29,33,37,40,16',
+            '2,9,13,21,25,32',             # 열 부족
+            '3,11,16,19,21,27,x,30',       # 숫자 아님
+            '',
+            '4,14,27,30,31,40,42,2',
+        ]))
+        results = self.rows(path)
+        self.assertEqual([line for line, _, _ in results], [2, 3, 4, 6])
+        self.assertEqual([row['draw_no'] for _, row, error in results if not error], [1, 4])
+        errors = [error for _, _, error in results if error]
+        self.assertEqual(len(errors), 2)
+        self.assertTrue(str(errors[0]).startswith('3행:'))
+
+    def test_ndjson_error_rows(self):
+        api_bad = draw_payload(5)
+        del api_bad['bnusNo']
+        path = self.write('draws.ndjson', '\n'.join([
+            json.dumps({'draw_no': 1, 'numbers': [1, 2, 3, 4, 5, 6], 'bonus_number': 7}),
+            '{broken',
+            '5',
+            '[1, 2]',
+            json.dumps(api_bad),
+            json.dumps(draw_payload(6)),
+        ]))
+        results = self.rows(path)
+        self.assertEqual([(line, row['draw_no']) for line, row, error in results if not error], [(1, 1), (6, 6)])
+        self.assertEqual([line for line, _, error in results if error], [2, 3, 4, 5])
+
+
+@override_settings(CACHES=TEST_CACHES, STORAGES=TEST_STORAGES)
+class DrawWriterTests(TestCase):
+    def test_created_updated_counts_and_duplicates(self):
+        rows = draw_rows(range(1, 8))
+        with DrawWriter(batch_size=3) as writer:
+            for row in rows:
+                writer.add(row)
+        self.assertEqual(writer.result, (7, 0))
+
+        changed = {**draw_rows([3], seed=9)[0], 'first_prize_winners': 12}
+        with DrawWriter(batch_size=3) as writer:
+            # 같은 배치 안의 중복 회차는 마지막 값으로 1건
+            writer.add(draw_rows([8])[0])
+            writer.add(rows[2])
+            writer.add(changed)
+        self.assertEqual(writer.result, (1, 1))
+        draw = DrawResult.objects.get(draw_no=3)
+        self.assertEqual((draw.numbers, draw.first_prize_winners), (changed['numbers'], 12))
+        self.assertEqual(DrawFeatures.objects.count(), 8)
+
+    def test_clear_existing_cascades_and_bumps_version(self):
+        upsert_draws(draw_rows(range(1, 6)))
+        with mock.patch('apps.analysis.services.ingest.bump_draw_version') as bump, \
+                self.captureOnCommitCallbacks(execute=True):
+            with DrawWriter() as writer:
+                self.assertEqual(writer.clear_existing(), 5)
+                self.assertFalse(DrawFeatures.objects.exists())
+                writer.add(draw_rows([10])[0])
+        bump.assert_called_once()
+        self.assertEqual(writer.result, (1, 0))
+        self.assertEqual(list(DrawResult.objects.values_list('draw_no', flat=True)), [10])
+        self.assertEqual(DrawFeatures.objects.count(), 1)
+
+    def test_export_import_round_trip(self):
+        rows = draw_rows(range(1, 6))
+        for i, row in enumerate(rows):
+            row.update(first_prize_amount=2_000_000_000 + i, first_prize_winners=i + 1,
+                       second_prize_amount=50_000_000 + i, second_prize_winners=i + 5,
+                       total_sales=80_000_000_000 + i)
+        upsert_draws(rows)
+        fields = history_export.EXPORT_FIELDS
+        expected = list(DrawResult.objects.order_by('draw_no').values_list(*fields))
+
+        for fmt in ('csv', 'ndjson'):
+            with self.subTest(fmt=fmt):
+                upsert_draws(rows)
+                directory = tempfile.TemporaryDirectory()
+                self.addCleanup(directory.cleanup)
+                path = Path(directory.name) / f'draws.{fmt}'
+                path.write_bytes(b''.join(history_export.iter_export(fmt)))
+                call_command('seed_from_excel', file=str(path), clear=True, stdout=StringIO(), stderr=StringIO())
+                # 오류 건수만이 아니라 당첨금·판매금액까지 모든 필드가 그대로 돌아와야 함
+                self.assertEqual(list(DrawResult.objects.order_by('draw_no').values_list(*fields)), expected)
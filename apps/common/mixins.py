@@ -0,0 +1,80 @@
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import caches
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import patch_vary_headers
+
+from apps.analysis.cache import draw_cache_key
+
+
+def anonymous_request(path):
+    """
+    뷰를 직접 호출할 비로그인 GET 요청 (캐시 예열용, 미들웨어를 거치지 않음)
+    런타임 코드에서 django.test.RequestFactory를 쓰지 않도록 HttpRequest를 직접 구성
+    """
+    request = HttpRequest()
+    request.method = 'GET'
+    request.path = request.path_info = path
+    host = next((h.lstrip('.') for h in settings.ALLOWED_HOSTS if h != '*'), 'localhost')
+    request.META = {
+        'REQUEST_METHOD': 'GET',
+        'PATH_INFO': path,
+        'QUERY_STRING': '',
+        'SERVER_NAME': host,
+        'SERVER_PORT': '80',
+    }
+    request.user = AnonymousUser()
+    return request
+
+
+class AnonymousPageCacheMixin:
+    """
+    비로그인 사용자의 GET 요청은 렌더링된 전체 페이지를 'pages' 캐시에 저장
+    키 = 요청 경로 + 회차 데이터 버전 + 배포 버전 (+ 날짜), 로그인 사용자는 항상 새로 렌더링
+    전체 회차 데이터에 의존하지 않는 페이지는 get_page_cache_key를 재정의해 자기 데이터로 키 구성
+    쿼리 문자열은 키에 넣지 않음 (임의 ?x=... 요청이 캐시 항목을 늘리지 않도록) - 쿼리에 따라 내용이 바뀌는 뷰에는 쓰지 말 것
+    """
+    page_cache_alias = 'pages'
+    page_cache_timeout = 60 * 60
+    page_cache_daily = True
+
+    def get_page_cache_key(self):
+        return draw_cache_key(
+            'page', settings.PAGE_CACHE_VERSION, self.request.path, daily=self.page_cache_daily,
+        )
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method != 'GET' or request.user.is_authenticated:
+            response = super().dispatch(request, *args, **kwargs)
+            patch_vary_headers(response, ['Cookie'])
+            return response
+
+        cache = caches[self.page_cache_alias]
+        key = self.get_page_cache_key()
+        cached = cache.get(key)
+        if cached is not None:
+            content, content_type = cached
+            response = HttpResponse(content, content_type=content_type)
+        else:
+            response = super().dispatch(request, *args, **kwargs)
+            if response.status_code == 200 and not response.streaming:
+                def store(rendered):
+                    cache.set(key, (rendered.content, rendered['Content-Type']), self.page_cache_timeout)
+
+                if hasattr(response, 'add_post_render_callback'):
+                    response.add_post_render_callback(store)
+                else:
+                    store(response)
+
+        # 로그인 여부(세션 쿠키)에 따라 내용이 달라지므로 공유 캐시가 구분하도록 표시
+        patch_vary_headers(response, ['Cookie'])
+        return response
+
+    @classmethod
+    def warm_page_cache(cls, path, **kwargs):
+        """비로그인 요청으로 한 번 렌더링해 페이지 캐시에 저장 → 응답"""
+        response = cls.as_view()(anonymous_request(path), **kwargs)
+        # 이미 캐시된 페이지면 HttpResponse, 새로 렌더링하면 TemplateResponse (렌더 시 캐시 저장)
+        if hasattr(response, 'render'):
+            response.render()
+        return response
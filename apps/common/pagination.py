@@ -0,0 +1,190 @@
+"""
+키셋(커서) 페이지네이션
+- OFFSET/COUNT(*) 없이 정렬 키 값 비교(WHERE (a, b) < (x, y))로 다음·이전 페이지 조회 → 깊은 페이지도 1페이지와 같은 비용
+- 커서: 방향 + 경계 행의 키 값을 담은 URL-safe base64 문자열 (내용은 클라이언트가 알 필요 없음)
+- 전체 개수는 필요할 때만 계산하는 근사치 (count 인자 또는 approximate_count 캐시)
+- 예전 ?page=N 링크는 해당 페이지를 여는 커서 URL로 영구 이동 (KeysetPaginationMixin)
+"""
+import base64
+import binascii
+import hashlib
+import json
+from datetime import date, datetime
+
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from django.http import Http404, HttpResponsePermanentRedirect
+
+NEXT, PREVIOUS = 'n', 'p'
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+class KeysetPage:
+    def __init__(self, paginator, object_list, has_next, has_previous):
+        self.paginator = paginator
+        self.object_list = object_list
+        self.has_next = has_next
+        self.has_previous = has_previous
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    @property
+    def next_cursor(self):
+        return self.paginator.encode_cursor(NEXT, self.object_list[-1]) if self.has_next else None
+
+    @property
+    def previous_cursor(self):
+        return self.paginator.encode_cursor(PREVIOUS, self.object_list[0]) if self.has_previous else None
+
+    @property
+    def last_cursor(self):
+        return self.paginator.encode_cursor(PREVIOUS) if self.has_next else None
+
+    @property
+    def total(self):
+        return self.paginator.total
+
+
+class KeysetPaginator:
+    """
+    ordering: 유일하게 정렬되는 필드 목록 (예: ['-draw_no'], ['-created_at', '-id'])
+    count: 근사 전체 개수 (정수 또는 호출 시 계산하는 함수, 없으면 None)
+    """
+
+    def __init__(self, queryset, ordering, per_page, count=None):
+        self.queryset = queryset
+        self.keys = [(f.lstrip('-'), f.startswith('-')) for f in ordering]
+        self.per_page = per_page
+        self._count = count
+        self._total = None
+        self._fields = {name: queryset.model._meta.get_field(name) for name, _ in self.keys}
+
+    @property
+    def total(self):
+        if self._total is None and self._count is not None:
+            self._total = self._count() if callable(self._count) else self._count
+        return self._total
+
+    def page(self, cursor=None):
+        direction, values = self.decode_cursor(cursor) if cursor else (NEXT, None)
+        backwards = direction == PREVIOUS
+
+        queryset = self.queryset
+        if values is not None:
+            queryset = queryset.filter(self._beyond(values, backwards))
+        ordering = [('-' if desc != backwards else '') + name for name, desc in self.keys]
+        rows = list(queryset.order_by(*ordering)[:self.per_page + 1])
+
+        more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+        if backwards:
+            rows.reverse()
+            # 맨 끝 커서(values 없음)에서 뒤로 온 경우 다음 페이지 없음
+            return KeysetPage(self, rows, has_next=values is not None, has_previous=more)
+        return KeysetPage(self, rows, has_next=more, has_previous=values is not None)
+
+    def encode_cursor(self, direction, row=None):
+        values = None if row is None else [_json_value(getattr(row, name)) for name, _ in self.keys]
+        payload = json.dumps([direction, values], separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, cursor):
+        try:
+            raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+            direction, values = json.loads(raw)
+            if direction not in (NEXT, PREVIOUS):
+                raise InvalidCursor(cursor)
+            if values is not None:
+                if len(values) != len(self.keys):
+                    raise InvalidCursor(cursor)
+                values = [self._fields[name].to_python(v) for (name, _), v in zip(self.keys, values)]
+            return direction, values
+        except (binascii.Error, UnicodeDecodeError, ValueError, TypeError, ValidationError) as e:
+            raise InvalidCursor(cursor) from e
+
+    def _beyond(self, values, backwards):
+        """정렬 방향 기준 values 다음 행 조건: a > x OR (a = x AND b > y) ..."""
+        condition = Q()
+        for i, (name, desc) in enumerate(self.keys):
+            lookup = 'lt' if desc != backwards else 'gt'
+            tie = {prev: values[j] for j, (prev, _) in enumerate(self.keys[:i])}
+            condition |= Q(**tie, **{f'{name}__{lookup}': values[i]})
+        # 첫 키 범위 조건을 따로 걸어야 OR 조건에서도 인덱스 범위 탐색(seek) 가능
+        name, desc = self.keys[0]
+        return Q(**{f'{name}__{"lte" if desc != backwards else "gte"}': values[0]}) & condition
+
+
+class KeysetPaginationMixin:
+    """
+    ListView용 - paginate_by + keyset_ordering 지정, 템플릿은 page_obj.next_cursor 등으로 링크 구성
+    get_approximate_count()를 재정의하면 page_obj.total 제공
+    """
+    keyset_ordering = None
+    cursor_kwarg = 'cursor'
+
+    def get(self, request, *args, **kwargs):
+        if self.page_kwarg in request.GET and self.cursor_kwarg not in request.GET:
+            return self.legacy_page_redirect()
+        return super().get(request, *args, **kwargs)
+
+    def get_approximate_count(self, queryset):
+        return None
+
+    def legacy_page_redirect(self):
+        """?page=N → N페이지 직전 행을 경계로 한 커서 URL (외부·북마크 링크용, OFFSET 조회는 이때 한 번만)"""
+        queryset = self.get_queryset()
+        paginator = KeysetPaginator(queryset, self.keyset_ordering, self.get_paginate_by(queryset))
+        query = self.request.GET.copy()
+        page = query.pop(self.page_kwarg)[-1]
+
+        if page == 'last':
+            query[self.cursor_kwarg] = paginator.encode_cursor(PREVIOUS)
+        else:
+            try:
+                number = int(page)
+            except ValueError:
+                number = 1
+            if number > 1:
+                offset = (number - 1) * paginator.per_page - 1
+                boundary = queryset.order_by(*self.keyset_ordering)[offset:offset + 1].first()
+                if boundary is None:
+                    raise Http404('잘못된 페이지입니다.')
+                query[self.cursor_kwarg] = paginator.encode_cursor(NEXT, boundary)
+
+        url = self.request.path
+        if query:
+            url += '?' + query.urlencode()
+        return HttpResponsePermanentRedirect(url)
+
+    def paginate_queryset(self, queryset, page_size):
+        paginator = KeysetPaginator(
+            queryset, self.keyset_ordering, page_size,
+            count=lambda: self.get_approximate_count(queryset),
+        )
+        try:
+            page = paginator.page(self.request.GET.get(self.cursor_kwarg))
+        except InvalidCursor:
+            raise Http404('잘못된 페이지입니다.')
+        return paginator, page, page.object_list, page.has_next or page.has_previous
+
+
+def approximate_count(queryset, timeout=5 * 60):
+    """COUNT(*) 결과를 쿼리별로 잠시 캐시한 근사 개수"""
+    sql = str(queryset.order_by().query)
+    key = 'count:' + hashlib.md5(sql.encode()).hexdigest()
+    return cache.get_or_set(key, queryset.count, timeout)
+
+
+def _json_value(value):
+    if isinstance(value, (datetime, date)):
+        # 마이크로초까지 보존해야 같은 시각 경계에서 행이 빠지지 않음
+        return value.isoformat()
+    return value
@@ -10,7 +10,7 @@ class BoardAdmin(admin.ModelAdmin):
 
 @admin.register(Post)
 class PostAdmin(admin.ModelAdmin):
-    list_display = ['title', 'board', 'author', 'views', 'created_at']
+    list_display = ['title', 'board', 'author', 'views', 'like_count', 'comment_count', 'created_at']
     list_filter = ['board', 'created_at']
     search_fields = ['title', 'content']
 
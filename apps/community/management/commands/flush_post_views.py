@@ -0,0 +1,38 @@
+"""
+캐시에 모아 둔 게시글 조회수 DB 반영 커맨드
+Usage: python manage.py flush_post_views [--interval 60]
+
+조회 요청은 캐시 카운터만 올리고 DB 반영은 이 커맨드가 담당
+--interval을 주면 N초마다 반영하는 상주 프로세스로 실행, 없으면 한 번 반영 후 종료 (cron·배포 전)
+"""
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.community.services.view_counter import flush_views
+
+
+class Command(BaseCommand):
+    help = '반영 대기 중인 게시글 조회수를 DB에 일괄 반영합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--interval', type=int, help='반복 반영 주기 (초, 미지정 시 한 번만 실행)')
+
+    def handle(self, *args, **options):
+        if not options['interval']:
+            flushed = flush_views()
+            if flushed is None:
+                raise CommandError('다른 프로세스가 조회수를 반영하고 있습니다. 잠시 후 다시 실행하세요.')
+            self.stdout.write(self.style.SUCCESS(f'완료! 조회 {flushed}회 반영'))
+            return
+
+        while True:
+            try:
+                flushed = flush_views()
+            except Exception as e:
+                # DB 오류 시 카운터는 되돌려져 있으므로 다음 주기에 다시 반영
+                self.stderr.write(f'조회수 반영 실패: {e}')
+            else:
+                if flushed:
+                    self.stdout.write(f'조회 {flushed}회 반영')
+            time.sleep(options['interval'])
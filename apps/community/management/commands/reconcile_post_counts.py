@@ -0,0 +1,17 @@
+"""
+게시글 좋아요·댓글 카운터 재계산 커맨드
+Usage: python manage.py reconcile_post_counts
+
+관리자 화면 삭제 등으로 Post.like_count/comment_count가 실제 행 수와 어긋났을 때 실행
+"""
+from django.core.management.base import BaseCommand
+
+from apps.community.models import Post
+
+
+class Command(BaseCommand):
+    help = '게시글 좋아요·댓글 수 카운터를 실제 데이터로 다시 맞춥니다.'
+
+    def handle(self, *args, **options):
+        fixed = Post.objects.reconcile_counts()
+        self.stdout.write(self.style.SUCCESS(f'완료! 게시글 {fixed}개 카운터 수정'))
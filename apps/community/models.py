@@ -1,5 +1,7 @@
 from django.conf import settings
 from django.db import models
+from django.db.models import Count, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
 
 
 class Board(models.Model):
@@ -18,6 +20,20 @@ class Board(models.Model):
         return self.name
 
 
+class PostQuerySet(models.QuerySet):
+    def reconcile_counts(self):
+        """like_count/comment_count를 실제 좋아요·댓글 수로 다시 맞춤 (수정된 게시글 수 반환)"""
+        likes = _count_subquery(PostLike)
+        comments = _count_subquery(Comment)
+        drifted = self.filter(~Q(like_count=likes) | ~Q(comment_count=comments))
+        return drifted.update(like_count=likes, comment_count=comments)
+
+
+def _count_subquery(model):
+    rows = model.objects.filter(post=OuterRef('pk')).order_by().values('post').annotate(n=Count('pk')).values('n')
+    return Coalesce(Subquery(rows), 0)
+
+
 class Post(models.Model):
     board = models.ForeignKey(Board, on_delete=models.CASCADE, related_name='posts')
     author = models.ForeignKey(
@@ -26,25 +42,24 @@ class Post(models.Model):
     title = models.CharField(max_length=200, verbose_name='제목')
     content = models.TextField(verbose_name='내용')
     views = models.PositiveIntegerField(default=0, verbose_name='조회수')
+    # 목록 N+1 방지용 비정규화 카운터 - 뷰에서 F()로 증감, 어긋나면 reconcile_post_counts
+    like_count = models.PositiveIntegerField(default=0, verbose_name='좋아요 수')
+    comment_count = models.PositiveIntegerField(default=0, verbose_name='댓글 수')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = PostQuerySet.as_manager()
+
     class Meta:
         ordering = ['-created_at']
+        # 게시판별 키셋 페이지네이션 (created_at, id)
+        indexes = [models.Index(fields=['board', '-created_at', '-id'], name='post_board_keyset_idx')]
         verbose_name = '게시글'
         verbose_name_plural = '게시글'
 
     def __str__(self):
         return self.title
 
-    @property
-    def like_count(self):
-        return self.likes.count()
-
-    @property
-    def comment_count(self):
-        return self.comments.count()
-
 
 class Comment(models.Model):
     post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name='comments')
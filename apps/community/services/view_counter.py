@@ -0,0 +1,137 @@
+"""
+게시글 조회수 버퍼
+- 조회 시 DB UPDATE 대신 캐시 카운터(postviews:n:<id>)만 증가, 대기 중인 게시글 id는 레지스트리 키에 기록
+- 카운터·레지스트리는 정리(cull)되지 않는 'state' 캐시, 반복 조회 판정 키는 크기 제한된 'view_dedup' 캐시에 보관
+- DB 반영은 요청 경로 밖에서만 - flush_post_views 커맨드(--interval로 상주 실행 또는 cron)가 한 트랜잭션으로 일괄 반영
+- 반영은 카운터에서 먼저 차감(선점)한 만큼만 DB에 더함 - 카운터가 사라졌으면 건너뛰고, DB 반영이 실패하면 되돌림
+- 같은 세션의 반복 조회는 일정 시간 동안 1회로 계산 (세션이 이미 있는 요청만)
+파일 캐시는 incr가 프로세스 간 원자적이지 않아 동시 조회 일부가 누락될 수 있음 (조회수 용도로 허용)
+"""
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import models, transaction
+
+PENDING_KEY = 'postviews:pending'
+LOCK_KEY = 'postviews:flush-lock'
+REGISTRY_LOCK_KEY = 'postviews:pending-lock'
+LOCK_TIMEOUT = 60
+REGISTRY_LOCK_TIMEOUT = 5
+
+
+def count_key(post_id):
+    return f'postviews:n:{post_id}'
+
+
+def record_view(post_id, session_key=None):
+    """조회 1회 적립 → 아직 DB에 반영되지 않은 조회 수 반환"""
+    dedup = getattr(settings, 'POST_VIEW_DEDUP_SECONDS', 30 * 60)
+    if dedup and session_key and not caches['view_dedup'].add(f'postviews:seen:{session_key}:{post_id}', 1, timeout=dedup):
+        return pending_views(post_id)
+
+    state = caches['state']
+    key = count_key(post_id)
+    state.add(key, 0, timeout=None)
+    try:
+        pending = state.incr(key)
+    except ValueError:
+        # 증가 직전에 반영(삭제)된 경우
+        state.add(key, 1, timeout=None)
+        pending = 1
+    _register(post_id)
+    return pending
+
+
+def pending_views(post_id):
+    return caches['state'].get(count_key(post_id)) or 0
+
+
+def flush_views():
+    """대기 중인 조회수를 DB에 반영 → 반영한 조회 수 (다른 워커가 반영 중이면 None)"""
+    from apps.community.models import Post
+
+    state = caches['state']
+    if not state.add(LOCK_KEY, 1, timeout=LOCK_TIMEOUT):
+        return None
+    try:
+        post_ids = state.get(PENDING_KEY) or []
+        claimed = _claim(state, post_ids)
+
+        # 같은 증가량끼리 묶어 UPDATE 수 최소화
+        by_amount = defaultdict(list)
+        for post_id, amount in claimed.items():
+            by_amount[amount].append(post_id)
+
+        try:
+            with transaction.atomic():
+                for amount, ids in by_amount.items():
+                    Post.objects.filter(pk__in=ids).update(views=models.F('views') + amount)
+        except BaseException:
+            _restore(state, claimed)
+            raise
+
+        # 차감 후 0이 된 카운터 정리 (반영 중에 들어온 조회는 카운터·레지스트리에 남음)
+        keys = [count_key(post_id) for post_id in post_ids]
+        left = state.get_many(keys)
+        emptied = [key for key in keys if (left.get(key) or 0) <= 0]
+        state.delete_many(emptied)
+        _unregister({post_id for post_id in post_ids if count_key(post_id) in emptied})
+        return sum(claimed.values())
+    finally:
+        state.delete(LOCK_KEY)
+
+
+def _claim(state, post_ids):
+    """카운터에서 현재 값만큼 먼저 차감 → {게시글 id: 반영할 조회 수}"""
+    counts = state.get_many([count_key(post_id) for post_id in post_ids])
+    claimed = {}
+    for post_id in post_ids:
+        amount = counts.get(count_key(post_id)) or 0
+        if amount <= 0:
+            continue
+        try:
+            state.decr(count_key(post_id), amount)
+        except ValueError:
+            # 조회 후 사라진 카운터 - 차감하지 못한 값은 반영하지 않음 (이중 반영 방지)
+            continue
+        claimed[post_id] = amount
+    return claimed
+
+
+def _restore(state, claimed):
+    """DB 반영 실패 시 선점한 조회 수를 카운터에 되돌림"""
+    for post_id, amount in claimed.items():
+        key = count_key(post_id)
+        try:
+            state.incr(key, amount)
+        except ValueError:
+            if not state.add(key, amount, timeout=None):
+                state.incr(key, amount)
+        _register(post_id)
+
+
+def _register(post_id):
+    # 매 조회마다 확인하므로 등록이 빠진 id도 다음 조회 때 다시 등록됨
+    if post_id not in (caches['state'].get(PENDING_KEY) or []):
+        _update_registry(lambda post_ids: post_ids if post_id in post_ids else post_ids + [post_id])
+
+
+def _unregister(post_ids):
+    if post_ids:
+        _update_registry(lambda pending: [i for i in pending if i not in post_ids])
+
+
+def _update_registry(change):
+    """레지스트리 읽기-수정-쓰기를 잠금 키로 직렬화 (잠금을 못 얻으면 건너뜀 - 다음 조회 때 다시 등록)"""
+    state = caches['state']
+    for _ in range(50):
+        if state.add(REGISTRY_LOCK_KEY, 1, timeout=REGISTRY_LOCK_TIMEOUT):
+            try:
+                state.set(PENDING_KEY, change(state.get(PENDING_KEY) or []), timeout=None)
+            finally:
+                state.delete(REGISTRY_LOCK_KEY)
+            return True
+        time.sleep(0.01)
+    return False
@@ -0,0 +1,150 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db import DatabaseError
+from django.db.models import QuerySet
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from apps.common.pagination import KeysetPaginator
+from apps.community.models import Board, Post
+from apps.community.services import view_counter
+from apps.community.services.view_counter import count_key, flush_views, pending_views, record_view
+
+TEST_CACHES = {
+    alias: {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': f'community-test-{alias}'}
+    for alias in ('default', 'state', 'view_dedup', 'pages')
+}
+# collectstatic 없이 템플릿 렌더링
+TEST_STORAGES = {'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'}}
+
+
+@override_settings(CACHES=TEST_CACHES, STORAGES=TEST_STORAGES, POST_VIEW_DEDUP_SECONDS=60)
+class ViewCounterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        author = get_user_model().objects.create_user('writer', 'writer@example.com', 'pw-12345')
+        board = Board.objects.create(slug='free', name='자유')
+        cls.first, cls.second = (
+            Post.objects.create(board=board, author=author, title=title, content='내용')
+            for title in ('첫 글', '둘째 글')
+        )
+
+    def setUp(self):
+        for alias in TEST_CACHES:
+            caches[alias].clear()
+        self.state = caches['state']
+
+    def db_views(self, post):
+        return Post.objects.values_list('views', flat=True).get(pk=post.pk)
+
+    def test_record_view_buffers_without_db_write(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(record_view(self.first.pk), 1)
+            self.assertEqual(record_view(self.first.pk), 2)
+        self.assertEqual(self.state.get(view_counter.PENDING_KEY), [self.first.pk])
+        self.assertEqual(self.db_views(self.first), 0)
+
+    def test_same_session_counts_once(self):
+        record_view(self.first.pk, 'session-a')
+        self.assertEqual(record_view(self.first.pk, 'session-a'), 1)
+        self.assertEqual(record_view(self.first.pk, 'session-b'), 2)
+        self.assertEqual(record_view(self.second.pk, 'session-a'), 1)
+
+    def test_flush_applies_and_clears_counters(self):
+        for _ in range(3):
+            record_view(self.first.pk)
+        record_view(self.second.pk)
+        self.assertEqual(flush_views(), 4)
+        self.assertEqual((self.db_views(self.first), self.db_views(self.second)), (3, 1))
+        self.assertIsNone(self.state.get(count_key(self.first.pk)))
+        self.assertEqual(self.state.get(view_counter.PENDING_KEY), [])
+        self.assertEqual(flush_views(), 0)
+
+    def test_views_during_flush_stay_pending(self):
+        claim = view_counter._claim
+
+        def claim_then_view(state, post_ids):
+            claimed = claim(state, post_ids)
+            record_view(self.first.pk)
+            return claimed
+
+        record_view(self.first.pk)
+        record_view(self.first.pk)
+        with mock.patch.object(view_counter, '_claim', claim_then_view):
+            self.assertEqual(flush_views(), 2)
+        self.assertEqual(self.db_views(self.first), 2)
+        self.assertEqual(pending_views(self.first.pk), 1)
+        self.assertEqual(self.state.get(view_counter.PENDING_KEY), [self.first.pk])
+        self.assertEqual(flush_views(), 1)
+        self.assertEqual(self.db_views(self.first), 3)
+
+    def test_db_failure_restores_claimed_counts(self):
+        record_view(self.first.pk)
+        record_view(self.second.pk)
+        with mock.patch.object(QuerySet, 'update', side_effect=DatabaseError('locked')):
+            with self.assertRaises(DatabaseError):
+                flush_views()
+        self.assertEqual((pending_views(self.first.pk), pending_views(self.second.pk)), (1, 1))
+        self.assertEqual(sorted(self.state.get(view_counter.PENDING_KEY)), sorted([self.first.pk, self.second.pk]))
+        self.assertIsNone(self.state.get(view_counter.LOCK_KEY))
+        self.assertEqual(flush_views(), 2)
+        self.assertEqual((self.db_views(self.first), self.db_views(self.second)), (1, 1))
+
+    def test_vanished_counter_is_not_applied(self):
+        record_view(self.first.pk)
+        stale = {count_key(self.first.pk): 1, count_key(self.second.pk): 5}
+        self.state.set(view_counter.PENDING_KEY, [self.first.pk, self.second.pk], timeout=None)
+        # 목록을 읽은 뒤 second 카운터가 사라진 경우 - 차감하지 못한 값은 반영하지 않음
+        with mock.patch.object(self.state, 'get_many', side_effect=[stale, {}]):
+            self.assertEqual(flush_views(), 1)
+        self.assertEqual((self.db_views(self.first), self.db_views(self.second)), (1, 0))
+
+    def test_flush_lock(self):
+        record_view(self.first.pk)
+        self.state.add(view_counter.LOCK_KEY, 1)
+        self.assertIsNone(flush_views())
+        self.state.delete(view_counter.LOCK_KEY)
+        self.assertEqual(flush_views(), 1)
+
+    def test_registry_lock_is_respected(self):
+        self.state.add(view_counter.REGISTRY_LOCK_KEY, 1)
+        with mock.patch.object(view_counter.time, 'sleep') as sleep:
+            self.assertFalse(view_counter._update_registry(lambda ids: ids + [1]))
+        self.assertEqual(sleep.call_count, 50)
+        self.assertIsNone(self.state.get(view_counter.PENDING_KEY))
+        self.state.delete(view_counter.REGISTRY_LOCK_KEY)
+        self.assertTrue(view_counter._update_registry(lambda ids: ids + [1]))
+        self.assertEqual(self.state.get(view_counter.PENDING_KEY), [1])
+
+    def test_detail_view_shows_pending_without_flushing(self):
+        url = reverse('community:post_detail', args=[self.first.pk])
+        with mock.patch.object(view_counter, 'flush_views') as flush:
+            for _ in range(3):
+                response = self.client.get(url)
+        flush.assert_not_called()
+        self.assertEqual(response.context['post'].views, 3)
+        self.assertEqual(self.db_views(self.first), 0)
+
+
+class PostKeysetTests(TestCase):
+    def test_created_at_ties_are_split_by_id(self):
+        author = get_user_model().objects.create_user('writer', 'writer@example.com', 'pw-12345')
+        board = Board.objects.create(slug='free', name='자유')
+        posts = [Post.objects.create(board=board, author=author, title=str(i), content='내용') for i in range(5)]
+        # 같은 시각에 작성된 글이 페이지 경계에 걸려도 빠지거나 겹치지 않음
+        Post.objects.update(created_at=posts[0].created_at)
+        paginator = KeysetPaginator(Post.objects.all(), ['-created_at', '-id'], 2)
+
+        seen, cursor = [], None
+        while True:
+            page = paginator.page(cursor)
+            seen.extend(p.pk for p in page)
+            if not page.has_next:
+                break
+            cursor = page.next_cursor
+        self.assertEqual(seen, sorted((p.pk for p in posts), reverse=True))
+
+        back = paginator.page(page.previous_cursor)
+        self.assertEqual([p.pk for p in back], seen[2:4])
@@ -1,13 +1,16 @@
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.db import models
+from django.db import models, transaction
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse
 from django.views import View
 from django.views.generic import ListView, DetailView, CreateView, UpdateView, DeleteView
 
+from apps.common.pagination import KeysetPaginationMixin, approximate_count
+
 from .models import Board, Post, PostLike
 from .forms import PostForm, CommentForm
+from .services.view_counter import record_view
 
 
 class BoardListView(ListView):
@@ -19,15 +22,19 @@ class BoardListView(ListView):
         return Board.objects.annotate(post_count=models.Count('posts'))
 
 
-class PostListView(ListView):
+class PostListView(KeysetPaginationMixin, ListView):
     template_name = 'community/post_list.html'
     context_object_name = 'posts'
     paginate_by = 20
+    keyset_ordering = ['-created_at', '-id']
 
     def get_queryset(self):
         self.board = get_object_or_404(Board, slug=self.kwargs['board_slug'])
         return Post.objects.filter(board=self.board).select_related('author__profile')
 
+    def get_approximate_count(self, queryset):
+        return approximate_count(queryset)
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['board'] = self.board
@@ -41,8 +48,8 @@ class PostDetailView(DetailView):
 
     def get_object(self):
         post = super().get_object()
-        Post.objects.filter(pk=post.pk).update(views=models.F('views') + 1)
-        post.views += 1
+        # 조회수는 캐시에 모았다가 일괄 반영 - 화면에는 반영 대기분까지 더해 표시
+        post.views += record_view(post.pk, self.request.session.session_key)
         return post
 
     def get_context_data(self, **kwargs):
@@ -84,6 +91,12 @@ class PostUpdateView(LoginRequiredMixin, UpdateView):
     def get_queryset(self):
         return Post.objects.filter(author=self.request.user)
 
+    def form_valid(self, form):
+        # 조회수·좋아요·댓글 카운터는 다른 요청이 F()로 갱신하므로 덮어쓰지 않음
+        self.object = form.save(commit=False)
+        self.object.save(update_fields=['title', 'content', 'updated_at'])
+        return redirect(self.get_success_url())
+
     def get_success_url(self):
         return reverse('community:post_detail', kwargs={'pk': self.object.pk})
 
@@ -112,17 +125,24 @@ class CommentCreateView(LoginRequiredMixin, View):
             comment = form.save(commit=False)
             comment.post = post
             comment.author = request.user
-            comment.save()
+            with transaction.atomic():
+                comment.save()
+                Post.objects.filter(pk=pk).update(comment_count=models.F('comment_count') + 1)
         return redirect('community:post_detail', pk=pk)
 
 
 class PostLikeToggleView(LoginRequiredMixin, View):
     def post(self, request, pk):
         post = get_object_or_404(Post, pk=pk)
-        like, created = PostLike.objects.get_or_create(post=post, user=request.user)
-        if not created:
-            like.delete()
-            liked = False
-        else:
-            liked = True
-        return JsonResponse({'liked': liked, 'count': post.like_count})
+        with transaction.atomic():
+            like, created = PostLike.objects.get_or_create(post=post, user=request.user)
+            if created:
+                delta = 1
+            else:
+                # 동시 요청으로 이미 지워졌으면 0
+                delta = -like.delete()[0]
+            posts = Post.objects.filter(pk=pk)
+            if delta:
+                posts.update(like_count=models.F('like_count') + delta)
+            count = posts.values_list('like_count', flat=True).get()
+        return JsonResponse({'liked': created, 'count': count})
@@ -5,3 +5,6 @@ class LandingConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.landing'
     verbose_name = 'Landing Page'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,107 @@
+"""
+추천 전략 백테스트 엔진
+회차 N마다 N 이전 회차만으로 전략 입력(최근 30회 빈출/미출 번호)을 만들고 N회 당첨번호와의 일치 개수를 기록
+시드 여러 개를 프로세스 풀에 나눠 실행해 전략별 일치 개수 분포를 구함
+"""
+import random
+import statistics
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from apps.analysis.models import DrawResult
+from apps.analysis.services.number_stats import NUMBER_FIELDS
+from .lotto_stats import build_strategies, finalize_set
+
+RECENT_WINDOW = 30
+
+
+def load_history():
+    """회차순 [(회차, 정렬된 당첨번호 튜플)]"""
+    return [
+        (draw_no, tuple(sorted(nums)))
+        for draw_no, *nums in DrawResult.objects.order_by('draw_no').values_list('draw_no', *NUMBER_FIELDS)
+    ]
+
+
+def strategy_inputs(history, start_index):
+    """회차 인덱스별 (회차, 당첨번호 집합, 빈출 번호, 미출 번호) - 해당 회차 이전 30회만 사용"""
+    inputs = []
+    for i in range(max(start_index, RECENT_WINDOW), len(history)):
+        # 추천 화면과 같이 최신 회차부터 세어 동률 순서까지 일치시킴
+        counter = Counter()
+        for _, nums in reversed(history[i - RECENT_WINDOW:i]):
+            counter.update(nums)
+        hot_numbers = [n for n, _ in counter.most_common(20)]
+        cold_numbers = [n for n in range(1, 46) if counter.get(n, 0) <= 2]
+        draw_no, winning = history[i]
+        inputs.append((draw_no, frozenset(winning), hot_numbers, cold_numbers))
+    return inputs
+
+
+def run_backtest(history, seeds, workers=None, start_index=0):
+    """
+    전략별 백테스트 결과 {전략 이름: {...}}
+    seeds: 시드 목록, workers: 프로세스 수 (1이면 현재 프로세스에서 실행)
+    """
+    inputs = strategy_inputs(history, start_index)
+    if not inputs:
+        return {}
+
+    seeds = list(seeds)
+    workers = max(1, min(workers or 1, len(seeds)))
+    chunks = [seeds[i::workers] for i in range(workers)]
+
+    if workers == 1:
+        partials = [_backtest_seeds(inputs, chunks[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            partials = list(pool.map(_backtest_seeds, [inputs] * workers, chunks))
+
+    report = {}
+    for partial in partials:
+        for name, result in partial.items():
+            merged = report.setdefault(name, {'hits': [0] * 7, 'seed_means': []})
+            merged['hits'] = [a + b for a, b in zip(merged['hits'], result['hits'])]
+            merged['seed_means'].extend(result['seed_means'])
+
+    return {
+        name: _summarize(merged, inputs, len(seeds))
+        for name, merged in report.items()
+    }
+
+
+def _backtest_seeds(inputs, seeds):
+    """시드 묶음 하나 실행 - 프로세스 풀 작업 단위 (전략별 일치 개수 분포, 시드별 평균)"""
+    results = {}
+    for seed in seeds:
+        seed_hits = Counter()
+        for draw_no, winning, hot_numbers, cold_numbers in inputs:
+            rng = random.Random(seed * 1_000_003 + draw_no)
+            for name, gen_fn in build_strategies(rng, hot_numbers, cold_numbers):
+                hits = len(winning.intersection(finalize_set(gen_fn(), rng)))
+                result = results.setdefault(name, {'hits': [0] * 7, 'seed_means': []})
+                result['hits'][hits] += 1
+                seed_hits[name] += hits
+        for name, total in seed_hits.items():
+            results[name]['seed_means'].append(total / len(inputs))
+    return results
+
+
+def _summarize(merged, inputs, seed_count):
+    samples = sum(merged['hits'])
+    seed_means = merged['seed_means']
+    return {
+        'seeds': seed_count,
+        'first_draw_no': inputs[0][0],
+        'last_draw_no': inputs[-1][0],
+        'samples': samples,
+        'mean_hits': sum(k * c for k, c in enumerate(merged['hits'])) / samples,
+        'rate_3plus': sum(merged['hits'][3:]) / samples,
+        'hit_distribution': {str(k): c / samples for k, c in enumerate(merged['hits'])},
+        'seed_stats': {
+            'min': min(seed_means),
+            'median': statistics.median(seed_means),
+            'max': max(seed_means),
+            'stdev': statistics.pstdev(seed_means),
+        },
+    }
@@ -0,0 +1,26 @@
+"""
+새 회차 적재 직후 캐시 예열
+첫 방문자가 통계 재계산 비용을 치르지 않도록 회차 버전별 캐시와 비로그인 페이지 캐시를 미리 채움
+"""
+from apps.analysis.services.ticket_checker import load_draw_history
+from .lotto_stats import get_extended_ai_recommendations, get_landing_stats
+from .number_detail_cache import get_number_detail_table
+
+
+def warm_caches():
+    """통계 캐시 + 비로그인 페이지 캐시 예열 → 예열한 페이지 경로 목록"""
+    get_landing_stats()
+    get_extended_ai_recommendations(10)
+    get_number_detail_table()
+    load_draw_history()
+    return warm_pages()
+
+
+def warm_pages():
+    """AnonymousPageCacheMixin 페이지를 비로그인 요청으로 한 번 렌더링해 페이지 캐시에 저장"""
+    from apps.landing.views import LandingPageView
+
+    pages = {'/': LandingPageView}
+    for path, view_class in pages.items():
+        view_class.warm_page_cache(path)
+    return list(pages)
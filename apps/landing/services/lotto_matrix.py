@@ -0,0 +1,92 @@
+"""
+NumPy 기반 번호 출현 행렬 백엔드 (선택 의존성)
+전체 회차를 (회차 수 × 45) uint8 출현 행렬 X로 적재해
+윈도우 빈도·동반 출현(X.T @ X)·미출현 간격·트렌드를 배열 연산으로 계산
+"""
+from django.conf import settings
+
+try:
+    import numpy as np
+except ImportError:  # numpy 미설치 시 순수 Python 경로 사용
+    np = None
+
+
+def use_numpy_backend():
+    """LOTTO_STATS_BACKEND 설정 + numpy 설치 여부로 백엔드 결정"""
+    backend = getattr(settings, 'LOTTO_STATS_BACKEND', 'auto')
+    if backend == 'python':
+        return False
+    if backend == 'numpy' and np is None:
+        raise ImportError('LOTTO_STATS_BACKEND=numpy 설정에는 numpy가 필요합니다: pip install numpy')
+    return np is not None
+
+
+def trend_label(last_30, last_100, total_draws):
+    """최근 30회 vs 100회 출현율 비교 → increasing / decreasing / stable / unknown"""
+    if total_draws < 100:
+        return 'unknown'
+    rate_30 = last_30 / 30
+    rate_100 = last_100 / 100
+    if rate_30 > rate_100 * 1.2:
+        return 'increasing'
+    if rate_30 < rate_100 * 0.8:
+        return 'decreasing'
+    return 'stable'
+
+
+class DrawMatrix:
+    """최신순 회차 × 45 번호 출현 행렬"""
+
+    def __init__(self, draw_nos, incidence):
+        self.draw_nos = draw_nos
+        self.X = incidence
+        self._frequencies = {}
+        self._co_occurrence = None
+
+    @classmethod
+    def from_rows(cls, rows):
+        """DrawRow(최신순) 목록 → 출현 행렬"""
+        n_draws = len(rows)
+        draw_nos = np.fromiter((r.draw_no for r in rows), dtype=np.int64, count=n_draws)
+        X = np.zeros((n_draws, 45), dtype=np.uint8)
+        if n_draws:
+            idx = np.array([r.numbers for r in rows], dtype=np.intp) - 1
+            X[np.arange(n_draws)[:, None], idx] = 1
+        return cls(draw_nos, X)
+
+    @property
+    def total_draws(self):
+        return self.X.shape[0]
+
+    def frequencies(self, window=None):
+        """최근 window회 번호별 출현 횟수 (길이 45 배열, None이면 전체)"""
+        if window not in self._frequencies:
+            self._frequencies[window] = self.X[:window].sum(axis=0, dtype=np.int64)
+        return self._frequencies[window]
+
+    def co_occurrence(self):
+        """45×45 동반 출현 행렬 (대각선 = 번호별 전체 출현 횟수)"""
+        if self._co_occurrence is None:
+            # 정수 matmul은 BLAS를 타지 않아 느리므로 float64로 계산 후 정수 변환 (2^53 미만 정확)
+            Xf = self.X.astype(np.float64)
+            self._co_occurrence = (Xf.T @ Xf).astype(np.int64)
+        return self._co_occurrence
+
+    def gaps(self):
+        """번호별 마지막 출현 이후 지난 회차 수 (미출현 -1)"""
+        seen = self.X.any(axis=0)
+        first = self.X.argmax(axis=0)
+        return np.where(seen, first, -1)
+
+    def top_co_occurrence(self, number, k=5):
+        """number와 함께 가장 많이 나온 번호 k개 [(번호, 횟수)] - 동률은 작은 번호 우선"""
+        row = self.co_occurrence()[number - 1].copy()
+        row[number - 1] = 0
+        order = np.lexsort((np.arange(45), -row))[:k]
+        return [(int(i) + 1, int(row[i])) for i in order if row[i] > 0]
+
+    def trends(self):
+        """번호별 트렌드 라벨 목록 (인덱스 0 = 1번)"""
+        last_30 = self.frequencies(30)
+        last_100 = self.frequencies(100)
+        return [trend_label(int(a), int(b), self.total_draws) for a, b in zip(last_30, last_100)]
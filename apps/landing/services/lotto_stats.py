@@ -1,11 +1,33 @@
 """
 DB 기반 로또 통계 계산 서비스
+각 함수는 StatsSnapshot을 받으면 추가 쿼리 없이 스냅샷에서 계산
 """
 from collections import Counter
 
-from django.db.models import Avg, Sum
+from apps.analysis.cache import draw_cached
+from apps.analysis.models import DrawResult, NumberStat, StrategyBacktest
+from apps.analysis.services.number_stats import WINDOWS
+from .lotto_matrix import trend_label
+from .stats_snapshot import StatsSnapshot
 
-from apps.analysis.models import DrawResult
+
+def get_stats_snapshot():
+    """전체 회차 통계 스냅샷 (쿼리 1회)"""
+    return StatsSnapshot.load()
+
+
+@draw_cached('landing_stats', daily=True)
+def get_landing_stats():
+    """랜딩 페이지 통계 묶음 - 스냅샷 1개로 계산해 회차 버전·날짜별 캐시 (데이터 없으면 None)"""
+    snapshot = get_stats_snapshot()
+    if snapshot.is_empty:
+        return None
+    return {
+        'current_draw': get_current_draw_data(snapshot),
+        'number_stats': get_number_stats(snapshot=snapshot),
+        'ai_recommendations': get_ai_recommendations_from_stats(snapshot),
+        'recent_draws': get_recent_draws(5, snapshot),
+    }
 
 
 def get_latest_draw():
@@ -13,16 +35,16 @@ def get_latest_draw():
     return DrawResult.objects.order_by('-draw_no').first()
 
 
-def get_current_draw_data():
+def get_current_draw_data(snapshot=None):
     """랜딩 페이지용 최신 당첨 데이터"""
-    latest = get_latest_draw()
+    latest = snapshot.latest if snapshot is not None else get_latest_draw()
     if not latest:
         return None
 
     return {
         'draw_no': latest.draw_no,
         'draw_date': latest.draw_date.strftime('%Y-%m-%d'),
-        'winning_numbers': latest.numbers,
+        'winning_numbers': list(latest.numbers),
         'bonus_number': latest.bonus_number,
         'first_prize': latest.first_prize_amount,
         'first_prize_winners': latest.first_prize_winners,
@@ -30,51 +52,79 @@ def get_current_draw_data():
     }
 
 
-def get_number_stats(recent_10=10, recent_30=30, recent_100=100):
+@draw_cached('number_stats')
+def get_number_stats(recent_10=10, recent_30=30, recent_100=100, snapshot=None):
     """1~45번 각 번호별 출현 빈도"""
-    stats = {}
-
-    for period, label in [(recent_10, 'freq_10'), (recent_30, 'freq_30'),
-                           (recent_100, 'freq_100')]:
-        draws = DrawResult.objects.order_by('-draw_no')[:period]
-        counter = Counter()
-        for d in draws:
-            for n in d.numbers:
-                counter[n] += 1
-
-        for num in range(1, 46):
-            if num not in stats:
-                stats[num] = {}
-            stats[num][label] = counter.get(num, 0)
-
-    # 전체 출현 횟수도 추가
-    all_draws = DrawResult.objects.all()
-    total_counter = Counter()
-    for d in all_draws:
-        for n in d.numbers:
-            total_counter[n] += 1
-
-    for num in range(1, 46):
-        stats[num]['freq_total'] = total_counter.get(num, 0)
+    if snapshot is not None:
+        windows = [(recent_10, 'freq_10'), (recent_30, 'freq_30'), (recent_100, 'freq_100')]
+        if snapshot.matrix is not None:
+            return _number_stats_from_matrix(snapshot.matrix, windows)
+        return {
+            num: {
+                **{label: snapshot.frequencies(period).get(num, 0) for period, label in windows},
+                'freq_total': snapshot.freq_total.get(num, 0),
+                'gap': snapshot.gap(num),
+            }
+            for num in range(1, 46)
+        }
 
-    return stats
+    # 기본 윈도우(10/30/100회)는 집계 테이블에서 45행만 읽음
+    if (recent_10, recent_30, recent_100) == WINDOWS:
+        stored = _stored_number_stats()
+        if stored is not None:
+            gaps = _stored_gaps(stored)
+            return {
+                s.number: {
+                    'freq_10': s.freq_10,
+                    'freq_30': s.freq_30,
+                    'freq_100': s.freq_100,
+                    'freq_total': s.total_count,
+                    'gap': gaps.get(s.number),
+                }
+                for s in stored
+            }
+
+    return get_number_stats(recent_10, recent_30, recent_100, snapshot=get_stats_snapshot())
+
+
+def _number_stats_from_matrix(matrix, windows):
+    """numpy 백엔드: 윈도우 빈도·간격을 배열 연산으로 계산"""
+    freqs = [(label, matrix.frequencies(period)) for period, label in windows]
+    total = matrix.frequencies()
+    gaps = matrix.gaps()
+    return {
+        num: {
+            **{label: int(freq[num - 1]) for label, freq in freqs},
+            'freq_total': int(total[num - 1]),
+            'gap': int(gaps[num - 1]) if gaps[num - 1] >= 0 else None,
+        }
+        for num in range(1, 46)
+    }
 
 
-def get_top_numbers(n=10):
+@draw_cached('top_numbers')
+def get_top_numbers(n=10, snapshot=None):
     """최다 출현 번호 Top N"""
-    counter = Counter()
-    for d in DrawResult.objects.all():
-        for num in d.numbers:
-            counter[num] += 1
-    return counter.most_common(n)
+    if snapshot is None:
+        stored = _stored_number_stats()
+        if stored is not None:
+            ranked = sorted(stored, key=lambda s: -s.total_count)
+            return [(s.number, s.total_count) for s in ranked[:n] if s.total_count]
+        snapshot = get_stats_snapshot()
+    return snapshot.freq_total.most_common(n)
 
 
-def get_cold_numbers(n=10):
+@draw_cached('cold_numbers')
+def get_cold_numbers(n=10, snapshot=None):
     """최소 출현 번호 Top N"""
-    counter = Counter()
-    for d in DrawResult.objects.all():
-        for num in d.numbers:
-            counter[num] += 1
+    if snapshot is None:
+        stored = _stored_number_stats()
+        if stored is not None:
+            ranked = sorted(stored, key=lambda s: s.total_count)
+            return [(s.number, s.total_count) for s in ranked[:n]]
+        snapshot = get_stats_snapshot()
+
+    counter = Counter(snapshot.freq_total)
 
     # 45번까지 없는 번호는 0으로 채우기
     for i in range(1, 46):
@@ -84,14 +134,38 @@ def get_cold_numbers(n=10):
     return counter.most_common()[:-n-1:-1]
 
 
-def get_recent_draws(count=5):
+def _stored_number_stats():
+    """집계 테이블(NumberStat) 45행, 미구축 상태면 None"""
+    stored = list(NumberStat.objects.order_by('number'))
+    if len(stored) != 45:
+        return None
+    return stored
+
+
+def _stored_gaps(stored):
+    """
+    집계 테이블의 마지막 출현 회차 → 미출현 간격 {번호: 이후 회차 수}
+    스냅샷 gap과 같은 기준(회차 번호 차가 아닌 그 뒤 회차 수) - 가장 오래된 마지막 출현 이후 회차 번호만 1회 조회
+    """
+    seen = [s.last_draw_no for s in stored if s.last_draw_no is not None]
+    if not seen:
+        return {}
+    draw_nos = DrawResult.objects.filter(draw_no__gte=min(seen)).order_by('-draw_no').values_list('draw_no', flat=True)
+    index = {draw_no: i for i, draw_no in enumerate(draw_nos)}
+    return {s.number: index.get(s.last_draw_no) for s in stored}
+
+
+def get_recent_draws(count=5, snapshot=None):
     """최근 N회차 결과 목록"""
-    draws = DrawResult.objects.order_by('-draw_no')[:count]
+    if snapshot is not None:
+        draws = snapshot.rows[:count]
+    else:
+        draws = DrawResult.objects.order_by('-draw_no')[:count]
     return [
         {
             'draw_no': d.draw_no,
             'draw_date': d.draw_date.strftime('%Y-%m-%d'),
-            'numbers': d.numbers,
+            'numbers': list(d.numbers),
             'bonus_number': d.bonus_number,
             'first_prize': d.first_prize_amount,
             'first_prize_winners': d.first_prize_winners,
@@ -100,13 +174,16 @@ def get_recent_draws(count=5):
     ]
 
 
-def get_number_detail_stats(number):
+def get_number_detail_stats(number, snapshot=None):
     """특정 번호(1~45)의 상세 통계"""
-    all_draws = DrawResult.objects.order_by('-draw_no')
-    total_draws = all_draws.count()
+    if snapshot is None:
+        snapshot = get_stats_snapshot()
+    if snapshot.matrix is not None:
+        return _number_detail_from_matrix(number, snapshot)
+
+    all_draws = snapshot.rows
 
     appearances = {'total': 0, 'last_10': 0, 'last_30': 0, 'last_100': 0}
-    last_appearance_draw = None
     co_occurrence = Counter()
 
     for i, d in enumerate(all_draws):
@@ -119,42 +196,84 @@ def get_number_detail_stats(number):
                 appearances['last_30'] += 1
             if i < 100:
                 appearances['last_100'] += 1
-            if last_appearance_draw is None:
-                last_appearance_draw = d
             for n in nums:
                 if n != number:
                     co_occurrence[n] += 1
 
-    rate_30 = appearances['last_30'] / 30 if total_draws >= 30 else None
-    rate_100 = appearances['last_100'] / 100 if total_draws >= 100 else None
-
-    if rate_30 is not None and rate_100 is not None:
-        if rate_30 > rate_100 * 1.2:
-            trend = 'increasing'
-        elif rate_30 < rate_100 * 0.8:
-            trend = 'decreasing'
-        else:
-            trend = 'stable'
-    else:
-        trend = 'unknown'
-
-    top_co = co_occurrence.most_common(5)
-
+    # 동률은 작은 번호 우선 (numpy 백엔드와 동일한 순서)
+    top_co = sorted(co_occurrence.items(), key=lambda item: (-item[1], item[0]))[:5]
+
+    return _number_detail_dict(
+        number, snapshot, appearances['total'],
+        appearances['last_10'], appearances['last_30'], appearances['last_100'], top_co,
+    )
+
+
+@draw_cached('number_detail_table')
+def get_all_number_detail_stats(snapshot=None):
+    """1~45번 전체 상세 통계 - 동반 출현 45×45 행렬을 한 번만 계산"""
+    if snapshot is None:
+        snapshot = get_stats_snapshot()
+    if snapshot.matrix is not None:
+        return {n: _number_detail_from_matrix(n, snapshot) for n in range(1, 46)}
+
+    co_matrix = _co_occurrence_matrix(snapshot.rows)
+    freq_10, freq_30, freq_100 = (snapshot.frequencies(w) for w in (10, 30, 100))
+    details = {}
+    for number in range(1, 46):
+        row = co_matrix[number]
+        co_counts = [(n, row[n]) for n in range(1, 46) if n != number and row[n] > 0]
+        top_co = sorted(co_counts, key=lambda item: (-item[1], item[0]))[:5]
+        details[number] = _number_detail_dict(
+            number, snapshot, row[number],
+            freq_10.get(number, 0), freq_30.get(number, 0), freq_100.get(number, 0), top_co,
+        )
+    return details
+
+
+def _co_occurrence_matrix(rows):
+    """46×46 동반 출현 횟수 (인덱스 = 번호, 대각선 = 출현 횟수)"""
+    co_matrix = [[0] * 46 for _ in range(46)]
+    for d in rows:
+        for a in d.numbers:
+            row = co_matrix[a]
+            for b in d.numbers:
+                row[b] += 1
+    return co_matrix
+
+
+def _number_detail_from_matrix(number, snapshot):
+    """numpy 백엔드: 출현 행렬에서 번호 상세 통계 계산"""
+    matrix = snapshot.matrix
+    col = number - 1
+    return _number_detail_dict(
+        number, snapshot,
+        int(matrix.frequencies()[col]),
+        int(matrix.frequencies(10)[col]),
+        int(matrix.frequencies(30)[col]),
+        int(matrix.frequencies(100)[col]),
+        matrix.top_co_occurrence(number, 5),
+    )
+
+
+def _number_detail_dict(number, snapshot, total, last_10, last_30, last_100, top_co):
+    last_appearance_draw = snapshot.last_seen_row(number)
     return {
         'number': number,
-        'total_appearances': appearances['total'],
-        'total_draws': total_draws,
-        'last_10': appearances['last_10'],
-        'last_30': appearances['last_30'],
-        'last_100': appearances['last_100'],
+        'total_appearances': total,
+        'total_draws': snapshot.total_draws,
+        'last_10': last_10,
+        'last_30': last_30,
+        'last_100': last_100,
         'last_draw_no': last_appearance_draw.draw_no if last_appearance_draw else None,
         'last_draw_date': last_appearance_draw.draw_date.strftime('%Y-%m-%d') if last_appearance_draw else None,
-        'trend': trend,
+        'trend': trend_label(last_30, last_100, snapshot.total_draws),
         'co_occurrence': [{'number': n, 'count': c} for n, c in top_co],
     }
 
 
-def get_extended_ai_recommendations(count=10):
+@draw_cached('extended_recommendations', daily=True)
+def get_extended_ai_recommendations(count=10, snapshot=None):
     """10세트 다양한 전략별 AI 추천 번호 생성"""
     import random
     from datetime import date
@@ -162,18 +281,35 @@ def get_extended_ai_recommendations(count=10):
     today_seed = date.today().toordinal()
     rng = random.Random(today_seed)
 
-    recent_draws = DrawResult.objects.order_by('-draw_no')[:30]
-    recent_counter = Counter()
-    for d in recent_draws:
-        for n in d.numbers:
-            recent_counter[n] += 1
+    if snapshot is None:
+        snapshot = get_stats_snapshot()
+
+    hot_numbers = snapshot.hot_numbers(30, 20)
+    cold_numbers = snapshot.cold_numbers(30, 2)
+    strategies = build_strategies(rng, hot_numbers, cold_numbers)
+    backtests = _backtest_results()
+
+    results = []
+    for i, (name, gen_fn) in enumerate(strategies[:count]):
+        nums = finalize_set(gen_fn(), rng)
+        backtest = backtests.get(name)
+        results.append({
+            'set_name': f'AI 추천 {i + 1}세트',
+            'numbers': nums,
+            # 백테스트 결과가 있으면 무작위 대비 적중 성능, 없으면 기존 방식
+            'confidence': backtest_confidence(backtest) if backtest else rng.randint(60, 85),
+            'strategy': name,
+            'backtest': backtest,
+        })
+    return results
+
 
-    hot_numbers = [n for n, _ in recent_counter.most_common(20)]
-    cold_numbers = [n for n in range(1, 46) if recent_counter.get(n, 0) <= 2]
+def build_strategies(rng, hot_numbers, cold_numbers):
+    """전략 이름 + 번호 생성 함수 목록 (추천·백테스트 공용)"""
     all_nums = list(range(1, 46))
     primes = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43]
 
-    strategies = [
+    return [
         ('빈출번호 조합', lambda: sorted(rng.sample(hot_numbers[:12], 6))),
         ('홀짝 3:3 균형', lambda: sorted(rng.sample([n for n in all_nums if n % 2 == 1], 3) + rng.sample([n for n in all_nums if n % 2 == 0], 3))),
         ('미출현 콜드넘버', lambda: sorted(rng.sample(cold_numbers, min(3, len(cold_numbers))) + rng.sample(hot_numbers[:10], max(3, 6 - min(3, len(cold_numbers)))))),
@@ -186,23 +322,37 @@ def get_extended_ai_recommendations(count=10):
         ('황금비율 간격 조합', lambda: _golden_ratio_set(rng)),
     ]
 
-    results = []
-    for i, (name, gen_fn) in enumerate(strategies[:count]):
-        nums = gen_fn()
-        # 중복 제거 보장
-        nums = sorted(set(nums))
-        while len(nums) < 6:
-            extra = rng.choice(all_nums)
-            if extra not in nums:
-                nums.append(extra)
-        nums = sorted(nums[:6])
-        results.append({
-            'set_name': f'AI 추천 {i + 1}세트',
-            'numbers': nums,
-            'confidence': rng.randint(60, 85),
-            'strategy': name,
-        })
-    return results
+
+def finalize_set(nums, rng):
+    """중복 제거 후 부족하면 채워 정렬된 6개 번호로"""
+    nums = sorted(set(nums))
+    while len(nums) < 6:
+        extra = rng.randint(1, 45)
+        if extra not in nums:
+            nums.append(extra)
+    return sorted(nums[:6])
+
+
+# 무작위 6개 번호의 기대 일치 개수 (6 × 6/45)
+RANDOM_MEAN_HITS = 0.8
+
+
+def backtest_confidence(backtest):
+    """백테스트 평균 일치 개수 → 신뢰도 (50 = 무작위 수준)"""
+    return max(1, min(99, round(50 * backtest['mean_hits'] / RANDOM_MEAN_HITS)))
+
+
+def _backtest_results():
+    """전략별 최근 백테스트 요약 {전략 이름: {...}}"""
+    return {
+        b.strategy: {
+            'mean_hits': b.mean_hits,
+            'rate_3plus': b.rate_3plus,
+            'rate_3plus_percent': round(b.rate_3plus * 100, 1),
+            'samples': b.samples,
+        }
+        for b in StrategyBacktest.objects.all()
+    }
 
 
 def _consecutive_set(rng):
@@ -238,7 +388,7 @@ def _golden_ratio_set(rng):
     return sorted(nums[:6])
 
 
-def get_ai_recommendations_from_stats():
+def get_ai_recommendations_from_stats(snapshot=None):
     """DB 통계 기반 AI 추천 번호 3세트 생성"""
     import random
     from datetime import date
@@ -247,21 +397,12 @@ def get_ai_recommendations_from_stats():
     today_seed = date.today().toordinal()
     rng = random.Random(today_seed)
 
+    if snapshot is None:
+        snapshot = get_stats_snapshot()
+
     # 최근 10회 빈출번호
-    recent_draws = DrawResult.objects.order_by('-draw_no')[:10]
-    recent_counter = Counter()
-    for d in recent_draws:
-        for n in d.numbers:
-            recent_counter[n] += 1
-
-    hot_numbers = [n for n, _ in recent_counter.most_common(15)]
-    cold_numbers = [n for n in range(1, 46) if recent_counter.get(n, 0) <= 1]
-
-    # 전체 통계
-    total_counter = Counter()
-    for d in DrawResult.objects.all():
-        for n in d.numbers:
-            total_counter[n] += 1
+    hot_numbers = snapshot.hot_numbers(10, 15)
+    cold_numbers = snapshot.cold_numbers(10, 1)
 
     # Set 1: 빈출번호 조합
     set1 = sorted(rng.sample(hot_numbers[:12], 6))
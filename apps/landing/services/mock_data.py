@@ -197,7 +197,7 @@ COMMUNITY_POSTS = [
         'title': '이번 주 1등 당첨 후기 공유합니다!',
         'author': '행운의별',
         'views': 12847,
-        'comments': 234,
+        'comment_count': 234,
         'category': 'story',
         'time_ago': '2시간 전',
     },
@@ -205,7 +205,7 @@ COMMUNITY_POSTS = [
         'title': '공동구매 15명 모집 중 (1인 5천원)',
         'author': '모임장_금손',
         'views': 3421,
-        'comments': 89,
+        'comment_count': 89,
         'category': 'group',
         'time_ago': '5시간 전',
     },
@@ -213,7 +213,7 @@ COMMUNITY_POSTS = [
         'title': '최근 5회 패턴 분석 - 홀짝 비율의 비밀',
         'author': '통계왕',
         'views': 8932,
-        'comments': 167,
+        'comment_count': 167,
         'category': 'analysis',
         'time_ago': '1일 전',
     },
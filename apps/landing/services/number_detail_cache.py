@@ -0,0 +1,42 @@
+"""
+번호 상세 통계 메모리 캐시
+1~45번 상세 통계(동반 출현 행렬·출현 횟수·마지막 출현)를 한 번에 계산해 프로세스 메모리에 보관
+회차 데이터 버전이 바뀔 때만 공유 캐시(또는 DB)에서 다시 읽음
+"""
+import threading
+
+from apps.analysis.cache import get_draw_version
+from .lotto_stats import get_all_number_detail_stats
+
+_lock = threading.Lock()
+_cache = (None, None)  # (캐시 키, {번호: 상세 통계})
+
+
+def get_number_detail_table():
+    """{번호: 상세 통계} 전체 테이블 (캐시)"""
+    global _cache
+    key = _current_key()
+    cached_key, details = _cache
+    if details is None or cached_key != key:
+        with _lock:
+            cached_key, details = _cache
+            if details is None or cached_key != key:
+                details = get_all_number_detail_stats()
+                _cache = (key, details)
+    return details
+
+
+def get_cached_number_detail(number):
+    """특정 번호 상세 통계 (캐시)"""
+    return get_number_detail_table()[number]
+
+
+def clear_number_detail_cache():
+    global _cache
+    with _lock:
+        _cache = (None, None)
+
+
+def _current_key():
+    """캐시 키 = 회차 데이터 버전"""
+    return get_draw_version()
@@ -0,0 +1,118 @@
+"""
+랜딩 통계 스냅샷
+전체 회차를 values_list 쿼리 1회로 읽어 윈도우별 빈도·미출현 간격·최근 회차를 한 번에 계산
+"""
+from collections import Counter, namedtuple
+from functools import cached_property
+
+from apps.analysis.models import DrawResult
+from apps.analysis.services.number_stats import NUMBER_FIELDS, WINDOWS
+from .lotto_matrix import DrawMatrix, use_numpy_backend
+
+DrawRow = namedtuple('DrawRow', [
+    'draw_no', 'draw_date', 'numbers', 'bonus_number',
+    'first_prize_amount', 'first_prize_winners', 'total_sales',
+])
+
+ROW_FIELDS = (
+    'draw_no', 'draw_date', 'bonus_number',
+    'first_prize_amount', 'first_prize_winners', 'total_sales',
+    *NUMBER_FIELDS,
+)
+
+
+class StatsSnapshot:
+    """최신순 회차 목록과 그로부터 계산한 번호별 집계"""
+
+    def __init__(self, rows, use_numpy=None):
+        # rows: 최신순 DrawRow 목록, use_numpy: 백엔드 지정 (None이면 LOTTO_STATS_BACKEND 설정)
+        self.rows = rows
+        self.total_draws = len(rows)
+        self.use_numpy = use_numpy
+
+    @cached_property
+    def _aggregates(self):
+        """순수 Python 경로: 한 번의 순회로 윈도우 빈도·전체 빈도·마지막 출현 계산"""
+        freq = {size: Counter() for size in WINDOWS}
+        freq_total = Counter()
+        last_seen = {}  # 번호 → 마지막 출현 행 인덱스 (0 = 최신 회차)
+
+        for i, row in enumerate(self.rows):
+            for size, counter in freq.items():
+                if i < size:
+                    counter.update(row.numbers)
+            freq_total.update(row.numbers)
+            for n in row.numbers:
+                last_seen.setdefault(n, i)
+        return freq, freq_total, last_seen
+
+    @property
+    def freq(self):
+        return self._aggregates[0]
+
+    @property
+    def freq_total(self):
+        return self._aggregates[1]
+
+    @cached_property
+    def last_seen(self):
+        if self.matrix is not None:
+            gaps = self.matrix.gaps()
+            return {n: int(gaps[n - 1]) for n in range(1, 46) if gaps[n - 1] >= 0}
+        return self._aggregates[2]
+
+    @classmethod
+    def load(cls):
+        """DB에서 전체 회차를 한 번에 읽어 스냅샷 생성"""
+        qs = DrawResult.objects.order_by('-draw_no').values_list(*ROW_FIELDS)
+        rows = [
+            DrawRow(draw_no, draw_date, tuple(sorted(nums)), bonus,
+                    first_prize, first_winners, total_sales)
+            for draw_no, draw_date, bonus, first_prize, first_winners, total_sales, *nums
+            in qs.iterator()
+        ]
+        return cls(rows)
+
+    @cached_property
+    def matrix(self):
+        """numpy 백엔드 사용 시 출현 행렬 (미사용 시 None)"""
+        use_numpy = use_numpy_backend() if self.use_numpy is None else self.use_numpy
+        if not use_numpy:
+            return None
+        return DrawMatrix.from_rows(self.rows)
+
+    @property
+    def is_empty(self):
+        return not self.rows
+
+    @property
+    def latest(self):
+        return self.rows[0] if self.rows else None
+
+    def frequencies(self, window=None):
+        """최근 window회 번호별 출현 Counter (None이면 전체)"""
+        if window is None:
+            return self.freq_total
+        if window not in self.freq:
+            counter = Counter()
+            for row in self.rows[:window]:
+                counter.update(row.numbers)
+            self.freq[window] = counter
+        return self.freq[window]
+
+    def gap(self, number):
+        """마지막 출현 이후 지난 회차 수 (미출현이면 None)"""
+        return self.last_seen.get(number)
+
+    def last_seen_row(self, number):
+        index = self.last_seen.get(number)
+        return self.rows[index] if index is not None else None
+
+    def hot_numbers(self, window, n):
+        """최근 window회 빈출 번호 상위 n개"""
+        return [num for num, _ in self.frequencies(window).most_common(n)]
+
+    def cold_numbers(self, window, max_count):
+        """최근 window회 출현 횟수가 max_count 이하인 번호"""
+        counter = self.frequencies(window)
+        return [num for num in range(1, 46) if counter.get(num, 0) <= max_count]
@@ -0,0 +1,11 @@
+from django.dispatch import receiver
+
+from apps.analysis.signals import draws_ingested
+
+from .services.cache_warmup import warm_caches
+
+
+@receiver(draws_ingested)
+def warm_landing_caches(sender, **kwargs):
+    """회차 일괄 적재 후 랜딩 통계·페이지 캐시 예열"""
+    warm_caches()
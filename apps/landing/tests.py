@@ -0,0 +1,237 @@
+import gzip
+import json
+import random
+from datetime import date, timedelta
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from apps.analysis.models import DrawResult
+from apps.analysis.services import history_export
+from apps.analysis.services.ingest import build_draw, upsert_draws
+from apps.analysis.services.ticket_checker import ANONYMOUS_MAX_TICKETS, MAX_TICKETS
+from apps.landing.services import backtest
+from apps.landing.services.lotto_stats import (
+    RANDOM_MEAN_HITS, backtest_confidence, get_all_number_detail_stats, get_number_detail_stats, get_number_stats,
+)
+from apps.landing.services.stats_snapshot import DrawRow, StatsSnapshot
+
+TEST_CACHES = {
+    alias: {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': f'landing-test-{alias}'}
+    for alias in ('default', 'state', 'view_dedup', 'pages')
+}
+# collectstatic 없이 draws_ingested 후처리(페이지 예열) 렌더링
+TEST_STORAGES = {'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'}}
+
+
+@override_settings(CACHES=TEST_CACHES)
+class DrawExportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        first = date(2002, 12, 7)
+        DrawResult.objects.bulk_create([
+            build_draw({
+                'draw_no': draw_no,
+                'draw_date': first + timedelta(weeks=draw_no - 1),
+                'numbers': [1 + draw_no % 7, 10, 20, 30, 40, 45],
+                'bonus_number': 9,
+            })
+            for draw_no in range(1, 26)
+        ])
+
+    def setUp(self):
+        self.url = reverse('landing:draw_export')
+        # 배치 경계를 여러 번 넘도록
+        patcher = mock.patch.object(history_export, 'BATCH_SIZE', 10)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_wsgi_streams_batches(self):
+        response = self.client.get(self.url, {'format': 'bin'})
+        self.assertEqual(response.status_code, 200)
+        chunks = list(response.streaming_content)
+        self.assertEqual([len(c) for c in chunks], [90, 90, 45])
+        rows = history_export.unpack_binary(b''.join(chunks))
+        self.assertEqual([r[0] for r in rows], list(range(1, 26)))
+
+    async def test_asgi_streams_async_batches(self):
+        response = await self.async_client.get(self.url, {'format': 'ndjson'})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.is_async)
+        chunks = [chunk async for chunk in response.streaming_content]
+        self.assertEqual(len(chunks), 3)
+        expected = await sync_to_async(lambda: b''.join(history_export.iter_export('ndjson')))()
+        self.assertEqual(b''.join(chunks), expected)
+
+    def test_csv_header_and_gzip(self):
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        body = gzip.decompress(b''.join(response.streaming_content)).decode()
+        lines = body.splitlines()
+        self.assertTrue(lines[0].startswith('\ufeff회차,'))
+        self.assertEqual(len(lines), 26)
+
+    def test_conditional_get(self):
+        etag = self.client.get(self.url, {'format': 'csv'})['ETag']
+        self.assertIn('draws-25-csv', etag)
+        response = self.client.get(self.url, {'format': 'csv'}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_unsupported_format_has_no_validators(self):
+        response = self.client.get(self.url, {'format': 'xml'})
+        self.assertEqual(response.status_code, 400)
+        self.assertNotIn('ETag', response)
+        self.assertNotIn('Last-Modified', response)
+
+
+@override_settings(CACHES=TEST_CACHES, STORAGES=TEST_STORAGES)
+class NumberStatsShapeTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        first = date(2002, 12, 7)
+        # 회차 번호 사이에 빈 회차(4회)가 있어도 간격은 그 뒤 회차 수
+        upsert_draws([
+            {'draw_no': draw_no, 'draw_date': first + timedelta(weeks=draw_no - 1),
+             'numbers': [draw_no, 11, 12, 13, 14, 15], 'bonus_number': 45}
+            for draw_no in (1, 2, 3, 5, 6)
+        ])
+
+    def test_stored_and_snapshot_paths_agree(self):
+        for backend in ('python', 'numpy'):
+            with self.subTest(backend=backend), override_settings(LOTTO_STATS_BACKEND=backend):
+                from_snapshot = get_number_stats.uncached(snapshot=StatsSnapshot.load())
+                self.assertEqual(get_number_stats.uncached(), from_snapshot)
+        stored = get_number_stats.uncached()
+        self.assertEqual(stored[11]['gap'], 0)
+        self.assertEqual(stored[2]['gap'], 3)
+        self.assertIsNone(stored[44]['gap'])
+
+
+class StatsBackendTests(SimpleTestCase):
+    """numpy 출현 행렬 백엔드와 순수 Python 경로가 같은 결과를 내는지"""
+
+    def snapshots(self, size, seed=0):
+        rng = random.Random(seed)
+        rows = [
+            DrawRow(draw_no, date(2002, 12, 7) + timedelta(weeks=draw_no - 1),
+                    tuple(sorted(rng.sample(range(1, 46), 6))), rng.randint(1, 45), 0, 0, 0)
+            for draw_no in range(size, 0, -1)
+        ]
+        return StatsSnapshot(rows, use_numpy=False), StatsSnapshot(rows, use_numpy=True)
+
+    def test_backends_agree(self):
+        # 100회 미만(트렌드 unknown)·이상, 일부 번호가 한 번도 나오지 않는 작은 표본
+        for size in (3, 40, 250):
+            python, numpy = self.snapshots(size, seed=size)
+            self.assertIsNone(python.matrix)
+            self.assertIsNotNone(numpy.matrix)
+            with self.subTest(size=size):
+                self.assertEqual(get_number_stats(snapshot=python), get_number_stats(snapshot=numpy))
+                self.assertEqual(get_all_number_detail_stats(snapshot=python), get_all_number_detail_stats(snapshot=numpy))
+                for number in (1, 23, 45):
+                    self.assertEqual(get_number_detail_stats(number, python), get_number_detail_stats(number, numpy))
+
+
+@override_settings(CACHES=TEST_CACHES, STORAGES=TEST_STORAGES)
+class LandingPageCacheTests(TestCase):
+    def setUp(self):
+        for alias in TEST_CACHES:
+            caches[alias].clear()
+
+    def test_query_string_shares_one_entry_in_pages_cache(self):
+        self.client.get('/')
+        for query in ('?x=1', '?x=2&utm_source=feed'):
+            with self.subTest(query=query), self.assertNumQueries(0):
+                self.assertEqual(self.client.get('/' + query).status_code, 200)
+        self.assertEqual(len(caches['pages']._cache), 1)
+        self.assertFalse([key for key in caches['default']._cache if ':page:' in key])
+
+
+@override_settings(CACHES=TEST_CACHES)
+class TicketCheckAPITests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        build_draw({
+            'draw_no': 1, 'draw_date': date(2002, 12, 7),
+            'numbers': [1, 2, 3, 4, 5, 6], 'bonus_number': 7,
+        }).save()
+
+    def setUp(self):
+        for alias in TEST_CACHES:
+            caches[alias].clear()
+        self.url = reverse('landing:ticket_check')
+
+    def post(self, body):
+        return self.client.post(self.url, json.dumps(body), content_type='application/json')
+
+    def test_get_checks_one_ticket(self):
+        response = self.client.get(self.url, {'numbers': '6,5,4,3,2,1'})
+        self.assertEqual(response.status_code, 200)
+        [result] = response.json()['results']
+        self.assertEqual(result['numbers'], [1, 2, 3, 4, 5, 6])
+        self.assertEqual(result['best']['rank'], 1)
+
+    def test_bad_numbers_are_rejected(self):
+        for numbers in ('', '1,2,3,4,5,x', '1,2,3,4,5', '1,2,3,4,5,46', '1,1,2,3,4,5'):
+            with self.subTest(numbers=numbers):
+                self.assertEqual(self.client.get(self.url, {'numbers': numbers}).status_code, 400)
+        for body in ({}, {'tickets': '1,2,3'}, {'tickets': [['1', 2, 3, 4, 5, 6]]}, [[1, 2, 3, 4, 5, 6]]):
+            with self.subTest(body=body):
+                self.assertEqual(self.post(body).status_code, 400)
+        self.assertEqual(self.client.post(self.url, b'{', content_type='application/json').status_code, 400)
+
+    def test_anonymous_ticket_cap(self):
+        ticket = [1, 2, 3, 4, 5, 6]
+        self.assertEqual(self.post({'tickets': [ticket] * ANONYMOUS_MAX_TICKETS}).status_code, 200)
+        response = self.post({'tickets': [ticket] * (ANONYMOUS_MAX_TICKETS + 1)})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn(str(ANONYMOUS_MAX_TICKETS), response.json()['error'])
+
+        user = get_user_model().objects.create_user('member', 'member@example.com', 'pw-12345')
+        self.client.force_login(user)
+        self.assertEqual(self.post({'tickets': [ticket] * (ANONYMOUS_MAX_TICKETS + 1)}).status_code, 200)
+        self.assertEqual(self.post({'tickets': [ticket] * (MAX_TICKETS + 1)}).status_code, 400)
+
+
+class BacktestTests(SimpleTestCase):
+    def history(self, size, seed=0):
+        rng = random.Random(seed)
+        return [(draw_no, tuple(sorted(rng.sample(range(1, 46), 6)))) for draw_no in range(1, size + 1)]
+
+    def test_inputs_use_only_earlier_draws(self):
+        history = self.history(60)
+        inputs = backtest.strategy_inputs(history, 0)
+        self.assertEqual(inputs[0][0], backtest.RECENT_WINDOW + 1)
+        for i, entry in enumerate(inputs, start=backtest.RECENT_WINDOW):
+            # N회 이후(N 포함) 회차를 잘라내도 N회 입력의 빈출·미출 번호가 같음
+            truncated = history[:i] + [(history[i][0], (40, 41, 42, 43, 44, 45))]
+            draw_no, _, hot_numbers, cold_numbers = backtest.strategy_inputs(truncated, i)[0]
+            self.assertEqual((draw_no, hot_numbers, cold_numbers), (entry[0], entry[2], entry[3]))
+            self.assertEqual(entry[1], frozenset(history[i][1]))
+
+    def test_predictions_ignore_target_and_later_draws(self):
+        history = self.history(45)
+        changed = history[:-1] + [(45, (1, 2, 3, 4, 5, 6))]
+
+        def predictions(rows):
+            with mock.patch.object(backtest, 'finalize_set', wraps=backtest.finalize_set) as finalize:
+                report = backtest.run_backtest(rows, range(2), workers=1, start_index=0)
+            return [call.args[0] for call in finalize.call_args_list], report
+
+        picked, report = predictions(history)
+        picked_changed, report_changed = predictions(changed)
+        # 마지막 회차 당첨번호가 달라져도 모든 회차의 추천 번호는 같고 일치 개수만 달라짐
+        self.assertEqual(picked, picked_changed)
+        self.assertNotEqual(report, report_changed)
+        first = next(iter(report.values()))
+        self.assertEqual((first['first_draw_no'], first['last_draw_no']), (31, 45))
+        self.assertEqual(first['samples'], 15 * 2)
+
+    def test_confidence_scale(self):
+        self.assertEqual(backtest_confidence({'mean_hits': RANDOM_MEAN_HITS}), 50)
+        self.assertEqual(backtest_confidence({'mean_hits': 0}), 1)
+        self.assertEqual(backtest_confidence({'mean_hits': 6}), 99)
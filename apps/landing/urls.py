@@ -6,5 +6,8 @@ app_name = 'landing'
 urlpatterns = [
     path('', views.LandingPageView.as_view(), name='index'),
     path('api/number/<int:number>/stats/', views.NumberDetailAPIView.as_view(), name='number_stats'),
+    path('api/numbers/stats/', views.NumberStatsBatchAPIView.as_view(), name='number_stats_batch'),
+    path('api/tickets/check/', views.TicketCheckAPIView.as_view(), name='ticket_check'),
+    path('api/draws/export/', views.DrawExportAPIView.as_view(), name='draw_export'),
     path('recommendations/', views.MoreRecommendationsView.as_view(), name='more_recommendations'),
 ]
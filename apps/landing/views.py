@@ -1,19 +1,25 @@
+import json
 import random
 from datetime import date
 
-from django.http import JsonResponse
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, StreamingHttpResponse
+from django.utils.cache import patch_cache_control
+from django.utils.decorators import method_decorator
 from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.gzip import gzip_page
+from django.views.decorators.http import condition
 from django.views.generic import TemplateView
 
+from apps.analysis.cache import get_draw_version
 from apps.analysis.models import DrawResult
-from .services.lotto_stats import (
-    get_current_draw_data,
-    get_number_stats,
-    get_ai_recommendations_from_stats,
-    get_recent_draws,
-    get_number_detail_stats,
-    get_extended_ai_recommendations,
-)
+from apps.analysis.services import history_export
+from apps.analysis.services.ticket_checker import ANONYMOUS_MAX_TICKETS, MAX_TICKETS, TicketError, check_tickets
+from apps.common.mixins import AnonymousPageCacheMixin
+
+from .services.lotto_stats import get_landing_stats, get_extended_ai_recommendations
+from .services.number_detail_cache import get_cached_number_detail, get_number_detail_table
 from .services.mock_data import (
     CURRENT_DRAW, AI_RECOMMENDATIONS, NUMBER_STATS,
     LUCKY_STORES, USER_LEVELS, SERVICE_STAGES,
@@ -21,7 +27,7 @@ from .services.mock_data import (
 )
 
 
-class LandingPageView(TemplateView):
+class LandingPageView(AnonymousPageCacheMixin, TemplateView):
     template_name = 'landing/index.html'
 
     def get_context_data(self, **kwargs):
@@ -32,13 +38,14 @@ class LandingPageView(TemplateView):
         daily_numbers = sorted(rng.sample(range(1, 46), 6))
 
         # DB에 데이터가 있으면 실데이터, 없으면 mock 폴백
-        has_data = DrawResult.objects.exists()
+        # 통계는 스냅샷 1개(쿼리 1회)로 계산해 회차 버전별로 캐시
+        landing_stats = get_landing_stats()
 
-        if has_data:
-            current_draw = get_current_draw_data()
-            number_stats = get_number_stats()
-            ai_recommendations = get_ai_recommendations_from_stats()
-            recent_draws = get_recent_draws(5)
+        if landing_stats is not None:
+            current_draw = landing_stats['current_draw']
+            number_stats = landing_stats['number_stats']
+            ai_recommendations = landing_stats['ai_recommendations']
+            recent_draws = landing_stats['recent_draws']
         else:
             current_draw = CURRENT_DRAW
             number_stats = NUMBER_STATS
@@ -49,8 +56,8 @@ class LandingPageView(TemplateView):
         community_posts = COMMUNITY_POSTS
         try:
             from apps.community.models import Post
-            real_posts = Post.objects.select_related('board', 'author__profile').all()[:3]
-            if real_posts.exists():
+            real_posts = list(Post.objects.select_related('board', 'author__profile')[:3])
+            if real_posts:
                 community_posts = real_posts
         except Exception:
             pass
@@ -66,6 +73,9 @@ class LandingPageView(TemplateView):
             'daily_quote': rng.choice(DAILY_QUOTES),
             'community_posts': community_posts,
             'recent_draws': recent_draws,
+            # 템플릿 조각 캐시 키
+            'draw_version': get_draw_version(),
+            'day_seed': today_seed,
         })
         return context
 
@@ -75,10 +85,110 @@ class NumberDetailAPIView(View):
     def get(self, request, number):
         if not (1 <= number <= 45):
             return JsonResponse({'error': 'Invalid number'}, status=400)
-        stats = get_number_detail_stats(number)
+        stats = get_cached_number_detail(number)
         return JsonResponse(stats)
 
 
+def latest_draw_etag(request, *args, **kwargs):
+    """최신 회차 번호 기반 ETag (데이터 없으면 None)"""
+    draw_no = DrawResult.objects.order_by('-draw_no').values_list('draw_no', flat=True).first()
+    return f'draws-{draw_no}' if draw_no else None
+
+
+def latest_draw_modified(request, *args, **kwargs):
+    """최신 회차 적재 시각 기반 Last-Modified"""
+    return DrawResult.objects.order_by('-draw_no').values_list('created_at', flat=True).first()
+
+
+@method_decorator(condition(etag_func=latest_draw_etag, last_modified_func=latest_draw_modified), name='get')
+class NumberStatsBatchAPIView(View):
+    """1~45번 전체 상세 통계 JSON API (번호별 API 45회 호출 대체)"""
+    def get(self, request):
+        details = get_number_detail_table()
+        response = JsonResponse(
+            {'numbers': [details[n] for n in range(1, 46)]},
+            json_dumps_params={'ensure_ascii': False, 'separators': (',', ':')},
+        )
+        patch_cache_control(response, public=True, max_age=600)
+        return response
+
+
+def export_etag(request, *args, **kwargs):
+    """최신 회차 + 형식별 ETag (지원하지 않는 형식이면 None - 400 응답에 검증자를 붙이지 않음)"""
+    fmt = request.GET.get('format', 'csv')
+    if fmt not in history_export.FORMATS:
+        return None
+    etag = latest_draw_etag(request)
+    return etag and f'{etag}-{fmt}'
+
+
+def export_modified(request, *args, **kwargs):
+    if request.GET.get('format', 'csv') not in history_export.FORMATS:
+        return None
+    return latest_draw_modified(request)
+
+
+@method_decorator(gzip_page, name='get')
+@method_decorator(condition(etag_func=export_etag, last_modified_func=export_modified), name='get')
+class DrawExportAPIView(View):
+    """
+    역대 전체 회차 스트리밍 내보내기 (페이지 단위 수집 대체)
+    GET ?format=csv(기본) | ndjson | bin(회차당 9바이트 '>H7B')
+    ASGI에서는 비동기 제너레이터로 배치마다 바로 전송 (동기 이터레이터는 ASGI 핸들러가 전부 모은 뒤 보냄)
+    """
+    def get(self, request):
+        fmt = request.GET.get('format', 'csv')
+        if fmt not in history_export.FORMATS:
+            return JsonResponse(
+                {'error': f'지원하지 않는 형식입니다: {fmt} ({", ".join(history_export.FORMATS)})'}, status=400,
+            )
+        content_type, extension = history_export.FORMATS[fmt]
+        if isinstance(request, ASGIRequest):
+            content = history_export.aiter_export(fmt)
+        else:
+            content = history_export.iter_export(fmt)
+        response = StreamingHttpResponse(content, content_type=content_type)
+        response['Content-Disposition'] = f'attachment; filename="lotto_draws.{extension}"'
+        patch_cache_control(response, public=True, max_age=600)
+        return response
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+class TicketCheckAPIView(View):
+    """
+    역대 전체 회차 기준 당첨 확인 JSON API (조회 전용이라 CSRF 면제)
+    GET  ?numbers=1,2,3,4,5,6
+    POST {"tickets": [[1, 2, 3, 4, 5, 6], ...]} - 비로그인은 ANONYMOUS_MAX_TICKETS장, 로그인은 MAX_TICKETS장까지
+    """
+    def get(self, request):
+        try:
+            numbers = [int(n) for n in request.GET.get('numbers', '').split(',')]
+        except ValueError:
+            return JsonResponse({'error': '번호는 정수여야 합니다.'}, status=400)
+        return self._check([numbers])
+
+    def post(self, request):
+        try:
+            data = json.loads(request.body)
+        except json.JSONDecodeError:
+            return JsonResponse({'error': '잘못된 요청입니다.'}, status=400)
+        tickets = data.get('tickets') if isinstance(data, dict) else None
+        if not isinstance(tickets, list):
+            return JsonResponse({'error': 'tickets 목록이 필요합니다.'}, status=400)
+        return self._check(tickets)
+
+    def _check(self, tickets):
+        max_tickets = MAX_TICKETS if self.request.user.is_authenticated else ANONYMOUS_MAX_TICKETS
+        try:
+            results = check_tickets(tickets, max_tickets=max_tickets)
+        except TicketError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        return JsonResponse(
+            {'results': results},
+            json_dumps_params={'ensure_ascii': False, 'separators': (',', ':')},
+        )
+
+
 class MoreRecommendationsView(TemplateView):
     template_name = 'landing/more_recommendations.html'
 
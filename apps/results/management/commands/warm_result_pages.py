@@ -0,0 +1,21 @@
+"""
+회차별 당첨결과 페이지 캐시 예열 커맨드
+Usage: python manage.py warm_result_pages [--limit N]
+
+비로그인 페이지 캐시('pages')에 최신 회차부터 렌더링 결과 저장 (배포 직후·캐시 초기화 후 첫 방문 비용 제거)
+새 회차 적재 시에는 draws_ingested 시그널로 최신 두 페이지만 자동 예열
+"""
+from django.core.management.base import BaseCommand
+
+from apps.results.services.page_warmup import warm_result_pages
+
+
+class Command(BaseCommand):
+    help = '회차별 당첨결과 페이지를 페이지 캐시에 미리 렌더링합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, help='최신 회차부터 예열할 페이지 수 (미지정 시 전체)')
+
+    def handle(self, *args, **options):
+        warmed = warm_result_pages(limit=options['limit'])
+        self.stdout.write(self.style.SUCCESS(f'완료! {len(warmed)}개 페이지 예열'))
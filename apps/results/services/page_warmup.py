@@ -0,0 +1,27 @@
+"""
+회차 결과 페이지 캐시 예열 (정적 파일을 만들지 않고 비로그인 페이지 캐시 'pages'를 채움)
+- ResultDetailView는 비로그인 GET을 페이지 캐시로 응답, 로그인 사용자는 항상 새로 렌더링
+- 캐시 키는 회차 자신의 수정 시각·이전/다음 회차·배포 버전 - 새 회차가 들어와도 과거 회차 페이지는 그대로 적중
+- 새 회차 적재 후에는 키가 바뀐 최신 두 페이지(새 회차, 다음 회차 링크가 생긴 직전 회차)만 다시 렌더링
+"""
+from django.urls import reverse
+
+from apps.analysis.models import DrawResult
+
+
+def warm_result_page(draw_no):
+    """비로그인 요청으로 회차 결과 페이지를 렌더링해 페이지 캐시에 저장 → 응답"""
+    from apps.results.views import ResultDetailView
+
+    return ResultDetailView.warm_page_cache(reverse('results:detail', args=[draw_no]), draw_no=draw_no)
+
+
+def warm_result_pages(limit=None):
+    """최신 회차부터 limit개(없으면 전체) 결과 페이지 캐시 예열 → 예열한 회차 번호 목록"""
+    draw_nos = DrawResult.objects.order_by('-draw_no').values_list('draw_no', flat=True)
+    if limit:
+        draw_nos = draw_nos[:limit]
+    draw_nos = list(draw_nos)
+    for draw_no in draw_nos:
+        warm_result_page(draw_no)
+    return draw_nos
@@ -0,0 +1,11 @@
+from django.dispatch import receiver
+
+from apps.analysis.signals import draws_ingested
+
+from .services.page_warmup import warm_result_pages
+
+
+@receiver(draws_ingested)
+def warm_latest_result_pages(sender, **kwargs):
+    """새 회차 적재 후 캐시 키가 바뀐 최신 회차·직전 회차(다음 회차 링크가 생긴 페이지) 결과 페이지 예열"""
+    warm_result_pages(limit=2)
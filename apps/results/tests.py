@@ -1,3 +1,193 @@
-from django.test import TestCase
+import base64
+import json
+from datetime import date, timedelta
+from urllib.parse import parse_qs, urlparse
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from apps.analysis.models import DrawResult
+from apps.analysis.services.ingest import build_draw, upsert_draws
+from apps.common.pagination import NEXT, PREVIOUS, KeysetPaginator
+from apps.results.services.page_warmup import warm_result_pages
+
+TEST_CACHES = {
+    alias: {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': f'results-test-{alias}'}
+    for alias in ('default', 'state', 'view_dedup', 'pages')
+}
+# collectstatic 없이 템플릿 렌더링
+TEST_STORAGES = {'staticfiles': {'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage'}}
+
+
+@override_settings(CACHES=TEST_CACHES, STORAGES=TEST_STORAGES, PAGE_CACHE_VERSION='v1')
+class ResultDetailPageCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        first = date(2024, 1, 6)
+        for draw_no in (1, 2, 3):
+            build_draw({
+                'draw_no': draw_no,
+                'draw_date': first + timedelta(weeks=draw_no - 1),
+                'numbers': [draw_no, 10, 20, 30, 40, 45],
+                'bonus_number': 7,
+            }).save()
+
+    def setUp(self):
+        from django.core.cache import caches
+        for alias in TEST_CACHES:
+            caches[alias].clear()
+        self.url = reverse('results:detail', args=[2])
+
+    def test_anonymous_hit_skips_rendering(self):
+        self.client.get(self.url)
+        # 캐시 키용 회차 수정 시각·이전/다음 회차 조회 1번만
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, '제2회')
+
+    def test_authenticated_user_bypasses_cache(self):
+        self.client.get(self.url)
+        user = get_user_model().objects.create_user('member', 'member@example.com', 'pw-12345')
+        self.client.force_login(user)
+        response = self.client.get(self.url)
+        self.assertContains(response, reverse('accounts:profile'))
+        self.assertIn('Cookie', response['Vary'])
+
+    def test_draw_update_invalidates(self):
+        self.client.get(self.url)
+        draw = DrawResult.objects.get(draw_no=2)
+        draw.first_prize_winners = 987654
+        with self.captureOnCommitCallbacks(execute=True):
+            draw.save()
+        self.assertContains(self.client.get(self.url), '987654명')
+
+    def test_deploy_version_invalidates(self):
+        self.client.get(self.url)
+        with override_settings(PAGE_CACHE_VERSION='v2'), self.assertNumQueries(2):
+            # 새 배포 버전이면 다시 렌더링 (키 조회 + 회차·이전·다음 회차 1쿼리)
+            self.client.get(self.url)
+
+    def test_warm_latest_pages(self):
+        self.assertEqual(warm_result_pages(limit=2), [3, 2])
+        with self.assertNumQueries(1):
+            self.client.get(reverse('results:detail', args=[3]))
+
+    def test_new_draw_keeps_past_pages(self):
+        for draw_no in (1, 2, 3):
+            self.client.get(reverse('results:detail', args=[draw_no]))
+        with self.captureOnCommitCallbacks(execute=True):
+            upsert_draws([{
+                'draw_no': 4, 'draw_date': date(2024, 1, 27), 'numbers': [4, 10, 20, 30, 40, 45], 'bonus_number': 7,
+            }])
+        # 과거 회차는 그대로 적중, 다음 회차 링크가 생긴 직전 회차·새 회차는 적재 후 예열됨
+        for draw_no in (1, 2, 3, 4):
+            with self.subTest(draw_no=draw_no), self.assertNumQueries(1):
+                self.client.get(reverse('results:detail', args=[draw_no]))
+        self.assertContains(self.client.get(reverse('results:detail', args=[3])), reverse('results:detail', args=[4]))
+
+
+@override_settings(CACHES=TEST_CACHES, STORAGES=TEST_STORAGES)
+class ResultListPaginationTests(TestCase):
+    # 1~50회 중 10·20회가 빠진 48개 회차 (20개씩 3페이지)
+    DRAW_NOS = [n for n in range(1, 51) if n not in (10, 20)]
+
+    @classmethod
+    def setUpTestData(cls):
+        DrawResult.objects.bulk_create([
+            build_draw({
+                'draw_no': draw_no,
+                'draw_date': date(2002, 12, 7) + timedelta(weeks=draw_no - 1),
+                'numbers': [1, 2, 3, 4, 5, 6],
+                'bonus_number': 7,
+            })
+            for draw_no in cls.DRAW_NOS
+        ])
+
+    def setUp(self):
+        from django.core.cache import caches
+        for alias in TEST_CACHES:
+            caches[alias].clear()
+        self.url = reverse('results:list')
+        self.newest = self.DRAW_NOS[::-1]
+
+    def page(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        page = response.context['page_obj']
+        return page, [d.draw_no for d in page]
+
+    def test_first_page(self):
+        page, draw_nos = self.page()
+        self.assertEqual(draw_nos, self.newest[:20])
+        self.assertTrue(page.has_next)
+        self.assertFalse(page.has_previous)
+        self.assertIsNone(page.previous_cursor)
+        # 빠진 회차를 빼고 센 실제 개수
+        self.assertEqual(page.total, 48)
+
+    def test_next_and_previous(self):
+        first, _ = self.page()
+        second, draw_nos = self.page(cursor=first.next_cursor)
+        self.assertEqual(draw_nos, self.newest[20:40])
+        self.assertTrue(second.has_next and second.has_previous)
+
+        third, draw_nos = self.page(cursor=second.next_cursor)
+        self.assertEqual(draw_nos, self.newest[40:])
+        self.assertFalse(third.has_next)
+        self.assertIsNone(third.next_cursor)
+
+        back, draw_nos = self.page(cursor=third.previous_cursor)
+        self.assertEqual(draw_nos, self.newest[20:40])
+        back, draw_nos = self.page(cursor=back.previous_cursor)
+        self.assertEqual(draw_nos, self.newest[:20])
+        self.assertFalse(back.has_previous)
+
+    def test_last_cursor(self):
+        first, _ = self.page()
+        last, draw_nos = self.page(cursor=first.last_cursor)
+        self.assertEqual(draw_nos, self.newest[-20:])
+        self.assertFalse(last.has_next)
+        self.assertTrue(last.has_previous)
+
+    def test_cursor_round_trip(self):
+        paginator = KeysetPaginator(DrawResult.objects.all(), ['-draw_no'], 20)
+        row = DrawResult.objects.get(draw_no=30)
+        self.assertEqual(paginator.decode_cursor(paginator.encode_cursor(NEXT, row)), (NEXT, [30]))
+        self.assertEqual(paginator.decode_cursor(paginator.encode_cursor(PREVIOUS)), (PREVIOUS, None))
+
+    def test_invalid_cursor_is_404(self):
+        def encode(payload):
+            return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip('=')
+
+        for cursor in ('%%%', 'bm90LWpzb24', encode(['x', [1]]), encode(['n', [1, 2]]), encode(['n', ['abc']]), encode('n')):
+            with self.subTest(cursor=cursor):
+                self.assertEqual(self.client.get(self.url, {'cursor': cursor}).status_code, 404)
+
+    def assertRedirectsToPage(self, params, draw_nos):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 301)
+        location = urlparse(response['Location'])
+        self.assertEqual(location.path, self.url)
+        query = parse_qs(location.query)
+        self.assertNotIn('page', query)
+        page = self.client.get(self.url, query)
+        self.assertEqual([d.draw_no for d in page.context['page_obj']], draw_nos)
+        return query
+
+    def test_legacy_page_redirects(self):
+        self.assertRedirectsToPage({'page': '2'}, self.newest[20:40])
+        self.assertRedirectsToPage({'page': '3'}, self.newest[40:])
+        self.assertRedirectsToPage({'page': 'last'}, self.newest[-20:])
+        for page in ('1', 'abc'):
+            with self.subTest(page=page):
+                response = self.client.get(self.url, {'page': page})
+                self.assertEqual((response.status_code, response['Location']), (301, self.url))
+
+    def test_legacy_page_keeps_other_params(self):
+        query = self.assertRedirectsToPage({'page': '2', 'ref': 'bookmark'}, self.newest[20:40])
+        self.assertEqual(query['ref'], ['bookmark'])
+
+    def test_legacy_page_past_end_is_404(self):
+        self.assertEqual(self.client.get(self.url, {'page': '4'}).status_code, 404)
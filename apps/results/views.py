@@ -1,36 +1,49 @@
-from django.db.models import Q
-from django.shortcuts import get_object_or_404
+import hashlib
+
+from django.conf import settings
+from django.http import Http404
 from django.views.generic import DetailView, ListView
 
 from apps.analysis.models import DrawResult
+from apps.common.mixins import AnonymousPageCacheMixin
+from apps.common.pagination import KeysetPaginationMixin, approximate_count
 
 
-class ResultListView(ListView):
+class ResultListView(KeysetPaginationMixin, ListView):
     model = DrawResult
     template_name = 'results/list.html'
     context_object_name = 'draws'
     paginate_by = 20
-    ordering = ['-draw_no']
+    keyset_ordering = ['-draw_no']
+
+    def get_approximate_count(self, queryset):
+        # 빠진 회차가 있을 수 있으므로 최신 회차 번호가 아닌 실제 개수 (잠시 캐시)
+        return approximate_count(queryset)
 
 
-class ResultDetailView(DetailView):
+class ResultDetailView(AnonymousPageCacheMixin, DetailView):
     model = DrawResult
     template_name = 'results/detail.html'
     context_object_name = 'draw'
+    # 키가 회차 자신의 데이터로 바뀌므로 길게 보관 (날짜와 무관한 페이지)
+    page_cache_timeout = 30 * 24 * 60 * 60
+
+    def get_page_cache_key(self):
+        # 전역 회차 버전 대신 이 회차의 수정 시각·이전/다음 회차로 키 구성 (인덱스 조회 1번)
+        # → 새 회차가 들어와도 바뀌는 페이지는 새 회차와 다음 회차 링크가 생긴 직전 회차뿐
+        stamp = DrawResult.objects.page_stamp(self.kwargs['draw_no'])
+        parts = (settings.PAGE_CACHE_VERSION, self.request.path, stamp)
+        return 'page:draw:' + hashlib.md5(repr(parts).encode()).hexdigest()
 
     def get_object(self):
-        return get_object_or_404(DrawResult, draw_no=self.kwargs['draw_no'])
+        # 이전/다음 회차까지 한 번에 조회 (중간에 빠진 회차가 있어도 가장 가까운 회차)
+        self.prev_draw, draw, self.next_draw = DrawResult.objects.neighbourhood(self.kwargs['draw_no'])
+        if draw is None:
+            raise Http404('해당 회차가 없습니다.')
+        return draw
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        draw = self.object
-
-        # 이전/다음 회차
-        context['prev_draw'] = DrawResult.objects.filter(
-            draw_no=draw.draw_no - 1
-        ).first()
-        context['next_draw'] = DrawResult.objects.filter(
-            draw_no=draw.draw_no + 1
-        ).first()
-
+        context['prev_draw'] = self.prev_draw
+        context['next_draw'] = self.next_draw
         return context
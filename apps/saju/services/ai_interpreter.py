@@ -1,16 +1,103 @@
 import json
+import logging
 import os
+import threading
+from contextlib import contextmanager
 
 import anthropic
+from django.conf import settings
 
+from .number_engine import local_interpretation
+from .response_cache import canonical_key, response_cache
 
-def interpret_saju(pillars, birth_info, ten_gods=None, elements=None):
-    """Claude API로 사주 해석 + 로또 번호 생성"""
+logger = logging.getLogger(__name__)
 
-    api_key = os.environ.get('ANTHROPIC_API_KEY')
-    if not api_key:
-        raise ValueError('ANTHROPIC_API_KEY 환경변수가 설정되지 않았습니다.')
+MODEL = 'claude-sonnet-4-5-20250929'
+# 행운번호는 로컬 엔진이 계산하므로 해석 문장만 생성
+MAX_TOKENS = 1000
+
+# 프로세스당 동시 LLM 호출 수 - 초과 시 기다리지 않고 로컬 해석으로 응답
+_llm_slots = threading.BoundedSemaphore(getattr(settings, 'SAJU_MAX_CONCURRENT_LLM', 4))
+
+
+class LLMBusyError(RuntimeError):
+    """동시 LLM 호출 한도 초과"""
+
+
+@contextmanager
+def llm_slot():
+    if not _llm_slots.acquire(blocking=False):
+        raise LLMBusyError('사주 해석 요청이 많아 AI 해석을 건너뜁니다.')
+    try:
+        yield
+    finally:
+        _llm_slots.release()
+
+
+def interpret_saju(pillars, birth_info, ten_gods=None, elements=None, client=None):
+    """Claude API로 사주 해석 (client: 테스트용 가짜 클라이언트 주입)"""
+    if client is None:
+        client = anthropic.Anthropic(api_key=_api_key())
 
+    message = client.messages.create(
+        model=MODEL,
+        max_tokens=MAX_TOKENS,
+        messages=[{'role': 'user', 'content': build_prompt(pillars, birth_info, ten_gods, elements)}],
+    )
+    return parse_response(message.content[0].text)
+
+
+def cached_interpret_saju(pillars, birth_info, ten_gods=None, elements=None, client=None):
+    """같은 사주 입력이면 캐시된 해석 반환, 동시 요청은 API 호출 1건으로 합침"""
+    def compute():
+        with llm_slot():
+            return interpret_saju(pillars, birth_info, ten_gods, elements, client=client)
+
+    return response_cache.get_or_compute(canonical_key(pillars, birth_info, ten_gods, elements), compute)
+
+
+def interpret_with_fallback(pillars, birth_info, ten_gods=None, elements=None, client=None):
+    """로컬 행운번호 + AI 해석, API 오류·키 미설정·과부하 시 로컬 해석만 반환"""
+    local = local_interpretation(pillars, birth_info, ten_gods, elements)
+    try:
+        return merge_interpretation(local, cached_interpret_saju(pillars, birth_info, ten_gods, elements, client))
+    except LLMBusyError as e:
+        logger.info('%s', e)
+    except Exception:
+        logger.exception('사주 해석 API 오류 - 로컬 해석으로 대체')
+    return local
+
+
+def merge_interpretation(local, ai_result):
+    """AI 해석 문장 + 로컬 행운번호"""
+    return {
+        'interpretation': ai_result.get('interpretation') or local['interpretation'],
+        'lucky_numbers': local['lucky_numbers'],
+        'lucky_message': ai_result.get('lucky_message') or local['lucky_message'],
+        'source': 'ai',
+    }
+
+
+async def stream_interpret_saju(pillars, birth_info, ten_gods=None, elements=None, client=None):
+    """Claude 스트리밍 응답을 텍스트 조각 단위로 전달하는 비동기 제너레이터 (client: AsyncAnthropic 호환)"""
+    owns_client = client is None
+    if owns_client:
+        client = anthropic.AsyncAnthropic(api_key=_api_key())
+    try:
+        async with client.messages.stream(
+            model=MODEL,
+            max_tokens=MAX_TOKENS,
+            messages=[{'role': 'user', 'content': build_prompt(pillars, birth_info, ten_gods, elements)}],
+        ) as stream:
+            async for text in stream.text_stream:
+                yield text
+    finally:
+        if owns_client:
+            await client.close()
+
+
+def build_prompt(pillars, birth_info, ten_gods=None, elements=None):
+    """사주 정보 → Claude 요청 프롬프트"""
     # 사주 정보 텍스트 구성
     pillars_text = _format_pillars(pillars)
     ten_gods_text = _format_ten_gods(ten_gods) if ten_gods else ''
@@ -19,7 +106,7 @@ def interpret_saju(pillars, birth_info, ten_gods=None, elements=None):
 
     prompt = f"""당신은 한국의 사주팔자(四柱八字) 전문가이자 로또 번호 추천 AI입니다.
 
-아래 사용자의 사주팔자 정보를 분석하고, 금전운/재물운 중심으로 해석한 뒤, 사주의 오행 균형에 기반한 로또 행운번호를 추천해주세요.
+아래 사용자의 사주팔자 정보를 분석하고, 금전운/재물운 중심으로 해석해주세요.
 
 ## 사용자 정보
 {birth_text}
@@ -40,37 +127,17 @@ def interpret_saju(pillars, birth_info, ten_gods=None, elements=None):
     "element_analysis": "오행 분석 (어떤 오행이 강하고 약한지, 보완할 오행은 무엇인지)",
     "lucky_elements": ["행운의 오행1", "행운의 오행2"]
   }},
-  "lucky_numbers": [
-    {{
-      "set_name": "오행 균형 세트",
-      "numbers": [1, 2, 3, 4, 5, 6],
-      "reason": "부족한 金 기운을 보충하는 번호 조합"
-    }},
-    {{
-      "set_name": "재물운 강화 세트",
-      "numbers": [7, 8, 9, 10, 11, 12],
-      "reason": "정재/편재의 기운을 높이는 번호"
-    }},
-    {{
-      "set_name": "대운 흐름 세트",
-      "numbers": [13, 14, 15, 16, 17, 18],
-      "reason": "현재 대운의 흐름에 맞춘 번호"
-    }}
-  ],
   "lucky_message": "오늘의 행운 메시지 (1줄, 사주 기반 개인화)"
 }}
 
-중요: 로또 번호는 반드시 1~45 사이의 서로 다른 숫자 6개를 정렬하여 제공하세요.
+행운번호는 별도로 계산되므로 번호는 출력하지 마세요.
 """
+    return prompt
 
-    client = anthropic.Anthropic(api_key=api_key)
-    message = client.messages.create(
-        model='claude-sonnet-4-5-20250929',
-        max_tokens=1500,
-        messages=[{'role': 'user', 'content': prompt}],
-    )
 
-    response_text = message.content[0].text.strip()
+def parse_response(response_text):
+    """응답 텍스트 → dict (```json 코드 블록 허용)"""
+    response_text = response_text.strip()
 
     # JSON 파싱 (```json 블록 처리)
     if response_text.startswith('```'):
@@ -80,6 +147,13 @@ def interpret_saju(pillars, birth_info, ten_gods=None, elements=None):
     return json.loads(response_text)
 
 
+def _api_key():
+    api_key = os.environ.get('ANTHROPIC_API_KEY')
+    if not api_key:
+        raise ValueError('ANTHROPIC_API_KEY 환경변수가 설정되지 않았습니다.')
+    return api_key
+
+
 def _format_pillars(pillars):
     lines = []
     for key, label in [('year', '년주(年柱)'), ('month', '월주(月柱)'),
@@ -0,0 +1,128 @@
+"""
+규칙 기반 사주 행운번호 엔진 (외부 API 없이 즉시 계산)
+- 하도(河圖) 수리로 오행별 번호 풀 구성: 水 1·6, 火 2·7, 木 3·8, 金 4·9, 土 5·0 (끝자리 기준)
+- 오행 분포에서 부족한 오행 보충, 일간이 극하는 오행(재성) 강화, 상생 흐름 순으로 3세트 생성
+- 같은 사주 입력이면 항상 같은 번호 (입력 해시로 시드 고정)
+"""
+import random
+
+from .response_cache import canonical_key
+
+ELEMENTS = ('목', '화', '토', '금', '수')
+ELEMENT_HANJA = {'목': '木', '화': '火', '토': '土', '금': '金', '수': '水'}
+ELEMENT_ALIASES = {
+    '목': '목', '木': '목', 'Wood': '목', 'wood': '목',
+    '화': '화', '火': '화', 'Fire': '화', 'fire': '화',
+    '토': '토', '土': '토', 'Earth': '토', 'earth': '토',
+    '금': '금', '金': '금', 'Metal': '금', 'metal': '금',
+    '수': '수', '水': '수', 'Water': '수', 'water': '수',
+}
+STEM_ELEMENTS = {
+    '갑': '목', '을': '목', '병': '화', '정': '화', '무': '토',
+    '기': '토', '경': '금', '신': '금', '임': '수', '계': '수',
+    '甲': '목', '乙': '목', '丙': '화', '丁': '화', '戊': '토',
+    '己': '토', '庚': '금', '辛': '금', '壬': '수', '癸': '수',
+}
+# 하도 수리 (번호 끝자리)
+ELEMENT_DIGITS = {'수': (1, 6), '화': (2, 7), '목': (3, 8), '금': (4, 9), '토': (5, 0)}
+# 상생: 목→화→토→금→수→목, 상극: 목→토→수→화→금→목
+GENERATES = {'목': '화', '화': '토', '토': '금', '금': '수', '수': '목'}
+CONTROLS = {'목': '토', '토': '수', '수': '화', '화': '금', '금': '목'}
+WEALTH_GODS = ('정재', '편재')
+
+ELEMENT_POOLS = {
+    element: [n for n in range(1, 46) if n % 10 in digits]
+    for element, digits in ELEMENT_DIGITS.items()
+}
+
+
+def element_counts(elements):
+    """오행 분포 dict (한글·한자·영문 키) → {'목': n, ...}"""
+    counts = dict.fromkeys(ELEMENTS, 0)
+    for key, value in (elements or {}).items():
+        element = ELEMENT_ALIASES.get(key)
+        if element:
+            counts[element] += int(value or 0)
+    return counts
+
+
+def day_master_element(pillars):
+    """일간(일주 천간)의 오행 (알 수 없으면 None)"""
+    stem = ((pillars or {}).get('day') or {}).get('stem', '')
+    return STEM_ELEMENTS.get(stem[:1]) if stem else None
+
+
+def local_lucky_numbers(pillars, birth_info, ten_gods=None, elements=None):
+    """행운번호 3세트 [{set_name, numbers, reason}]"""
+    rng = random.Random(canonical_key(pillars, birth_info, ten_gods, elements))
+    counts = element_counts(elements)
+    ranked = sorted(ELEMENTS, key=lambda e: (counts[e], ELEMENTS.index(e)))
+    weakest, second = ranked[0], ranked[1]
+    day_master = day_master_element(pillars) or ranked[-1]
+    wealth = CONTROLS[day_master]
+    wealth_gods = sum(1 for god in (ten_gods or {}).values() if god in WEALTH_GODS)
+
+    flow = [day_master]
+    for _ in range(4):
+        flow.append(GENERATES[flow[-1]])
+
+    return [
+        {
+            'set_name': '오행 균형 세트',
+            'numbers': _pick(rng, [(weakest, 4), (second, 2)]),
+            'reason': f'부족한 {_label(weakest)}·{_label(second)} 기운을 보충하는 번호 조합',
+        },
+        {
+            'set_name': '재물운 강화 세트',
+            'numbers': _pick(rng, [(wealth, 4 if wealth_gods else 3), (GENERATES[wealth], 2 if wealth_gods else 3)]),
+            'reason': (
+                f'일간 {_label(day_master)}이(가) 다스리는 재성 {_label(wealth)} 기운'
+                + (f'과 사주 속 재성 {wealth_gods}개를 살린 번호' if wealth_gods else '을 끌어올리는 번호')
+            ),
+        },
+        {
+            'set_name': '대운 흐름 세트',
+            'numbers': _pick(rng, [(e, 1) for e in flow] + [(flow[1], 1)]),
+            'reason': f'{_label(day_master)}에서 시작하는 상생 흐름 ({"→".join(ELEMENT_HANJA[e] for e in flow)})을 따른 번호',
+        },
+    ]
+
+
+def local_interpretation(pillars, birth_info, ten_gods=None, elements=None):
+    """AI 해석과 같은 형식의 규칙 기반 결과 (API 오류·과부하 시 대체, AI 응답 전 즉시 표시용)"""
+    counts = element_counts(elements)
+    ranked = sorted(ELEMENTS, key=lambda e: (counts[e], ELEMENTS.index(e)))
+    strongest, weakest = ranked[-1], ranked[0]
+    day_master = day_master_element(pillars) or strongest
+    wealth = CONTROLS[day_master]
+
+    return {
+        'interpretation': {
+            'summary': f'{_label(strongest)}이(가) 강한 사주로 {_label(weakest)} 기운을 채우면 균형이 맞습니다.',
+            'fortune': (
+                f'일간 {_label(day_master)}에게 재물은 {_label(wealth)}의 기운입니다. '
+                f'{_label(wealth)} 기운이 들어오는 시기에 금전 흐름이 살아납니다.'
+            ),
+            'element_analysis': ', '.join(f'{_label(e)} {counts[e]}개' for e in ELEMENTS)
+            + f' - {_label(weakest)} 보완이 필요합니다.',
+            'lucky_elements': [_label(weakest), _label(wealth)],
+        },
+        'lucky_numbers': local_lucky_numbers(pillars, birth_info, ten_gods, elements),
+        'lucky_message': f'{_label(weakest)}의 기운이 행운을 부릅니다.',
+        'source': 'local',
+    }
+
+
+def _pick(rng, weights):
+    """[(오행, 개수)] 순서대로 각 오행 풀에서 뽑아 서로 다른 6개 (부족하면 전체에서 채움)"""
+    numbers = set()
+    for element, count in weights:
+        pool = [n for n in ELEMENT_POOLS[element] if n not in numbers]
+        numbers.update(rng.sample(pool, min(count, len(pool), 6 - len(numbers))))
+    while len(numbers) < 6:
+        numbers.add(rng.randint(1, 45))
+    return sorted(numbers)
+
+
+def _label(element):
+    return f'{ELEMENT_HANJA[element]}({element})'
@@ -0,0 +1,151 @@
+"""
+사주 해석 응답 캐시
+- 키: pillars·ten_gods·elements·birth_info를 정규화한 JSON의 SHA-256
+- 프로세스 메모리 LRU(TTL) → 공유 캐시(Django cache) → Claude API 순서로 조회
+- 같은 키로 동시에 들어온 요청은 진행 중인 API 호출 1건의 결과를 함께 기다림
+- 스트리밍(비동기) 뷰도 aclaim/ajoin/aresolve로 같은 진행 중 호출 목록을 공유 (동기·비동기 요청끼리도 합쳐짐)
+- 반환 값은 항상 복사본 (호출한 쪽이 수정해도 캐시된 해석은 그대로)
+"""
+import asyncio
+import copy
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+from django.conf import settings
+from django.core.cache import cache
+
+_MISSING = object()
+
+
+def canonical_key(pillars, birth_info, ten_gods=None, elements=None):
+    """입력 순서·공백과 무관한 캐시 키"""
+    payload = json.dumps(
+        {'pillars': pillars, 'birth_info': birth_info, 'ten_gods': ten_gods or None, 'elements': elements or None},
+        sort_keys=True, ensure_ascii=False, separators=(',', ':'), default=str,
+    )
+    return 'saju:' + hashlib.sha256(payload.encode()).hexdigest()
+
+
+class SajuResponseCache:
+    """TTL + LRU 메모리 캐시 + 동일 키 동시 요청 합치기"""
+
+    def __init__(self, maxsize=256, ttl=60 * 60 * 24, shared=True, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.shared = shared
+        self.clock = clock
+        self._entries = OrderedDict()  # 키 → (만료 시각, 값)
+        self._inflight = {}  # 키 → Future
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._get_local(key)
+        return None if value is _MISSING else copy.deepcopy(value)
+
+    def get_or_compute(self, key, compute):
+        """캐시 값 반환, 없으면 compute() 1회 실행 (동시 요청은 그 결과를 공유)"""
+        value, future, leader = self.claim(key)
+        if future is None:
+            return value
+        if not leader:
+            return copy.deepcopy(future.result())
+
+        try:
+            value = cache.get(key, _MISSING) if self.shared else _MISSING
+            if value is _MISSING:
+                value = compute()
+                if self.shared:
+                    cache.set(key, value, timeout=self.ttl)
+        except BaseException as e:
+            # 실패는 캐시하지 않고 기다리던 요청에도 같은 오류 전달
+            self.reject(key, future, e)
+            raise
+
+        self.resolve(key, future, value)
+        return copy.deepcopy(value)
+
+    def claim(self, key):
+        """
+        메모리 캐시 조회 + 진행 중 호출 등록
+        → (값, None, False): 적중
+        → (None, Future, False): 다른 요청이 호출 중 - Future 결과를 기다림
+        → (None, Future, True): 이 요청이 호출 담당 - 끝나면 반드시 resolve 또는 reject
+        """
+        with self._lock:
+            value = self._get_local(key)
+            if value is not _MISSING:
+                return copy.deepcopy(value), None, False
+            future = self._inflight.get(key)
+            if future is not None:
+                return None, future, False
+            future = self._inflight[key] = Future()
+            return None, future, True
+
+    def resolve(self, key, future, value):
+        with self._lock:
+            self._set_local(key, value)
+            self._inflight.pop(key, None)
+        future.set_result(value)
+
+    def reject(self, key, future, exc):
+        with self._lock:
+            self._inflight.pop(key, None)
+        future.set_exception(exc)
+
+    async def aclaim(self, key):
+        """비동기 뷰용 claim (호출 담당이면 공유 캐시까지 확인, API 호출 없음)"""
+        value, future, leader = self.claim(key)
+        if leader and self.shared:
+            try:
+                shared = await cache.aget(key, _MISSING)
+            except BaseException as e:
+                self.reject(key, future, e)
+                raise
+            if shared is not _MISSING:
+                self.resolve(key, future, shared)
+                return copy.deepcopy(shared), None, False
+        return value, future, leader
+
+    async def ajoin(self, future):
+        """다른 요청이 진행 중인 호출 결과 대기 (호출 실패 시 같은 오류)"""
+        return copy.deepcopy(await asyncio.wrap_future(future))
+
+    async def aresolve(self, key, future, value):
+        self.resolve(key, future, value)
+        if self.shared:
+            await cache.aset(key, value, timeout=self.ttl)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _get_local(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        expires_at, value = entry
+        if expires_at <= self.clock():
+            del self._entries[key]
+            return _MISSING
+        self._entries.move_to_end(key)
+        return value
+
+    def _set_local(self, key, value):
+        self._entries[key] = (self.clock() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+response_cache = SajuResponseCache(
+    maxsize=getattr(settings, 'SAJU_CACHE_SIZE', 256),
+    ttl=getattr(settings, 'SAJU_CACHE_TTL', 60 * 60 * 24),
+)
@@ -0,0 +1,218 @@
+import asyncio
+import json
+import threading
+from types import SimpleNamespace
+from unittest import mock
+
+from django.test import SimpleTestCase
+from django.urls import reverse
+
+from apps.saju.services import ai_interpreter
+from apps.saju.services.response_cache import SajuResponseCache, canonical_key
+from apps.saju.views import SajuInterpretStreamView
+
+PILLARS = {
+    'year': {'stem': '甲', 'branch': '子'},
+    'month': {'stem': '丙', 'branch': '寅'},
+    'day': {'stem': '戊', 'branch': '辰'},
+    'hour': {'stem': '庚', 'branch': '午'},
+}
+BIRTH_INFO = {'year': 1990, 'month': 1, 'day': 1, 'gender': 'M'}
+AI_RESULT = {'interpretation': {'summary': '요약', 'fortune': '재물운'}, 'lucky_message': '행운'}
+
+
+class FakeClient:
+    """anthropic.Anthropic 대역 - 호출 횟수를 세고, gate를 주면 열릴 때까지 응답을 지연"""
+
+    def __init__(self, result=AI_RESULT, gate=None):
+        self.result = result
+        self.gate = gate
+        self.calls = 0
+        self.entered = threading.Event()
+        self.messages = self
+
+    def create(self, **kwargs):
+        self.calls += 1
+        self.entered.set()
+        if self.gate is not None:
+            self.gate.wait(5)
+        return SimpleNamespace(content=[SimpleNamespace(text=json.dumps(self.result, ensure_ascii=False))])
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class SajuResponseCacheTests(SimpleTestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = SajuResponseCache(maxsize=2, ttl=60, shared=False, clock=self.clock)
+        self.patcher = mock.patch.object(ai_interpreter, 'response_cache', self.cache)
+        self.patcher.start()
+        self.addCleanup(self.patcher.stop)
+
+    def interpret(self, client, pillars=PILLARS):
+        return ai_interpreter.cached_interpret_saju(pillars, BIRTH_INFO, client=client)
+
+    def test_key_ignores_order(self):
+        reordered = dict(reversed(list(PILLARS.items())))
+        self.assertEqual(canonical_key(PILLARS, BIRTH_INFO), canonical_key(reordered, BIRTH_INFO))
+
+    def test_hit_skips_api(self):
+        client = FakeClient()
+        self.assertEqual(self.interpret(client), AI_RESULT)
+        self.assertEqual(self.interpret(client), AI_RESULT)
+        self.assertEqual(client.calls, 1)
+
+    def test_ttl_expiry(self):
+        client = FakeClient()
+        self.interpret(client)
+        self.clock.now = 59
+        self.interpret(client)
+        self.assertEqual(client.calls, 1)
+        self.clock.now = 60
+        self.interpret(client)
+        self.assertEqual(client.calls, 2)
+
+    def test_lru_eviction(self):
+        client = FakeClient()
+        other = {**PILLARS, 'hour': {'stem': '辛', 'branch': '未'}}
+        third = {**PILLARS, 'hour': {'stem': '壬', 'branch': '申'}}
+        self.interpret(client)
+        self.interpret(client, other)
+        self.interpret(client)  # PILLARS가 최근 사용으로 이동
+        self.interpret(client, third)  # 가장 오래된 other 제거
+        self.assertEqual(client.calls, 3)
+        self.assertEqual(len(self.cache), 2)
+
+        self.interpret(client)
+        self.assertEqual(client.calls, 3)
+        self.interpret(client, other)
+        self.assertEqual(client.calls, 4)
+
+    def test_returns_copies(self):
+        client = FakeClient()
+        first = self.interpret(client)
+        first['interpretation']['summary'] = '변경'
+        self.assertEqual(self.interpret(client), AI_RESULT)
+        key = canonical_key(PILLARS, BIRTH_INFO)
+        self.cache.get(key)['lucky_message'] = '변경'
+        self.assertEqual(self.cache.get(key), AI_RESULT)
+
+    def test_failure_is_not_cached(self):
+        client = FakeClient()
+        with mock.patch.object(client, 'create', side_effect=RuntimeError('boom')):
+            with self.assertRaises(RuntimeError):
+                self.interpret(client)
+        self.assertEqual(self.interpret(client), AI_RESULT)
+
+    def test_concurrent_misses_share_one_call(self):
+        gate = threading.Event()
+        client = FakeClient(gate=gate)
+        results = []
+
+        def worker():
+            results.append(self.interpret(client))
+
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        threads[0].start()
+        self.assertTrue(client.entered.wait(5))
+        for thread in threads[1:]:
+            thread.start()
+        gate.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(client.calls, 1)
+        self.assertEqual(results, [AI_RESULT] * 5)
+        # 기다린 요청끼리도 같은 객체를 공유하지 않음
+        self.assertEqual(len({id(r) for r in results}), 5)
+
+
+class SajuStreamCoalescingTests(SimpleTestCase):
+    def setUp(self):
+        self.cache = SajuResponseCache(shared=False)
+        for target in ('apps.saju.views.response_cache', 'apps.saju.services.ai_interpreter.response_cache'):
+            patcher = mock.patch(target, self.cache)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_concurrent_streams_share_one_call(self):
+        calls = []
+
+        async def fake_stream(**saju):
+            calls.append(saju)
+            await asyncio.sleep(0.05)
+            yield json.dumps(AI_RESULT, ensure_ascii=False)
+
+        async def collect():
+            events = SajuInterpretStreamView()._events
+            saju = {'pillars': PILLARS, 'birth_info': BIRTH_INFO, 'ten_gods': None, 'elements': None}
+            return await asyncio.gather(*[_drain(events(dict(saju))) for _ in range(3)])
+
+        with mock.patch('apps.saju.views.stream_interpret_saju', fake_stream):
+            streams = asyncio.run(collect())
+
+        self.assertEqual(len(calls), 1)
+        for events in streams:
+            result = json.loads(events[-1].split('data: ', 1)[1])
+            self.assertEqual(result['source'], 'ai')
+        # 진행 중 호출이 끝난 뒤에는 캐시 적중
+        client = FakeClient()
+        ai_interpreter.cached_interpret_saju(PILLARS, BIRTH_INFO, client=client)
+        self.assertEqual(client.calls, 0)
+
+    def test_leader_failure_falls_back_for_waiters(self):
+        async def failing_stream(**saju):
+            await asyncio.sleep(0.05)
+            raise RuntimeError('boom')
+            yield
+
+        async def collect():
+            events = SajuInterpretStreamView()._events
+            saju = {'pillars': PILLARS, 'birth_info': BIRTH_INFO, 'ten_gods': None, 'elements': None}
+            return await asyncio.gather(*[_drain(events(dict(saju))) for _ in range(2)])
+
+        with mock.patch('apps.saju.views.stream_interpret_saju', failing_stream), \
+                self.assertLogs('apps.saju.views', 'INFO'):
+            streams = asyncio.run(collect())
+
+        for events in streams:
+            result = json.loads(events[-1].split('data: ', 1)[1])
+            self.assertEqual(result['source'], 'local')
+        self.assertEqual(self.cache._inflight, {})
+
+
+class SajuRequestValidationTests(SimpleTestCase):
+    BAD_BODIES = [
+        [1, 2],
+        {'pillars': {'day': '戊辰'}, 'birth_info': BIRTH_INFO},
+        {'pillars': {'day': ['戊', '辰']}, 'birth_info': BIRTH_INFO},
+        {'pillars': {'day': {'stem': 5}}, 'birth_info': BIRTH_INFO},
+        {'pillars': ['year', 'day'], 'birth_info': BIRTH_INFO},
+        {'pillars': PILLARS, 'birth_info': '1990-01-01'},
+        {'pillars': PILLARS, 'birth_info': BIRTH_INFO, 'elements': [['목', 2]]},
+        {'pillars': PILLARS, 'birth_info': BIRTH_INFO, 'elements': {'목': 'many'}},
+        {'pillars': PILLARS, 'birth_info': BIRTH_INFO, 'elements': {'목': True}},
+        {'pillars': PILLARS, 'birth_info': BIRTH_INFO, 'ten_gods': ['정재']},
+    ]
+
+    def test_wrong_shapes_are_rejected(self):
+        for name in ('saju:interpret', 'saju:interpret_stream'):
+            for body in self.BAD_BODIES:
+                with self.subTest(view=name, body=body):
+                    response = self.client.post(reverse(name), json.dumps(body), content_type='application/json')
+                    self.assertEqual(response.status_code, 400)
+                    self.assertIn('error', response.json())
+
+    def test_invalid_utf8_is_rejected(self):
+        response = self.client.post(reverse('saju:interpret'), b'\xff\xfe', content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+
+
+async def _drain(generator):
+    return [event async for event in generator]
@@ -6,4 +6,5 @@ app_name = 'saju'
 urlpatterns = [
     path('', views.SajuPageView.as_view(), name='index'),
     path('api/interpret/', views.SajuInterpretAPIView.as_view(), name='interpret'),
+    path('api/interpret/stream/', views.SajuInterpretStreamView.as_view(), name='interpret_stream'),
 ]
@@ -1,11 +1,15 @@
 import json
 import logging
 
-from django.http import JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
 from django.views import View
 from django.views.generic import TemplateView
 
-from .services.ai_interpreter import interpret_saju
+from .services.ai_interpreter import (
+    LLMBusyError, interpret_with_fallback, llm_slot, merge_interpretation, parse_response, stream_interpret_saju,
+)
+from .services.number_engine import local_interpretation
+from .services.response_cache import canonical_key, response_cache
 
 logger = logging.getLogger(__name__)
 
@@ -14,29 +18,132 @@ class SajuPageView(TemplateView):
     template_name = 'saju/index.html'
 
 
+def _parse_saju_request(body):
+    """요청 본문 → (interpret_saju 인자 dict, None) 또는 (None, 오류 응답)"""
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return None, JsonResponse({'error': '잘못된 요청입니다.'}, status=400)
+    if not isinstance(data, dict):
+        return None, JsonResponse({'error': '잘못된 요청입니다.'}, status=400)
+
+    saju = {
+        'pillars': data.get('pillars'),
+        'birth_info': data.get('birth_info'),
+        'ten_gods': data.get('ten_gods'),
+        'elements': data.get('elements'),
+    }
+    if not saju['pillars'] or not saju['birth_info']:
+        return None, JsonResponse({'error': '사주 정보가 필요합니다.'}, status=400)
+    problem = _saju_shape_error(saju)
+    if problem:
+        return None, JsonResponse({'error': problem}, status=400)
+    return saju, None
+
+
+def _saju_shape_error(saju):
+    """로컬 엔진·프롬프트가 가정하는 형태인지 확인 → 오류 메시지 (정상이면 None)"""
+    pillars = saju['pillars']
+    if not isinstance(pillars, dict) or not isinstance(saju['birth_info'], dict):
+        return 'pillars·birth_info는 객체여야 합니다.'
+    for pillar in pillars.values():
+        if not isinstance(pillar, dict) or not all(
+            isinstance(pillar.get(part, ''), str) for part in ('stem', 'branch')
+        ):
+            return 'pillars 각 주는 stem·branch 문자열을 가진 객체여야 합니다.'
+    ten_gods = saju['ten_gods']
+    if ten_gods is not None and (
+        not isinstance(ten_gods, dict) or not all(isinstance(g, str) for g in ten_gods.values())
+    ):
+        return 'ten_gods는 문자열 값을 가진 객체여야 합니다.'
+    elements = saju['elements']
+    if elements is not None and (
+        not isinstance(elements, dict) or not all(
+            n is None or (isinstance(n, int) and not isinstance(n, bool) and n >= 0) for n in elements.values()
+        )
+    ):
+        return 'elements는 0 이상 정수 값을 가진 객체여야 합니다.'
+    return None
+
+
 class SajuInterpretAPIView(View):
     def post(self, request):
-        try:
-            data = json.loads(request.body)
-        except json.JSONDecodeError:
-            return JsonResponse({'error': '잘못된 요청입니다.'}, status=400)
+        saju, error = _parse_saju_request(request.body)
+        if error:
+            return error
+
+        # API 오류·과부하 시에도 로컬 해석으로 200 응답
+        return JsonResponse(interpret_with_fallback(**saju))
 
-        pillars = data.get('pillars')
-        birth_info = data.get('birth_info')
-        ten_gods = data.get('ten_gods')
-        elements = data.get('elements')
 
-        if not pillars or not birth_info:
-            return JsonResponse({'error': '사주 정보가 필요합니다.'}, status=400)
+def _sse(event, data):
+    return f'event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n'
 
+
+class SajuInterpretStreamView(View):
+    """
+    사주 해석 SSE 스트리밍 API (비동기 뷰 - ASGI 워커에서는 LLM 대기 중 요청 스레드를 점유하지 않음)
+    event: local  {로컬 규칙 기반 해석 - 즉시 표시}
+    event: delta  {"text": 응답 조각}
+    event: result {최종 해석 (AI 실패·과부하 시 로컬 해석)}
+    같은 입력의 호출이 이미 진행 중이면(동기 API 포함) delta 없이 그 결과만 result로 전달
+    """
+    async def post(self, request):
+        saju, error = _parse_saju_request(request.body)
+        if error:
+            return error
+
+        response = StreamingHttpResponse(self._events(saju), content_type='text/event-stream')
+        response['Cache-Control'] = 'no-cache'
+        # 프록시(nginx 등) 버퍼링 해제
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+    async def _events(self, saju):
+        local = local_interpretation(**saju)
+        key = canonical_key(**saju)
+        cached, future, leader = await response_cache.aclaim(key)
+        if future is None:
+            yield _sse('result', merge_interpretation(local, cached))
+            return
+
+        if not leader:
+            yield _sse('local', local)
+            # 같은 입력의 호출이 이미 진행 중 - 조각 없이 그 결과만 받아 API 호출 1건으로 합침
+            try:
+                result = await response_cache.ajoin(future)
+            except LLMBusyError as e:
+                logger.info('%s', e)
+                result = None
+            except Exception:
+                logger.info('진행 중이던 사주 해석 호출 실패 - 로컬 해석으로 대체')
+                result = None
+            yield _sse('result', local if result is None else merge_interpretation(local, result))
+            return
+
+        # 호출 담당 - 이후 어떤 경로로 끝나도 resolve/reject 해야 기다리는 요청이 풀림
+        chunks = []
         try:
-            result = interpret_saju(
-                pillars=pillars,
-                birth_info=birth_info,
-                ten_gods=ten_gods,
-                elements=elements,
-            )
-            return JsonResponse(result)
+            yield _sse('local', local)
+            with llm_slot():
+                async for text in stream_interpret_saju(**saju):
+                    chunks.append(text)
+                    yield _sse('delta', {'text': text})
+            result = parse_response(''.join(chunks))
+        except LLMBusyError as e:
+            logger.info('%s', e)
+            response_cache.reject(key, future, e)
+            yield _sse('result', local)
+            return
         except Exception as e:
-            logger.exception('사주 해석 API 오류')
-            return JsonResponse({'error': '해석 중 오류가 발생했습니다.'}, status=500)
+            logger.exception('사주 해석 스트리밍 오류 - 로컬 해석으로 대체')
+            response_cache.reject(key, future, e)
+            yield _sse('result', local)
+            return
+        except BaseException:
+            # 클라이언트 연결 종료(GeneratorExit)·취소 - 기다리던 요청은 로컬 해석으로 대체되도록 알림
+            response_cache.reject(key, future, RuntimeError('사주 해석 스트리밍이 중단되었습니다.'))
+            raise
+
+        await response_cache.aresolve(key, future, result)
+        yield _sse('result', merge_interpretation(local, result))
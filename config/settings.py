@@ -82,6 +82,89 @@ TIME_ZONE = 'Asia/Seoul'
 USE_I18N = True
 USE_TZ = True
 
+# 캐시: REDIS_URL이 있으면 Redis, 없으면 CACHE_BACKEND(file/locmem)
+# 기본값 file은 gunicorn 워커·관리 커맨드 간에 캐시 버전을 공유
+# state: 회차 버전·대기 중 조회수 등 지워지면 안 되는 키 전용 (일반 캐시의 MAX_ENTRIES 정리 대상에서 분리)
+#        Redis 사용 시 maxmemory-policy noeviction(또는 volatile-*) 권장
+REDIS_URL = os.environ.get('REDIS_URL')
+CACHE_BACKEND = os.environ.get('CACHE_BACKEND', 'file')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        },
+        'state': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            'KEY_PREFIX': 'state',
+        },
+    }
+elif CACHE_BACKEND == 'locmem':
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'l7x7',
+        },
+        'state': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'l7x7-state',
+            'OPTIONS': {'MAX_ENTRIES': 1_000_000},
+        },
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': os.environ.get('CACHE_DIR', str(BASE_DIR / '.django_cache')),
+            'OPTIONS': {'MAX_ENTRIES': 2000},
+        },
+        'state': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': os.environ.get('STATE_CACHE_DIR', str(BASE_DIR / '.django_state')),
+            'OPTIONS': {'MAX_ENTRIES': 1_000_000},
+        },
+    }
+
+# view_dedup: 게시글 반복 조회 판정 키 전용 (세션 × 게시글 수만큼 쌓이므로 다른 캐시와 분리해 크기 제한)
+# Redis가 없으면 워커별 메모리 캐시 - 워커가 다르거나 정리된 키는 조회 1회가 더 세어질 뿐
+if REDIS_URL:
+    CACHES['view_dedup'] = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': REDIS_URL,
+        'KEY_PREFIX': 'dedup',
+    }
+else:
+    CACHES['view_dedup'] = {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'l7x7-view-dedup',
+        'OPTIONS': {'MAX_ENTRIES': 10000},
+    }
+
+# pages: 비로그인 전체 페이지 캐시(AnonymousPageCacheMixin) 전용 (default 캐시의 통계·조각 캐시 항목이 밀려나지 않도록)
+if REDIS_URL:
+    CACHES['pages'] = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': REDIS_URL,
+        'KEY_PREFIX': 'pages',
+    }
+elif CACHE_BACKEND == 'locmem':
+    CACHES['pages'] = {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'l7x7-pages',
+        'OPTIONS': {'MAX_ENTRIES': 5000},
+    }
+else:
+    CACHES['pages'] = {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.environ.get('PAGE_CACHE_DIR', str(BASE_DIR / '.django_pages')),
+        'OPTIONS': {'MAX_ENTRIES': 5000},
+    }
+
+# 페이지 캐시 키에 넣는 배포 버전 - 배포(템플릿 변경)마다 이전 렌더링 결과를 쓰지 않도록
+PAGE_CACHE_VERSION = os.environ.get('PAGE_CACHE_VERSION') or os.environ.get('RENDER_GIT_COMMIT', '')[:12]
+
 STATIC_URL = '/static/'
 STATICFILES_DIRS = [BASE_DIR / 'static']
 STATIC_ROOT = BASE_DIR / 'staticfiles'
@@ -97,3 +180,19 @@ STORAGES = {
 LOGIN_URL = '/accounts/login/'
 LOGIN_REDIRECT_URL = '/'
 LOGOUT_REDIRECT_URL = '/'
+
+# 통계 계산 백엔드: auto(numpy 설치 시 사용) / numpy / python
+LOTTO_STATS_BACKEND = os.environ.get('LOTTO_STATS_BACKEND', 'auto')
+
+# 동행복권 당첨번호 API (로컬 스텁 서버로 교체 가능)
+LOTTO_API_URL = os.environ.get('LOTTO_API_URL', 'https://www.dhlottery.co.kr/common.do')
+LOTTO_FETCH_CONCURRENCY = int(os.environ.get('LOTTO_FETCH_CONCURRENCY', '8'))
+
+# 사주 해석 응답 캐시 (프로세스 메모리 LRU 크기, 공유 캐시 포함 TTL 초)
+SAJU_CACHE_SIZE = int(os.environ.get('SAJU_CACHE_SIZE', '256'))
+SAJU_CACHE_TTL = int(os.environ.get('SAJU_CACHE_TTL', str(60 * 60 * 24)))
+# 프로세스당 동시 AI 해석 호출 수 (초과 요청은 로컬 규칙 기반 해석으로 즉시 응답)
+SAJU_MAX_CONCURRENT_LLM = int(os.environ.get('SAJU_MAX_CONCURRENT_LLM', '4'))
+
+# 게시글 조회수 버퍼 (같은 세션 중복 조회 무시 시간 초 - 0이면 끔, DB 반영은 flush_post_views 커맨드)
+POST_VIEW_DEDUP_SECONDS = int(os.environ.get('POST_VIEW_DEDUP_SECONDS', str(30 * 60)))